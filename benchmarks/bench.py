@@ -0,0 +1,254 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+
+Time signature, delta and patch over synthetic corpora, per backend, magic and buffer size.
+
+    python benchmarks/bench.py --sizes 64K,16M,1G --output results.json
+
+Every backend runs in its own interpreter, since the backend is chosen at import.
+The results are one JSON document: the machine and the run in "meta", a record per
+measurement in "results".
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import SHAPES, make_corpus, parse_size
+
+BACKENDS = ("cython", "cffi")
+MAGICS = ("md4", "blake2", "rk-md4", "rk-blake2")
+OPS = ("signature", "delta", "patch")
+
+
+def _magic(name: str) -> int:
+    import pyrsync
+
+    return getattr(pyrsync, "RS_%s_SIG_MAGIC" % name.upper().replace("-", "_"))
+
+
+def _time(func, repeat: int):
+    """
+    Run func repeat times.
+    :return: the wall times and the result of the last run
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        started = perf_counter()
+        result = func()
+        times.append(perf_counter() - started)
+    return times, result
+
+
+def run_backend(args) -> list:
+    """
+    Measure every combination with the backend of this interpreter.
+    """
+    from pyrsync import delta, get_signature_args, patch, signature
+
+    results = []
+    tmp = tempfile.mkdtemp(prefix="pyrsync-bench-")
+    sig_path = os.path.join(tmp, "sig")
+    delta_path = os.path.join(tmp, "delta")
+    out_path = os.path.join(tmp, "out")
+    try:
+        for size in args.sizes:
+            for shape in args.shapes:
+                basis, new = make_corpus(args.workdir, shape, size, args.seed)
+                for magic_name in args.magics:
+                    magic, block_len, strong_len = get_signature_args(size, _magic(magic_name))
+                    for buffer_size in args.buffer_sizes:
+
+                        def do_signature():
+                            with open(basis, "rb") as i, open(sig_path, "wb") as o:
+                                return signature(i, o, strong_len, magic, block_len, buffer_size)
+
+                        def do_delta():
+                            with open(new, "rb") as i, open(sig_path, "rb") as s, open(
+                                delta_path, "wb"
+                            ) as o:
+                                return delta(i, s, o, buffer_size)
+
+                        def do_patch():
+                            with open(basis, "rb") as b, open(delta_path, "rb") as d, open(
+                                out_path, "wb"
+                            ) as o:
+                                return patch(b, d, o, buffer_size)
+
+                        for op, func, in_size in (
+                            ("signature", do_signature, size),
+                            ("delta", do_delta, os.path.getsize(new)),
+                            ("patch", do_patch, os.path.getsize(new)),
+                        ):
+                            times, stats = _time(func, args.repeat)
+                            best = min(times)
+                            results.append(
+                                {
+                                    "backend": args.backend,
+                                    "op": op,
+                                    "shape": shape,
+                                    "size": size,
+                                    "magic": magic_name,
+                                    "block_len": block_len,
+                                    "strong_len": strong_len,
+                                    "buffer_size": buffer_size,
+                                    "repeat": args.repeat,
+                                    "best": best,
+                                    "median": statistics.median(times),
+                                    "throughput": in_size / best if best > 0 else 0.0,
+                                    "sig_size": os.path.getsize(sig_path),
+                                    "delta_size": os.path.getsize(delta_path)
+                                    if op != "signature"
+                                    else None,
+                                    "stats": stats.as_dict(),
+                                }
+                            )
+                        if args.verify:
+                            with open(new, "rb") as a, open(out_path, "rb") as b:
+                                if a.read() != b.read():
+                                    raise AssertionError(
+                                        "patched %s differs from the original" % new
+                                    )
+    finally:
+        for path in (sig_path, delta_path, out_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(tmp)
+    return results
+
+
+def _meta(args) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    import pyrsync
+
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit or None,
+        "version": pyrsync.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+    }
+
+
+def _csv(text: str) -> list:
+    return [item for item in text.split(",") if item]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--backend", choices=BACKENDS + ("all",), default="all")
+    parser.add_argument(
+        "--sizes", type=lambda t: [parse_size(s) for s in _csv(t)], default="64K,1M,16M"
+    )
+    parser.add_argument(
+        "--shapes", type=_csv, default=",".join(SHAPES), help=", ".join(SHAPES)
+    )
+    parser.add_argument(
+        "--magics", type=_csv, default=",".join(MAGICS), help=", ".join(MAGICS)
+    )
+    parser.add_argument(
+        "--buffer-sizes",
+        type=lambda t: [parse_size(s) for s in _csv(t)],
+        default="64K",
+        help="I/O buffer sizes of the calls",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workdir", default=None, help="where corpora are kept between runs"
+    )
+    parser.add_argument("--output", default=None, help="a JSON file, stdout if omitted")
+    parser.add_argument(
+        "--verify", action="store_true", help="check that every patch gives the new file back"
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    for name in args.shapes:
+        if name not in SHAPES:
+            parser.error("unknown shape %r" % name)
+    for name in args.magics:
+        if name not in MAGICS:
+            parser.error("unknown magic %r" % name)
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.worker:
+        json.dump(run_backend(args), sys.stdout)
+        return 0
+
+    keep = args.workdir is not None
+    if not keep:
+        args.workdir = tempfile.mkdtemp(prefix="pyrsync-corpus-")
+    os.makedirs(args.workdir, exist_ok=True)
+    results = []
+    errors = {}
+    try:
+        for backend in BACKENDS if args.backend == "all" else (args.backend,):
+            env = dict(os.environ)
+            env.pop("RSYNC_USE_CFFI", None)
+            if backend == "cffi":
+                env["RSYNC_USE_CFFI"] = "1"
+            command = [sys.executable, os.path.abspath(__file__), "--worker"]
+            command += ["--backend", backend, "--workdir", args.workdir]
+            command += ["--sizes", ",".join(map(str, args.sizes))]
+            command += ["--shapes", ",".join(args.shapes)]
+            command += ["--magics", ",".join(args.magics)]
+            command += ["--buffer-sizes", ",".join(map(str, args.buffer_sizes))]
+            command += ["--repeat", str(args.repeat), "--seed", str(args.seed)]
+            if args.verify:
+                command.append("--verify")
+            proc = subprocess.run(
+                command,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+            )
+            if proc.returncode:
+                errors[backend] = proc.stderr.strip().splitlines()[-1:]
+                print("%s failed:\n%s" % (backend, proc.stderr), file=sys.stderr)
+                continue
+            results.extend(json.loads(proc.stdout))
+    finally:
+        if not keep:
+            for name in os.listdir(args.workdir):
+                os.remove(os.path.join(args.workdir, name))
+            os.rmdir(args.workdir)
+
+    document = {"meta": _meta(args), "errors": errors, "results": results}
+    if args.output is None:
+        json.dump(document, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=1)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import os
+import random
+
+__all__ = ["SHAPES", "parse_size", "make_corpus"]
+
+CHUNK = 1024 * 1024  # corpora are written in pieces of this size, whatever their size
+EDIT_SPACING = 64 * 1024  # average distance between two edits of "insert" and "sparse"
+SHUFFLE_BLOCK = 64 * 1024
+
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(text: str) -> int:
+    """
+    "4096", "64K", "16M" or "1G" to a number of bytes.
+    """
+    text = text.strip().upper().rstrip("B")
+    unit = text[-1:] if text[-1:] in _UNITS else ""
+    return int(text[: len(text) - len(unit)]) * _UNITS[unit]
+
+
+def _random_bytes(rng: random.Random, size: int) -> bytes:
+    return rng.getrandbits(size * 8).to_bytes(size, "little") if size else b""
+
+
+def _write_random(f, rng: random.Random, size: int) -> None:
+    while size > 0:
+        n = min(size, CHUNK)
+        f.write(_random_bytes(rng, n))
+        size -= n
+
+
+def _copy(src, dst, size: int) -> None:
+    while size > 0:
+        data = src.read(min(size, CHUNK))
+        if not data:
+            return
+        dst.write(data)
+        size -= len(data)
+
+
+def _edit(basis: str, new: str, edits) -> None:
+    """
+    Write new as basis with edits applied, edits being sorted (offset, removed, inserted) triples.
+    """
+    with open(basis, "rb") as src, open(new, "wb") as dst:
+        pos = 0
+        for offset, removed, inserted in edits:
+            _copy(src, dst, offset - pos)
+            src.seek(removed, os.SEEK_CUR)
+            dst.write(inserted)
+            pos = offset + removed
+        _copy(src, dst, os.path.getsize(basis) - pos)
+
+
+def _random(basis: str, new: str, size: int, rng: random.Random) -> None:
+    # nothing in common, the delta is all literals
+    with open(new, "wb") as f:
+        _write_random(f, rng, size)
+
+
+def _append(basis: str, new: str, size: int, rng: random.Random) -> None:
+    # a log file: the old data and 10% more
+    with open(basis, "rb") as src, open(new, "wb") as dst:
+        _copy(src, dst, size)
+        _write_random(dst, rng, max(size // 10, 1))
+
+
+def _insert(basis: str, new: str, size: int, rng: random.Random) -> None:
+    # short insertions that shift everything after them
+    count = max(size // EDIT_SPACING, 1)
+    offsets = sorted(rng.randrange(size + 1) for _ in range(count))
+    _edit(basis, new, [(o, 0, _random_bytes(rng, rng.randint(1, 64))) for o in offsets])
+
+
+def _shuffle(basis: str, new: str, size: int, rng: random.Random) -> None:
+    # the same blocks in another order, e.g. a reorganized archive
+    block = min(SHUFFLE_BLOCK, max(size // 16, 1))
+    order = list(range(0, size, block))
+    rng.shuffle(order)
+    with open(basis, "rb") as src, open(new, "wb") as dst:
+        for offset in order:
+            src.seek(offset)
+            dst.write(src.read(block))
+
+
+def _sparse(basis: str, new: str, size: int, rng: random.Random) -> None:
+    # a few bytes overwritten in place, the length does not change
+    count = max(size // EDIT_SPACING, 1)
+    offsets = sorted(set(rng.randrange(size) for _ in range(count))) if size else []
+    edits = []
+    end = 0
+    for offset in offsets:
+        if offset < end:
+            continue
+        length = min(rng.randint(1, 8), size - offset)
+        edits.append((offset, length, _random_bytes(rng, length)))
+        end = offset + length
+    _edit(basis, new, edits)
+
+
+SHAPES = {
+    "random": _random,
+    "append": _append,
+    "insert": _insert,
+    "shuffle": _shuffle,
+    "sparse": _sparse,
+}
+
+
+def make_corpus(directory: str, shape: str, size: int, seed: int = 0):
+    """
+    Generate, or reuse from an earlier run, the basis and new file of a corpus.
+    The same shape, size and seed always give the same bytes.
+    :return: the paths of the basis and of the new file
+    """
+    basis = os.path.join(directory, "basis-%d-%d" % (size, seed))
+    new = os.path.join(directory, "%s-%d-%d" % (shape, size, seed))
+    if not os.path.exists(basis):
+        with open(basis + ".tmp", "wb") as f:
+            _write_random(f, random.Random(seed), size)
+        os.replace(basis + ".tmp", basis)
+    if not os.path.exists(new):
+        SHAPES[shape](basis, new + ".tmp", size, random.Random("%s-%d" % (shape, seed)))
+        os.replace(new + ".tmp", new)
+    return basis, new
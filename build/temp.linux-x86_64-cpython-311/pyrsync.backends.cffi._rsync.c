@@ -0,0 +1,3914 @@
+#define _CFFI_
+
+/* We try to define Py_LIMITED_API before including Python.h.
+
+   Mess: we can only define it if Py_DEBUG, Py_TRACE_REFS and
+   Py_REF_DEBUG are not defined.  This is a best-effort approximation:
+   we can learn about Py_DEBUG from pyconfig.h, but it is unclear if
+   the same works for the other two macros.  Py_DEBUG implies them,
+   but not the other way around.
+
+   The implementation is messy (issue #350): on Windows, with _MSC_VER,
+   we have to define Py_LIMITED_API even before including pyconfig.h.
+   In that case, we guess what pyconfig.h will do to the macros above,
+   and check our guess after the #include.
+
+   Note that on Windows, with CPython 3.x, you need >= 3.5 and virtualenv
+   version >= 16.0.0.  With older versions of either, you don't get a
+   copy of PYTHON3.DLL in the virtualenv.  We can't check the version of
+   CPython *before* we even include pyconfig.h.  ffi.set_source() puts
+   a ``#define _CFFI_NO_LIMITED_API'' at the start of this file if it is
+   running on Windows < 3.5, as an attempt at fixing it, but that's
+   arguably wrong because it may not be the target version of Python.
+   Still better than nothing I guess.  As another workaround, you can
+   remove the definition of Py_LIMITED_API here.
+
+   See also 'py_limited_api' in cffi/setuptools_ext.py.
+*/
+#if !defined(_CFFI_USE_EMBEDDING) && !defined(Py_LIMITED_API)
+#  ifdef _MSC_VER
+#    if !defined(_DEBUG) && !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
+
+#    include <pyconfig.h>
+     /* sanity-check: Py_LIMITED_API will cause crashes if any of these
+        are also defined.  Normally, the Python file PC/pyconfig.h does not
+        cause any of these to be defined, with the exception that _DEBUG
+        causes Py_DEBUG.  Double-check that. */
+#    ifdef Py_LIMITED_API
+#      if defined(Py_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_TRACE_REFS)
+#        error "pyconfig.h unexpectedly defines Py_TRACE_REFS, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_REF_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_REF_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#    endif
+#  else
+#    include <pyconfig.h>
+#    if !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
+#  endif
+#endif
+
+#include <Python.h>
+#ifdef __cplusplus
+extern "C" {
+#endif
+#include <stddef.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+/* This part is from file 'cffi/parse_c_type.h'.  It is copied at the
+   beginning of C sources generated by CFFI's ffi.set_source(). */
+
+typedef void *_cffi_opcode_t;
+
+#define _CFFI_OP(opcode, arg)   (_cffi_opcode_t)(opcode | (((uintptr_t)(arg)) << 8))
+#define _CFFI_GETOP(cffi_opcode)    ((unsigned char)(uintptr_t)cffi_opcode)
+#define _CFFI_GETARG(cffi_opcode)   (((intptr_t)cffi_opcode) >> 8)
+
+#define _CFFI_OP_PRIMITIVE       1
+#define _CFFI_OP_POINTER         3
+#define _CFFI_OP_ARRAY           5
+#define _CFFI_OP_OPEN_ARRAY      7
+#define _CFFI_OP_STRUCT_UNION    9
+#define _CFFI_OP_ENUM           11
+#define _CFFI_OP_FUNCTION       13
+#define _CFFI_OP_FUNCTION_END   15
+#define _CFFI_OP_NOOP           17
+#define _CFFI_OP_BITFIELD       19
+#define _CFFI_OP_TYPENAME       21
+#define _CFFI_OP_CPYTHON_BLTN_V 23   // varargs
+#define _CFFI_OP_CPYTHON_BLTN_N 25   // noargs
+#define _CFFI_OP_CPYTHON_BLTN_O 27   // O  (i.e. a single arg)
+#define _CFFI_OP_CONSTANT       29
+#define _CFFI_OP_CONSTANT_INT   31
+#define _CFFI_OP_GLOBAL_VAR     33
+#define _CFFI_OP_DLOPEN_FUNC    35
+#define _CFFI_OP_DLOPEN_CONST   37
+#define _CFFI_OP_GLOBAL_VAR_F   39
+#define _CFFI_OP_EXTERN_PYTHON  41
+
+#define _CFFI_PRIM_VOID          0
+#define _CFFI_PRIM_BOOL          1
+#define _CFFI_PRIM_CHAR          2
+#define _CFFI_PRIM_SCHAR         3
+#define _CFFI_PRIM_UCHAR         4
+#define _CFFI_PRIM_SHORT         5
+#define _CFFI_PRIM_USHORT        6
+#define _CFFI_PRIM_INT           7
+#define _CFFI_PRIM_UINT          8
+#define _CFFI_PRIM_LONG          9
+#define _CFFI_PRIM_ULONG        10
+#define _CFFI_PRIM_LONGLONG     11
+#define _CFFI_PRIM_ULONGLONG    12
+#define _CFFI_PRIM_FLOAT        13
+#define _CFFI_PRIM_DOUBLE       14
+#define _CFFI_PRIM_LONGDOUBLE   15
+
+#define _CFFI_PRIM_WCHAR        16
+#define _CFFI_PRIM_INT8         17
+#define _CFFI_PRIM_UINT8        18
+#define _CFFI_PRIM_INT16        19
+#define _CFFI_PRIM_UINT16       20
+#define _CFFI_PRIM_INT32        21
+#define _CFFI_PRIM_UINT32       22
+#define _CFFI_PRIM_INT64        23
+#define _CFFI_PRIM_UINT64       24
+#define _CFFI_PRIM_INTPTR       25
+#define _CFFI_PRIM_UINTPTR      26
+#define _CFFI_PRIM_PTRDIFF      27
+#define _CFFI_PRIM_SIZE         28
+#define _CFFI_PRIM_SSIZE        29
+#define _CFFI_PRIM_INT_LEAST8   30
+#define _CFFI_PRIM_UINT_LEAST8  31
+#define _CFFI_PRIM_INT_LEAST16  32
+#define _CFFI_PRIM_UINT_LEAST16 33
+#define _CFFI_PRIM_INT_LEAST32  34
+#define _CFFI_PRIM_UINT_LEAST32 35
+#define _CFFI_PRIM_INT_LEAST64  36
+#define _CFFI_PRIM_UINT_LEAST64 37
+#define _CFFI_PRIM_INT_FAST8    38
+#define _CFFI_PRIM_UINT_FAST8   39
+#define _CFFI_PRIM_INT_FAST16   40
+#define _CFFI_PRIM_UINT_FAST16  41
+#define _CFFI_PRIM_INT_FAST32   42
+#define _CFFI_PRIM_UINT_FAST32  43
+#define _CFFI_PRIM_INT_FAST64   44
+#define _CFFI_PRIM_UINT_FAST64  45
+#define _CFFI_PRIM_INTMAX       46
+#define _CFFI_PRIM_UINTMAX      47
+#define _CFFI_PRIM_FLOATCOMPLEX 48
+#define _CFFI_PRIM_DOUBLECOMPLEX 49
+#define _CFFI_PRIM_CHAR16       50
+#define _CFFI_PRIM_CHAR32       51
+
+#define _CFFI__NUM_PRIM         52
+#define _CFFI__UNKNOWN_PRIM           (-1)
+#define _CFFI__UNKNOWN_FLOAT_PRIM     (-2)
+#define _CFFI__UNKNOWN_LONG_DOUBLE    (-3)
+
+#define _CFFI__IO_FILE_STRUCT         (-1)
+
+
+struct _cffi_global_s {
+    const char *name;
+    void *address;
+    _cffi_opcode_t type_op;
+    void *size_or_direct_fn;  // OP_GLOBAL_VAR: size, or 0 if unknown
+                              // OP_CPYTHON_BLTN_*: addr of direct function
+};
+
+struct _cffi_getconst_s {
+    unsigned long long value;
+    const struct _cffi_type_context_s *ctx;
+    int gindex;
+};
+
+struct _cffi_struct_union_s {
+    const char *name;
+    int type_index;          // -> _cffi_types, on a OP_STRUCT_UNION
+    int flags;               // _CFFI_F_* flags below
+    size_t size;
+    int alignment;
+    int first_field_index;   // -> _cffi_fields array
+    int num_fields;
+};
+#define _CFFI_F_UNION         0x01   // is a union, not a struct
+#define _CFFI_F_CHECK_FIELDS  0x02   // complain if fields are not in the
+                                     // "standard layout" or if some are missing
+#define _CFFI_F_PACKED        0x04   // for CHECK_FIELDS, assume a packed struct
+#define _CFFI_F_EXTERNAL      0x08   // in some other ffi.include()
+#define _CFFI_F_OPAQUE        0x10   // opaque
+
+struct _cffi_field_s {
+    const char *name;
+    size_t field_offset;
+    size_t field_size;
+    _cffi_opcode_t field_type_op;
+};
+
+struct _cffi_enum_s {
+    const char *name;
+    int type_index;          // -> _cffi_types, on a OP_ENUM
+    int type_prim;           // _CFFI_PRIM_xxx
+    const char *enumerators; // comma-delimited string
+};
+
+struct _cffi_typename_s {
+    const char *name;
+    int type_index;   /* if opaque, points to a possibly artificial
+                         OP_STRUCT which is itself opaque */
+};
+
+struct _cffi_type_context_s {
+    _cffi_opcode_t *types;
+    const struct _cffi_global_s *globals;
+    const struct _cffi_field_s *fields;
+    const struct _cffi_struct_union_s *struct_unions;
+    const struct _cffi_enum_s *enums;
+    const struct _cffi_typename_s *typenames;
+    int num_globals;
+    int num_struct_unions;
+    int num_enums;
+    int num_typenames;
+    const char *const *includes;
+    int num_types;
+    int flags;      /* future extension */
+};
+
+struct _cffi_parse_info_s {
+    const struct _cffi_type_context_s *ctx;
+    _cffi_opcode_t *output;
+    unsigned int output_size;
+    size_t error_location;
+    const char *error_message;
+};
+
+struct _cffi_externpy_s {
+    const char *name;
+    size_t size_of_result;
+    void *reserved1, *reserved2;
+};
+
+#ifdef _CFFI_INTERNAL
+static int parse_c_type(struct _cffi_parse_info_s *info, const char *input);
+static int search_in_globals(const struct _cffi_type_context_s *ctx,
+                             const char *search, size_t search_len);
+static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
+                                   const char *search, size_t search_len);
+#endif
+
+/* this block of #ifs should be kept exactly identical between
+   c/_cffi_backend.c, cffi/vengine_cpy.py, cffi/vengine_gen.py
+   and cffi/_cffi_include.h */
+#if defined(_MSC_VER)
+# include <malloc.h>   /* for alloca() */
+# if _MSC_VER < 1600   /* MSVC < 2010 */
+   typedef __int8 int8_t;
+   typedef __int16 int16_t;
+   typedef __int32 int32_t;
+   typedef __int64 int64_t;
+   typedef unsigned __int8 uint8_t;
+   typedef unsigned __int16 uint16_t;
+   typedef unsigned __int32 uint32_t;
+   typedef unsigned __int64 uint64_t;
+   typedef __int8 int_least8_t;
+   typedef __int16 int_least16_t;
+   typedef __int32 int_least32_t;
+   typedef __int64 int_least64_t;
+   typedef unsigned __int8 uint_least8_t;
+   typedef unsigned __int16 uint_least16_t;
+   typedef unsigned __int32 uint_least32_t;
+   typedef unsigned __int64 uint_least64_t;
+   typedef __int8 int_fast8_t;
+   typedef __int16 int_fast16_t;
+   typedef __int32 int_fast32_t;
+   typedef __int64 int_fast64_t;
+   typedef unsigned __int8 uint_fast8_t;
+   typedef unsigned __int16 uint_fast16_t;
+   typedef unsigned __int32 uint_fast32_t;
+   typedef unsigned __int64 uint_fast64_t;
+   typedef __int64 intmax_t;
+   typedef unsigned __int64 uintmax_t;
+# else
+#  include <stdint.h>
+# endif
+# if _MSC_VER < 1800   /* MSVC < 2013 */
+#  ifndef __cplusplus
+    typedef unsigned char _Bool;
+#  endif
+# endif
+# define _cffi_float_complex_t   _Fcomplex    /* include <complex.h> for it */
+# define _cffi_double_complex_t  _Dcomplex    /* include <complex.h> for it */
+#else
+# include <stdint.h>
+# if (defined (__SVR4) && defined (__sun)) || defined(_AIX) || defined(__hpux)
+#  include <alloca.h>
+# endif
+# define _cffi_float_complex_t   float _Complex
+# define _cffi_double_complex_t  double _Complex
+#endif
+
+#ifdef __GNUC__
+# define _CFFI_UNUSED_FN  __attribute__((unused))
+#else
+# define _CFFI_UNUSED_FN  /* nothing */
+#endif
+
+#ifdef __cplusplus
+# ifndef _Bool
+   typedef bool _Bool;   /* semi-hackish: C++ has no _Bool; bool is builtin */
+# endif
+#endif
+
+/**********  CPython-specific section  **********/
+#ifndef PYPY_VERSION
+
+
+#define _cffi_from_c_double PyFloat_FromDouble
+#define _cffi_from_c_float PyFloat_FromDouble
+#define _cffi_from_c_long PyLong_FromLong
+#define _cffi_from_c_ulong PyLong_FromUnsignedLong
+#define _cffi_from_c_longlong PyLong_FromLongLong
+#define _cffi_from_c_ulonglong PyLong_FromUnsignedLongLong
+#define _cffi_from_c__Bool PyBool_FromLong
+
+#define _cffi_to_c_double PyFloat_AsDouble
+#define _cffi_to_c_float PyFloat_AsDouble
+
+#define _cffi_from_c_int(x, type)                                        \
+    (((type)-1) > 0 ? /* unsigned */                                     \
+        (sizeof(type) < sizeof(long) ?                                   \
+            PyLong_FromLong((long)x) :                                   \
+         sizeof(type) == sizeof(long) ?                                  \
+            PyLong_FromUnsignedLong((unsigned long)x) :                  \
+            PyLong_FromUnsignedLongLong((unsigned long long)x)) :        \
+        (sizeof(type) <= sizeof(long) ?                                  \
+            PyLong_FromLong((long)x) :                                   \
+            PyLong_FromLongLong((long long)x)))
+
+#define _cffi_to_c_int(o, type)                                          \
+    ((type)(                                                             \
+     sizeof(type) == 1 ? (((type)-1) > 0 ? (type)_cffi_to_c_u8(o)        \
+                                         : (type)_cffi_to_c_i8(o)) :     \
+     sizeof(type) == 2 ? (((type)-1) > 0 ? (type)_cffi_to_c_u16(o)       \
+                                         : (type)_cffi_to_c_i16(o)) :    \
+     sizeof(type) == 4 ? (((type)-1) > 0 ? (type)_cffi_to_c_u32(o)       \
+                                         : (type)_cffi_to_c_i32(o)) :    \
+     sizeof(type) == 8 ? (((type)-1) > 0 ? (type)_cffi_to_c_u64(o)       \
+                                         : (type)_cffi_to_c_i64(o)) :    \
+     (Py_FatalError("unsupported size for type " #type), (type)0)))
+
+#define _cffi_to_c_i8                                                    \
+                 ((int(*)(PyObject *))_cffi_exports[1])
+#define _cffi_to_c_u8                                                    \
+                 ((int(*)(PyObject *))_cffi_exports[2])
+#define _cffi_to_c_i16                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[3])
+#define _cffi_to_c_u16                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[4])
+#define _cffi_to_c_i32                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[5])
+#define _cffi_to_c_u32                                                   \
+                 ((unsigned int(*)(PyObject *))_cffi_exports[6])
+#define _cffi_to_c_i64                                                   \
+                 ((long long(*)(PyObject *))_cffi_exports[7])
+#define _cffi_to_c_u64                                                   \
+                 ((unsigned long long(*)(PyObject *))_cffi_exports[8])
+#define _cffi_to_c_char                                                  \
+                 ((int(*)(PyObject *))_cffi_exports[9])
+#define _cffi_from_c_pointer                                             \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[10])
+#define _cffi_to_c_pointer                                               \
+    ((char *(*)(PyObject *, struct _cffi_ctypedescr *))_cffi_exports[11])
+#define _cffi_get_struct_layout                                          \
+    not used any more
+#define _cffi_restore_errno                                              \
+    ((void(*)(void))_cffi_exports[13])
+#define _cffi_save_errno                                                 \
+    ((void(*)(void))_cffi_exports[14])
+#define _cffi_from_c_char                                                \
+    ((PyObject *(*)(char))_cffi_exports[15])
+#define _cffi_from_c_deref                                               \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[16])
+#define _cffi_to_c                                                       \
+    ((int(*)(char *, struct _cffi_ctypedescr *, PyObject *))_cffi_exports[17])
+#define _cffi_from_c_struct                                              \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[18])
+#define _cffi_to_c_wchar_t                                               \
+    ((_cffi_wchar_t(*)(PyObject *))_cffi_exports[19])
+#define _cffi_from_c_wchar_t                                             \
+    ((PyObject *(*)(_cffi_wchar_t))_cffi_exports[20])
+#define _cffi_to_c_long_double                                           \
+    ((long double(*)(PyObject *))_cffi_exports[21])
+#define _cffi_to_c__Bool                                                 \
+    ((_Bool(*)(PyObject *))_cffi_exports[22])
+#define _cffi_prepare_pointer_call_argument                              \
+    ((Py_ssize_t(*)(struct _cffi_ctypedescr *,                           \
+                    PyObject *, char **))_cffi_exports[23])
+#define _cffi_convert_array_from_object                                  \
+    ((int(*)(char *, struct _cffi_ctypedescr *, PyObject *))_cffi_exports[24])
+#define _CFFI_CPIDX  25
+#define _cffi_call_python                                                \
+    ((void(*)(struct _cffi_externpy_s *, char *))_cffi_exports[_CFFI_CPIDX])
+#define _cffi_to_c_wchar3216_t                                           \
+    ((int(*)(PyObject *))_cffi_exports[26])
+#define _cffi_from_c_wchar3216_t                                         \
+    ((PyObject *(*)(int))_cffi_exports[27])
+#define _CFFI_NUM_EXPORTS 28
+
+struct _cffi_ctypedescr;
+
+static void *_cffi_exports[_CFFI_NUM_EXPORTS];
+
+#define _cffi_type(index)   (                           \
+    assert((((uintptr_t)_cffi_types[index]) & 1) == 0), \
+    (struct _cffi_ctypedescr *)_cffi_types[index])
+
+static PyObject *_cffi_init(const char *module_name, Py_ssize_t version,
+                            const struct _cffi_type_context_s *ctx)
+{
+    PyObject *module, *o_arg, *new_module;
+    void *raw[] = {
+        (void *)module_name,
+        (void *)version,
+        (void *)_cffi_exports,
+        (void *)ctx,
+    };
+
+    module = PyImport_ImportModule("_cffi_backend");
+    if (module == NULL)
+        goto failure;
+
+    o_arg = PyLong_FromVoidPtr((void *)raw);
+    if (o_arg == NULL)
+        goto failure;
+
+    new_module = PyObject_CallMethod(
+        module, (char *)"_init_cffi_1_0_external_module", (char *)"O", o_arg);
+
+    Py_DECREF(o_arg);
+    Py_DECREF(module);
+    return new_module;
+
+  failure:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+#ifdef HAVE_WCHAR_H
+typedef wchar_t _cffi_wchar_t;
+#else
+typedef uint16_t _cffi_wchar_t;   /* same random pick as _cffi_backend.c */
+#endif
+
+_CFFI_UNUSED_FN static uint16_t _cffi_to_c_char16_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return (uint16_t)_cffi_to_c_wchar_t(o);
+    else
+        return (uint16_t)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char16_t(uint16_t x)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+_CFFI_UNUSED_FN static int _cffi_to_c_char32_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return (int)_cffi_to_c_wchar_t(o);
+    else
+        return (int)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char32_t(unsigned int x)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+union _cffi_union_alignment_u {
+    unsigned char m_char;
+    unsigned short m_short;
+    unsigned int m_int;
+    unsigned long m_long;
+    unsigned long long m_longlong;
+    float m_float;
+    double m_double;
+    long double m_longdouble;
+};
+
+struct _cffi_freeme_s {
+    struct _cffi_freeme_s *next;
+    union _cffi_union_alignment_u alignment;
+};
+
+_CFFI_UNUSED_FN static int
+_cffi_convert_array_argument(struct _cffi_ctypedescr *ctptr, PyObject *arg,
+                             char **output_data, Py_ssize_t datasize,
+                             struct _cffi_freeme_s **freeme)
+{
+    char *p;
+    if (datasize < 0)
+        return -1;
+
+    p = *output_data;
+    if (p == NULL) {
+        struct _cffi_freeme_s *fp = (struct _cffi_freeme_s *)PyObject_Malloc(
+            offsetof(struct _cffi_freeme_s, alignment) + (size_t)datasize);
+        if (fp == NULL)
+            return -1;
+        fp->next = *freeme;
+        *freeme = fp;
+        p = *output_data = (char *)&fp->alignment;
+    }
+    memset((void *)p, 0, (size_t)datasize);
+    return _cffi_convert_array_from_object(p, ctptr, arg);
+}
+
+_CFFI_UNUSED_FN static void
+_cffi_free_array_arguments(struct _cffi_freeme_s *freeme)
+{
+    do {
+        void *p = (void *)freeme;
+        freeme = freeme->next;
+        PyObject_Free(p);
+    } while (freeme != NULL);
+}
+
+/**********  end CPython-specific section  **********/
+#else
+_CFFI_UNUSED_FN
+static void (*_cffi_call_python_org)(struct _cffi_externpy_s *, char *);
+# define _cffi_call_python  _cffi_call_python_org
+#endif
+
+
+#define _cffi_array_len(array)   (sizeof(array) / sizeof((array)[0]))
+
+#define _cffi_prim_int(size, sign)                                      \
+    ((size) == 1 ? ((sign) ? _CFFI_PRIM_INT8  : _CFFI_PRIM_UINT8)  :    \
+     (size) == 2 ? ((sign) ? _CFFI_PRIM_INT16 : _CFFI_PRIM_UINT16) :    \
+     (size) == 4 ? ((sign) ? _CFFI_PRIM_INT32 : _CFFI_PRIM_UINT32) :    \
+     (size) == 8 ? ((sign) ? _CFFI_PRIM_INT64 : _CFFI_PRIM_UINT64) :    \
+     _CFFI__UNKNOWN_PRIM)
+
+#define _cffi_prim_float(size)                                          \
+    ((size) == sizeof(float) ? _CFFI_PRIM_FLOAT :                       \
+     (size) == sizeof(double) ? _CFFI_PRIM_DOUBLE :                     \
+     (size) == sizeof(long double) ? _CFFI__UNKNOWN_LONG_DOUBLE :       \
+     _CFFI__UNKNOWN_FLOAT_PRIM)
+
+#define _cffi_check_int(got, got_nonpos, expected)      \
+    ((got_nonpos) == (expected <= 0) &&                 \
+     (got) == (unsigned long long)expected)
+
+#ifdef MS_WIN32
+# define _cffi_stdcall  __stdcall
+#else
+# define _cffi_stdcall  /* nothing */
+#endif
+
+#ifdef __cplusplus
+}
+#endif
+
+/************************************************************/
+
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "job.h"
+#include "librsync.h"
+#include "sumset.h"
+#include "cbarg.h"
+
+
+/************************************************************/
+
+static void *_cffi_types[] = {
+/*  0 */ _CFFI_OP(_CFFI_OP_FUNCTION, 18), // FILE *()(char const *, char const *, int)
+/*  1 */ _CFFI_OP(_CFFI_OP_POINTER, 172), // char const *
+/*  2 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/*  3 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7), // int
+/*  4 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/*  5 */ _CFFI_OP(_CFFI_OP_FUNCTION, 18), // FILE *()(int, char const *)
+/*  6 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/*  7 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/*  8 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/*  9 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // char *()(rs_stats_t const *, char *, size_t)
+/* 10 */ _CFFI_OP(_CFFI_OP_POINTER, 186), // rs_stats_t const *
+/* 11 */ _CFFI_OP(_CFFI_OP_POINTER, 172), // char *
+/* 12 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28), // size_t
+/* 13 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 14 */ _CFFI_OP(_CFFI_OP_FUNCTION, 1), // char const *()(rs_result)
+/* 15 */ _CFFI_OP(_CFFI_OP_ENUM, 4), // rs_result
+/* 16 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 17 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(FILE *)
+/* 18 */ _CFFI_OP(_CFFI_OP_POINTER, 169), // FILE *
+/* 19 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 20 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(rs_stats_t const *)
+/* 21 */ _CFFI_OP(_CFFI_OP_NOOP, 10),
+/* 22 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 23 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(void)
+/* 24 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 25 */ _CFFI_OP(_CFFI_OP_FUNCTION, 63), // intmax_t()(FILE *)
+/* 26 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 27 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 28 */ _CFFI_OP(_CFFI_OP_FUNCTION, 69), // rs_job_t *()(rs_result(*)(void *, intmax_t, size_t *, void * *), void *)
+/* 29 */ _CFFI_OP(_CFFI_OP_POINTER, 97), // rs_result(*)(void *, intmax_t, size_t *, void * *)
+/* 30 */ _CFFI_OP(_CFFI_OP_POINTER, 205), // void *
+/* 31 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 32 */ _CFFI_OP(_CFFI_OP_FUNCTION, 69), // rs_job_t *()(rs_signature_t * *)
+/* 33 */ _CFFI_OP(_CFFI_OP_POINTER, 36), // rs_signature_t * *
+/* 34 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 35 */ _CFFI_OP(_CFFI_OP_FUNCTION, 69), // rs_job_t *()(rs_signature_t *)
+/* 36 */ _CFFI_OP(_CFFI_OP_POINTER, 185), // rs_signature_t *
+/* 37 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 38 */ _CFFI_OP(_CFFI_OP_FUNCTION, 69), // rs_job_t *()(size_t, size_t, rs_magic_number)
+/* 39 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 40 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 41 */ _CFFI_OP(_CFFI_OP_ENUM, 1), // rs_magic_number
+/* 42 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 43 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(FILE *, FILE *, FILE *, rs_stats_t *)
+/* 44 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 45 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 46 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 47 */ _CFFI_OP(_CFFI_OP_POINTER, 186), // rs_stats_t *
+/* 48 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 49 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(FILE *, FILE *, size_t, size_t, rs_magic_number, rs_stats_t *)
+/* 50 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 51 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 52 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 53 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 54 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 55 */ _CFFI_OP(_CFFI_OP_NOOP, 47),
+/* 56 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 57 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(FILE *, rs_signature_t * *, rs_stats_t *)
+/* 58 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 59 */ _CFFI_OP(_CFFI_OP_NOOP, 33),
+/* 60 */ _CFFI_OP(_CFFI_OP_NOOP, 47),
+/* 61 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 62 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(intmax_t, rs_magic_number *, size_t *, size_t *)
+/* 63 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 46), // intmax_t
+/* 64 */ _CFFI_OP(_CFFI_OP_POINTER, 41), // rs_magic_number *
+/* 65 */ _CFFI_OP(_CFFI_OP_POINTER, 12), // size_t *
+/* 66 */ _CFFI_OP(_CFFI_OP_NOOP, 65),
+/* 67 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 68 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(rs_job_t *, rs_buffers_t *)
+/* 69 */ _CFFI_OP(_CFFI_OP_POINTER, 182), // rs_job_t *
+/* 70 */ _CFFI_OP(_CFFI_OP_POINTER, 181), // rs_buffers_t *
+/* 71 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 72 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(rs_job_t *, rs_buffers_t *, rs_result(*)(rs_job_t *, rs_buffers_t *, void *), void *, rs_result(*)(rs_job_t *, rs_buffers_t *, void *), void *)
+/* 73 */ _CFFI_OP(_CFFI_OP_NOOP, 69),
+/* 74 */ _CFFI_OP(_CFFI_OP_NOOP, 70),
+/* 75 */ _CFFI_OP(_CFFI_OP_POINTER, 80), // rs_result(*)(rs_job_t *, rs_buffers_t *, void *)
+/* 76 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 77 */ _CFFI_OP(_CFFI_OP_NOOP, 75),
+/* 78 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 79 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 80 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(rs_job_t *, rs_buffers_t *, void *)
+/* 81 */ _CFFI_OP(_CFFI_OP_NOOP, 69),
+/* 82 */ _CFFI_OP(_CFFI_OP_NOOP, 70),
+/* 83 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 84 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 85 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(rs_signature_t *)
+/* 86 */ _CFFI_OP(_CFFI_OP_NOOP, 36),
+/* 87 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 88 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(rs_signature_t *, FILE *, FILE *, rs_stats_t *)
+/* 89 */ _CFFI_OP(_CFFI_OP_NOOP, 36),
+/* 90 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 91 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 92 */ _CFFI_OP(_CFFI_OP_NOOP, 47),
+/* 93 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 94 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(struct rs_job *)
+/* 95 */ _CFFI_OP(_CFFI_OP_NOOP, 69),
+/* 96 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 97 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // rs_result()(void *, intmax_t, size_t *, void * *)
+/* 98 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 99 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 46),
+/* 100 */ _CFFI_OP(_CFFI_OP_NOOP, 65),
+/* 101 */ _CFFI_OP(_CFFI_OP_POINTER, 30), // void * *
+/* 102 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 103 */ _CFFI_OP(_CFFI_OP_FUNCTION, 10), // rs_stats_t const *()(rs_job_t *)
+/* 104 */ _CFFI_OP(_CFFI_OP_NOOP, 69),
+/* 105 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 106 */ _CFFI_OP(_CFFI_OP_FUNCTION, 12), // size_t()(char *)
+/* 107 */ _CFFI_OP(_CFFI_OP_NOOP, 11),
+/* 108 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 109 */ _CFFI_OP(_CFFI_OP_FUNCTION, 12), // size_t()(trace_entry *, size_t, size_t *)
+/* 110 */ _CFFI_OP(_CFFI_OP_POINTER, 190), // trace_entry *
+/* 111 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 112 */ _CFFI_OP(_CFFI_OP_NOOP, 65),
+/* 113 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 114 */ _CFFI_OP(_CFFI_OP_FUNCTION, 12), // size_t()(void)
+/* 115 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 116 */ _CFFI_OP(_CFFI_OP_FUNCTION, 30), // void *()(size_t)
+/* 117 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 118 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 119 */ _CFFI_OP(_CFFI_OP_FUNCTION, 30), // void *()(void *, size_t)
+/* 120 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 121 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 122 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 123 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(char *, void const *, int)
+/* 124 */ _CFFI_OP(_CFFI_OP_NOOP, 11),
+/* 125 */ _CFFI_OP(_CFFI_OP_POINTER, 205), // void const *
+/* 126 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 127 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 128 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(rs_loglevel)
+/* 129 */ _CFFI_OP(_CFFI_OP_ENUM, 0), // rs_loglevel
+/* 130 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 131 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(rs_loglevel, char const *)
+/* 132 */ _CFFI_OP(_CFFI_OP_NOOP, 129),
+/* 133 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 134 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 135 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(rs_mdfour_t *)
+/* 136 */ _CFFI_OP(_CFFI_OP_POINTER, 183), // rs_mdfour_t *
+/* 137 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 138 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(rs_mdfour_t *, unsigned char *)
+/* 139 */ _CFFI_OP(_CFFI_OP_NOOP, 136),
+/* 140 */ _CFFI_OP(_CFFI_OP_POINTER, 199), // unsigned char *
+/* 141 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 142 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(rs_mdfour_t *, void const *, size_t)
+/* 143 */ _CFFI_OP(_CFFI_OP_NOOP, 136),
+/* 144 */ _CFFI_OP(_CFFI_OP_NOOP, 125),
+/* 145 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 146 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 147 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(rs_signature_t *)
+/* 148 */ _CFFI_OP(_CFFI_OP_NOOP, 36),
+/* 149 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 150 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(rs_signature_t const *)
+/* 151 */ _CFFI_OP(_CFFI_OP_POINTER, 185), // rs_signature_t const *
+/* 152 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 153 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(unsigned char *, void const *, size_t)
+/* 154 */ _CFFI_OP(_CFFI_OP_NOOP, 140),
+/* 155 */ _CFFI_OP(_CFFI_OP_NOOP, 125),
+/* 156 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 157 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 158 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(unsigned char const *, int, char *)
+/* 159 */ _CFFI_OP(_CFFI_OP_POINTER, 199), // unsigned char const *
+/* 160 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 161 */ _CFFI_OP(_CFFI_OP_NOOP, 11),
+/* 162 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 163 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(void *)
+/* 164 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 165 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 166 */ _CFFI_OP(_CFFI_OP_FUNCTION, 205), // void()(void(*)(rs_loglevel, char const *))
+/* 167 */ _CFFI_OP(_CFFI_OP_POINTER, 131), // void(*)(rs_loglevel, char const *)
+/* 168 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 169 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 5), // FILE
+/* 170 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 4), // Rollsum
+/* 171 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 1), // buffer_args
+/* 172 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 2), // char
+/* 173 */ _CFFI_OP(_CFFI_OP_ARRAY, 172), // char[256]
+/* 174 */ (_cffi_opcode_t)(256),
+/* 175 */ _CFFI_OP(_CFFI_OP_OPEN_ARRAY, 172), // char[]
+/* 176 */ _CFFI_OP(_CFFI_OP_POINTER, 177), // hashtable_t *
+/* 177 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 6), // hashtable_t
+/* 178 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 2), // input_args
+/* 179 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 9), // long
+/* 180 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 7), // rabinkarp_t
+/* 181 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 8), // rs_buffers_t
+/* 182 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 9), // rs_job_t
+/* 183 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 10), // rs_mdfour_t
+/* 184 */ _CFFI_OP(_CFFI_OP_POINTER, 94), // rs_result(*)(struct rs_job *)
+/* 185 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 12), // rs_signature_t
+/* 186 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 13), // rs_stats_t
+/* 187 */ _CFFI_OP(_CFFI_OP_ENUM, 2), // strongsum_kind_t
+/* 188 */ _CFFI_OP(_CFFI_OP_POINTER, 189), // struct rs_prototab_ent const *
+/* 189 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 11), // struct rs_prototab_ent
+/* 190 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 3), // trace_entry
+/* 191 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22), // uint32_t
+/* 192 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 24), // uint64_t
+/* 193 */ _CFFI_OP(_CFFI_OP_POINTER, 194), // uint8_t *
+/* 194 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18), // uint8_t
+/* 195 */ _CFFI_OP(_CFFI_OP_ARRAY, 194), // uint8_t[36]
+/* 196 */ (_cffi_opcode_t)(36),
+/* 197 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 41), // uint_fast16_t
+/* 198 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 0), // union $1
+/* 199 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 4), // unsigned char
+/* 200 */ _CFFI_OP(_CFFI_OP_ARRAY, 199), // unsigned char[32]
+/* 201 */ (_cffi_opcode_t)(32),
+/* 202 */ _CFFI_OP(_CFFI_OP_ARRAY, 199), // unsigned char[64]
+/* 203 */ (_cffi_opcode_t)(64),
+/* 204 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 8), // unsigned int
+/* 205 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 0), // void
+/* 206 */ _CFFI_OP(_CFFI_OP_ENUM, 3), // weaksum_kind_t
+/* 207 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 14), // weaksum_t
+};
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_buffer_args(buffer_args *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { char const * *tmp = &p->data; (void)tmp; }
+  (void)((p->len_) | 0);  /* check that 'buffer_args.len_' is an integer */
+  (void)((p->calls) | 0);  /* check that 'buffer_args.calls' is an integer */
+  (void)((p->nbytes) | 0);  /* check that 'buffer_args.nbytes' is an integer */
+}
+struct _cffi_align_typedef_buffer_args { char x; buffer_args y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_input_args(input_args *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { void * *tmp = &p->file; (void)tmp; }
+  { char * *tmp = &p->buffer; (void)tmp; }
+  (void)((p->len_) | 0);  /* check that 'input_args.len_' is an integer */
+  (void)((p->calls) | 0);  /* check that 'input_args.calls' is an integer */
+  (void)((p->nbytes) | 0);  /* check that 'input_args.nbytes' is an integer */
+  (void)((p->window) | 0);  /* check that 'input_args.window' is an integer */
+  (void)((p->start) | 0);  /* check that 'input_args.start' is an integer */
+  (void)((p->size) | 0);  /* check that 'input_args.size' is an integer */
+  (void)((p->eof) | 0);  /* check that 'input_args.eof' is an integer */
+  (void)((p->hits) | 0);  /* check that 'input_args.hits' is an integer */
+  (void)((p->misses) | 0);  /* check that 'input_args.misses' is an integer */
+  (void)((p->read_bytes) | 0);  /* check that 'input_args.read_bytes' is an integer */
+}
+struct _cffi_align_typedef_input_args { char x; input_args y; };
+
+static int _cffi_const_RS_LOG_EMERG(unsigned long long *o)
+{
+  int n = (RS_LOG_EMERG) <= 0;
+  *o = (unsigned long long)((RS_LOG_EMERG) | 0);  /* check that RS_LOG_EMERG is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_LOG_ALERT(unsigned long long *o)
+{
+  int n = (RS_LOG_ALERT) <= 0;
+  *o = (unsigned long long)((RS_LOG_ALERT) | 0);  /* check that RS_LOG_ALERT is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_LOG_CRIT(unsigned long long *o)
+{
+  int n = (RS_LOG_CRIT) <= 0;
+  *o = (unsigned long long)((RS_LOG_CRIT) | 0);  /* check that RS_LOG_CRIT is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_LOG_ERR(unsigned long long *o)
+{
+  int n = (RS_LOG_ERR) <= 0;
+  *o = (unsigned long long)((RS_LOG_ERR) | 0);  /* check that RS_LOG_ERR is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_LOG_WARNING(unsigned long long *o)
+{
+  int n = (RS_LOG_WARNING) <= 0;
+  *o = (unsigned long long)((RS_LOG_WARNING) | 0);  /* check that RS_LOG_WARNING is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_LOG_NOTICE(unsigned long long *o)
+{
+  int n = (RS_LOG_NOTICE) <= 0;
+  *o = (unsigned long long)((RS_LOG_NOTICE) | 0);  /* check that RS_LOG_NOTICE is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_LOG_INFO(unsigned long long *o)
+{
+  int n = (RS_LOG_INFO) <= 0;
+  *o = (unsigned long long)((RS_LOG_INFO) | 0);  /* check that RS_LOG_INFO is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_LOG_DEBUG(unsigned long long *o)
+{
+  int n = (RS_LOG_DEBUG) <= 0;
+  *o = (unsigned long long)((RS_LOG_DEBUG) | 0);  /* check that RS_LOG_DEBUG is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_DELTA_MAGIC(unsigned long long *o)
+{
+  int n = (RS_DELTA_MAGIC) <= 0;
+  *o = (unsigned long long)((RS_DELTA_MAGIC) | 0);  /* check that RS_DELTA_MAGIC is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_MD4_SIG_MAGIC(unsigned long long *o)
+{
+  int n = (RS_MD4_SIG_MAGIC) <= 0;
+  *o = (unsigned long long)((RS_MD4_SIG_MAGIC) | 0);  /* check that RS_MD4_SIG_MAGIC is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_BLAKE2_SIG_MAGIC(unsigned long long *o)
+{
+  int n = (RS_BLAKE2_SIG_MAGIC) <= 0;
+  *o = (unsigned long long)((RS_BLAKE2_SIG_MAGIC) | 0);  /* check that RS_BLAKE2_SIG_MAGIC is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_RK_MD4_SIG_MAGIC(unsigned long long *o)
+{
+  int n = (RS_RK_MD4_SIG_MAGIC) <= 0;
+  *o = (unsigned long long)((RS_RK_MD4_SIG_MAGIC) | 0);  /* check that RS_RK_MD4_SIG_MAGIC is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_RK_BLAKE2_SIG_MAGIC(unsigned long long *o)
+{
+  int n = (RS_RK_BLAKE2_SIG_MAGIC) <= 0;
+  *o = (unsigned long long)((RS_RK_BLAKE2_SIG_MAGIC) | 0);  /* check that RS_RK_BLAKE2_SIG_MAGIC is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_MD4(unsigned long long *o)
+{
+  int n = (RS_MD4) <= 0;
+  *o = (unsigned long long)((RS_MD4) | 0);  /* check that RS_MD4 is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_BLAKE2(unsigned long long *o)
+{
+  int n = (RS_BLAKE2) <= 0;
+  *o = (unsigned long long)((RS_BLAKE2) | 0);  /* check that RS_BLAKE2 is an integer */
+  return n;
+}
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_trace_entry(trace_entry *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->level) | 0);  /* check that 'trace_entry.level' is an integer */
+  { char(*tmp)[256] = &p->msg; (void)tmp; }
+}
+struct _cffi_align_typedef_trace_entry { char x; trace_entry y; };
+
+static int _cffi_const_RS_ROLLSUM(unsigned long long *o)
+{
+  int n = (RS_ROLLSUM) <= 0;
+  *o = (unsigned long long)((RS_ROLLSUM) | 0);  /* check that RS_ROLLSUM is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_RABINKARP(unsigned long long *o)
+{
+  int n = (RS_RABINKARP) <= 0;
+  *o = (unsigned long long)((RS_RABINKARP) | 0);  /* check that RS_RABINKARP is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_BLAKE2_SUM_LENGTH(unsigned long long *o)
+{
+  int n = (RS_BLAKE2_SUM_LENGTH) <= 0;
+  *o = (unsigned long long)((RS_BLAKE2_SUM_LENGTH) | 0);  /* check that RS_BLAKE2_SUM_LENGTH is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_MD4_SUM_LENGTH(unsigned long long *o)
+{
+  int n = (RS_MD4_SUM_LENGTH) <= 0;
+  *o = (unsigned long long)((RS_MD4_SUM_LENGTH) | 0);  /* check that RS_MD4_SUM_LENGTH is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_DONE(unsigned long long *o)
+{
+  int n = (RS_DONE) <= 0;
+  *o = (unsigned long long)((RS_DONE) | 0);  /* check that RS_DONE is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_BLOCKED(unsigned long long *o)
+{
+  int n = (RS_BLOCKED) <= 0;
+  *o = (unsigned long long)((RS_BLOCKED) | 0);  /* check that RS_BLOCKED is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_RUNNING(unsigned long long *o)
+{
+  int n = (RS_RUNNING) <= 0;
+  *o = (unsigned long long)((RS_RUNNING) | 0);  /* check that RS_RUNNING is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_TEST_SKIPPED(unsigned long long *o)
+{
+  int n = (RS_TEST_SKIPPED) <= 0;
+  *o = (unsigned long long)((RS_TEST_SKIPPED) | 0);  /* check that RS_TEST_SKIPPED is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_IO_ERROR(unsigned long long *o)
+{
+  int n = (RS_IO_ERROR) <= 0;
+  *o = (unsigned long long)((RS_IO_ERROR) | 0);  /* check that RS_IO_ERROR is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_SYNTAX_ERROR(unsigned long long *o)
+{
+  int n = (RS_SYNTAX_ERROR) <= 0;
+  *o = (unsigned long long)((RS_SYNTAX_ERROR) | 0);  /* check that RS_SYNTAX_ERROR is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_MEM_ERROR(unsigned long long *o)
+{
+  int n = (RS_MEM_ERROR) <= 0;
+  *o = (unsigned long long)((RS_MEM_ERROR) | 0);  /* check that RS_MEM_ERROR is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_INPUT_ENDED(unsigned long long *o)
+{
+  int n = (RS_INPUT_ENDED) <= 0;
+  *o = (unsigned long long)((RS_INPUT_ENDED) | 0);  /* check that RS_INPUT_ENDED is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_BAD_MAGIC(unsigned long long *o)
+{
+  int n = (RS_BAD_MAGIC) <= 0;
+  *o = (unsigned long long)((RS_BAD_MAGIC) | 0);  /* check that RS_BAD_MAGIC is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_UNIMPLEMENTED(unsigned long long *o)
+{
+  int n = (RS_UNIMPLEMENTED) <= 0;
+  *o = (unsigned long long)((RS_UNIMPLEMENTED) | 0);  /* check that RS_UNIMPLEMENTED is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_CORRUPT(unsigned long long *o)
+{
+  int n = (RS_CORRUPT) <= 0;
+  *o = (unsigned long long)((RS_CORRUPT) | 0);  /* check that RS_CORRUPT is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_INTERNAL_ERROR(unsigned long long *o)
+{
+  int n = (RS_INTERNAL_ERROR) <= 0;
+  *o = (unsigned long long)((RS_INTERNAL_ERROR) | 0);  /* check that RS_INTERNAL_ERROR is an integer */
+  return n;
+}
+
+static int _cffi_const_RS_PARAM_ERROR(unsigned long long *o)
+{
+  int n = (RS_PARAM_ERROR) <= 0;
+  *o = (unsigned long long)((RS_PARAM_ERROR) | 0);  /* check that RS_PARAM_ERROR is an integer */
+  return n;
+}
+
+static struct _cffi_externpy_s _cffi_externpy__read_cb =
+  { "pyrsync.backends.cffi._rsync.read_cb", (int)sizeof(rs_result), 0, 0 };
+
+static rs_result read_cb(void * a0, intmax_t a1, size_t * a2, void * * a3)
+{
+  char a[32];
+  char *p = a;
+  *(void * *)(p + 0) = a0;
+  *(intmax_t *)(p + 8) = a1;
+  *(size_t * *)(p + 16) = a2;
+  *(void * * *)(p + 24) = a3;
+  _cffi_call_python(&_cffi_externpy__read_cb, p);
+  return *(rs_result *)p;
+}
+
+static rs_result _cffi_d_buffer_cb(void * x0, intmax_t x1, size_t * x2, void * * x3)
+{
+  return buffer_cb(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_buffer_cb(PyObject *self, PyObject *args)
+{
+  void * x0;
+  intmax_t x1;
+  size_t * x2;
+  void * * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "buffer_cb", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, intmax_t);
+  if (x1 == (intmax_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(65), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(65), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(101), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (void * *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(101), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = buffer_cb(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_buffer_cb _cffi_d_buffer_cb
+#endif
+
+static int _cffi_d_fclose(FILE * x0)
+{
+  return fclose(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_fclose(PyObject *self, PyObject *arg0)
+{
+  FILE * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = fclose(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_fclose _cffi_d_fclose
+#endif
+
+static FILE * _cffi_d_fdopen(int x0, char const * x1)
+{
+  return fdopen(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_fdopen(PyObject *self, PyObject *args)
+{
+  int x0;
+  char const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  FILE * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "fdopen", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, int);
+  if (x0 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = fdopen(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(18));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_fdopen _cffi_d_fdopen
+#endif
+
+static void _cffi_d_free(void * x0)
+{
+  free(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_free(PyObject *self, PyObject *arg0)
+{
+  void * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { free(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_free _cffi_d_free
+#endif
+
+static void * _cffi_d_malloc(size_t x0)
+{
+  return malloc(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_malloc(PyObject *self, PyObject *arg0)
+{
+  size_t x0;
+  void * result;
+  PyObject *pyresult;
+
+  x0 = _cffi_to_c_int(arg0, size_t);
+  if (x0 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = malloc(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(30));
+  return pyresult;
+}
+#else
+#  define _cffi_f_malloc _cffi_d_malloc
+#endif
+
+static void * _cffi_d_realloc(void * x0, size_t x1)
+{
+  return realloc(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_realloc(PyObject *self, PyObject *args)
+{
+  void * x0;
+  size_t x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  void * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "realloc", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = realloc(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(30));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_realloc _cffi_d_realloc
+#endif
+
+static void _cffi_d_rs_base64(unsigned char const * x0, int x1, char * x2)
+{
+  rs_base64(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_base64(PyObject *self, PyObject *args)
+{
+  unsigned char const * x0;
+  int x1;
+  char * x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_base64", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (unsigned char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(11), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(11), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_base64(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_base64 _cffi_d_rs_base64
+#endif
+
+static rs_result _cffi_d_rs_build_hash_table(rs_signature_t * x0)
+{
+  return rs_build_hash_table(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_build_hash_table(PyObject *self, PyObject *arg0)
+{
+  rs_signature_t * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(36), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_signature_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(36), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_build_hash_table(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_build_hash_table _cffi_d_rs_build_hash_table
+#endif
+
+static rs_job_t * _cffi_d_rs_delta_begin(rs_signature_t * x0)
+{
+  return rs_delta_begin(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_delta_begin(PyObject *self, PyObject *arg0)
+{
+  rs_signature_t * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_job_t * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(36), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_signature_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(36), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_delta_begin(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(69));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_delta_begin _cffi_d_rs_delta_begin
+#endif
+
+static rs_result _cffi_d_rs_delta_file(rs_signature_t * x0, FILE * x1, FILE * x2, rs_stats_t * x3)
+{
+  return rs_delta_file(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_delta_file(PyObject *self, PyObject *args)
+{
+  rs_signature_t * x0;
+  FILE * x1;
+  FILE * x2;
+  rs_stats_t * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "rs_delta_file", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(36), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_signature_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(36), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(47), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (rs_stats_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(47), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_delta_file(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_delta_file _cffi_d_rs_delta_file
+#endif
+
+static int _cffi_d_rs_file_close(FILE * x0)
+{
+  return rs_file_close(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_file_close(PyObject *self, PyObject *arg0)
+{
+  FILE * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_file_close(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_file_close _cffi_d_rs_file_close
+#endif
+
+static rs_result _cffi_d_rs_file_copy_cb(void * x0, intmax_t x1, size_t * x2, void * * x3)
+{
+  return rs_file_copy_cb(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_file_copy_cb(PyObject *self, PyObject *args)
+{
+  void * x0;
+  intmax_t x1;
+  size_t * x2;
+  void * * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "rs_file_copy_cb", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, intmax_t);
+  if (x1 == (intmax_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(65), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(65), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(101), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (void * *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(101), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_file_copy_cb(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_file_copy_cb _cffi_d_rs_file_copy_cb
+#endif
+
+static FILE * _cffi_d_rs_file_open(char const * x0, char const * x1, int x2)
+{
+  return rs_file_open(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_file_open(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  char const * x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  FILE * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_file_open", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_file_open(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(18));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_file_open _cffi_d_rs_file_open
+#endif
+
+static intmax_t _cffi_d_rs_file_size(FILE * x0)
+{
+  return rs_file_size(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_file_size(PyObject *self, PyObject *arg0)
+{
+  FILE * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  intmax_t result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_file_size(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, intmax_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_file_size _cffi_d_rs_file_size
+#endif
+
+static char * _cffi_d_rs_format_stats(rs_stats_t const * x0, char * x1, size_t x2)
+{
+  return rs_format_stats(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_format_stats(PyObject *self, PyObject *args)
+{
+  rs_stats_t const * x0;
+  char * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_format_stats", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(10), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_stats_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(10), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(11), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(11), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_format_stats(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(11));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_format_stats _cffi_d_rs_format_stats
+#endif
+
+static void _cffi_d_rs_free_sumset(rs_signature_t * x0)
+{
+  rs_free_sumset(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_free_sumset(PyObject *self, PyObject *arg0)
+{
+  rs_signature_t * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(36), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_signature_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(36), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_free_sumset(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_free_sumset _cffi_d_rs_free_sumset
+#endif
+
+static void _cffi_d_rs_hexify(char * x0, void const * x1, int x2)
+{
+  rs_hexify(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_hexify(PyObject *self, PyObject *args)
+{
+  char * x0;
+  void const * x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_hexify", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(11), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(11), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(125), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (void const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(125), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_hexify(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_hexify _cffi_d_rs_hexify
+#endif
+
+static rs_result _cffi_d_rs_job_drive(rs_job_t * x0, rs_buffers_t * x1, rs_result(* x2)(rs_job_t *, rs_buffers_t *, void *), void * x3, rs_result(* x4)(rs_job_t *, rs_buffers_t *, void *), void * x5)
+{
+  return rs_job_drive(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_job_drive(PyObject *self, PyObject *args)
+{
+  rs_job_t * x0;
+  rs_buffers_t * x1;
+  rs_result(* x2)(rs_job_t *, rs_buffers_t *, void *);
+  void * x3;
+  rs_result(* x4)(rs_job_t *, rs_buffers_t *, void *);
+  void * x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "rs_job_drive", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(69), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_job_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(69), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(70), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (rs_buffers_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(70), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = (rs_result(*)(rs_job_t *, rs_buffers_t *, void *))_cffi_to_c_pointer(arg2, _cffi_type(75));
+  if (x2 == (rs_result(*)(rs_job_t *, rs_buffers_t *, void *))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x4 = (rs_result(*)(rs_job_t *, rs_buffers_t *, void *))_cffi_to_c_pointer(arg4, _cffi_type(75));
+  if (x4 == (rs_result(*)(rs_job_t *, rs_buffers_t *, void *))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_job_drive(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_job_drive _cffi_d_rs_job_drive
+#endif
+
+static rs_result _cffi_d_rs_job_free(rs_job_t * x0)
+{
+  return rs_job_free(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_job_free(PyObject *self, PyObject *arg0)
+{
+  rs_job_t * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(69), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_job_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(69), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_job_free(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_job_free _cffi_d_rs_job_free
+#endif
+
+static rs_result _cffi_d_rs_job_iter(rs_job_t * x0, rs_buffers_t * x1)
+{
+  return rs_job_iter(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_job_iter(PyObject *self, PyObject *args)
+{
+  rs_job_t * x0;
+  rs_buffers_t * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "rs_job_iter", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(69), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_job_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(69), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(70), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (rs_buffers_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(70), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_job_iter(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_job_iter _cffi_d_rs_job_iter
+#endif
+
+static rs_stats_t const * _cffi_d_rs_job_statistics(rs_job_t * x0)
+{
+  return rs_job_statistics(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_job_statistics(PyObject *self, PyObject *arg0)
+{
+  rs_job_t * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_stats_t const * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(69), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_job_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(69), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_job_statistics(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(10));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_job_statistics _cffi_d_rs_job_statistics
+#endif
+
+static rs_job_t * _cffi_d_rs_loadsig_begin(rs_signature_t * * x0)
+{
+  return rs_loadsig_begin(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_loadsig_begin(PyObject *self, PyObject *arg0)
+{
+  rs_signature_t * * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_job_t * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(33), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_signature_t * *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(33), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_loadsig_begin(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(69));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_loadsig_begin _cffi_d_rs_loadsig_begin
+#endif
+
+static rs_result _cffi_d_rs_loadsig_file(FILE * x0, rs_signature_t * * x1, rs_stats_t * x2)
+{
+  return rs_loadsig_file(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_loadsig_file(PyObject *self, PyObject *args)
+{
+  FILE * x0;
+  rs_signature_t * * x1;
+  rs_stats_t * x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_loadsig_file", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(33), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (rs_signature_t * *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(33), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(47), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (rs_stats_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(47), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_loadsig_file(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_loadsig_file _cffi_d_rs_loadsig_file
+#endif
+
+static int _cffi_d_rs_log_stats(rs_stats_t const * x0)
+{
+  return rs_log_stats(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_log_stats(PyObject *self, PyObject *arg0)
+{
+  rs_stats_t const * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(10), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_stats_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(10), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_log_stats(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_log_stats _cffi_d_rs_log_stats
+#endif
+
+static void _cffi_d_rs_mdfour(unsigned char * x0, void const * x1, size_t x2)
+{
+  rs_mdfour(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_mdfour(PyObject *self, PyObject *args)
+{
+  unsigned char * x0;
+  void const * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_mdfour", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(140), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (unsigned char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(140), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(125), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (void const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(125), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_mdfour(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_mdfour _cffi_d_rs_mdfour
+#endif
+
+static void _cffi_d_rs_mdfour_begin(rs_mdfour_t * x0)
+{
+  rs_mdfour_begin(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_mdfour_begin(PyObject *self, PyObject *arg0)
+{
+  rs_mdfour_t * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(136), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_mdfour_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(136), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_mdfour_begin(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_mdfour_begin _cffi_d_rs_mdfour_begin
+#endif
+
+static void _cffi_d_rs_mdfour_result(rs_mdfour_t * x0, unsigned char * x1)
+{
+  rs_mdfour_result(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_mdfour_result(PyObject *self, PyObject *args)
+{
+  rs_mdfour_t * x0;
+  unsigned char * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "rs_mdfour_result", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(136), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_mdfour_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(136), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(140), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (unsigned char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(140), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_mdfour_result(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_mdfour_result _cffi_d_rs_mdfour_result
+#endif
+
+static void _cffi_d_rs_mdfour_update(rs_mdfour_t * x0, void const * x1, size_t x2)
+{
+  rs_mdfour_update(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_mdfour_update(PyObject *self, PyObject *args)
+{
+  rs_mdfour_t * x0;
+  void const * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_mdfour_update", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(136), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_mdfour_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(136), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(125), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (void const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(125), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_mdfour_update(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_mdfour_update _cffi_d_rs_mdfour_update
+#endif
+
+static rs_job_t * _cffi_d_rs_patch_begin(rs_result(* x0)(void *, intmax_t, size_t *, void * *), void * x1)
+{
+  return rs_patch_begin(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_patch_begin(PyObject *self, PyObject *args)
+{
+  rs_result(* x0)(void *, intmax_t, size_t *, void * *);
+  void * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_job_t * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "rs_patch_begin", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  x0 = (rs_result(*)(void *, intmax_t, size_t *, void * *))_cffi_to_c_pointer(arg0, _cffi_type(29));
+  if (x0 == (rs_result(*)(void *, intmax_t, size_t *, void * *))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_patch_begin(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(69));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_patch_begin _cffi_d_rs_patch_begin
+#endif
+
+static rs_result _cffi_d_rs_patch_file(FILE * x0, FILE * x1, FILE * x2, rs_stats_t * x3)
+{
+  return rs_patch_file(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_patch_file(PyObject *self, PyObject *args)
+{
+  FILE * x0;
+  FILE * x1;
+  FILE * x2;
+  rs_stats_t * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "rs_patch_file", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(47), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (rs_stats_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(47), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_patch_file(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_patch_file _cffi_d_rs_patch_file
+#endif
+
+static rs_result _cffi_d_rs_sig_args(intmax_t x0, rs_magic_number * x1, size_t * x2, size_t * x3)
+{
+  return rs_sig_args(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_sig_args(PyObject *self, PyObject *args)
+{
+  intmax_t x0;
+  rs_magic_number * x1;
+  size_t * x2;
+  size_t * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "rs_sig_args", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, intmax_t);
+  if (x0 == (intmax_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(64), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (rs_magic_number *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(64), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(65), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(65), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(65), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(65), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_sig_args(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_sig_args _cffi_d_rs_sig_args
+#endif
+
+static rs_job_t * _cffi_d_rs_sig_begin(size_t x0, size_t x1, rs_magic_number x2)
+{
+  return rs_sig_begin(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_sig_begin(PyObject *self, PyObject *args)
+{
+  size_t x0;
+  size_t x1;
+  rs_magic_number x2;
+  rs_job_t * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "rs_sig_begin", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, size_t);
+  if (x0 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  if (_cffi_to_c((char *)&x2, _cffi_type(41), arg2) < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_sig_begin(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(69));
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_sig_begin _cffi_d_rs_sig_begin
+#endif
+
+static rs_result _cffi_d_rs_sig_file(FILE * x0, FILE * x1, size_t x2, size_t x3, rs_magic_number x4, rs_stats_t * x5)
+{
+  return rs_sig_file(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_sig_file(PyObject *self, PyObject *args)
+{
+  FILE * x0;
+  FILE * x1;
+  size_t x2;
+  size_t x3;
+  rs_magic_number x4;
+  rs_stats_t * x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  rs_result result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "rs_sig_file", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (FILE *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  if (_cffi_to_c((char *)&x4, _cffi_type(41), arg4) < 0)
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(47), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (rs_stats_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(47), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_sig_file(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(15));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_sig_file _cffi_d_rs_sig_file
+#endif
+
+static void _cffi_d_rs_signature_log_stats(rs_signature_t const * x0)
+{
+  rs_signature_log_stats(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_signature_log_stats(PyObject *self, PyObject *arg0)
+{
+  rs_signature_t const * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(151), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_signature_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(151), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_signature_log_stats(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_signature_log_stats _cffi_d_rs_signature_log_stats
+#endif
+
+static char const * _cffi_d_rs_strerror(rs_result x0)
+{
+  return rs_strerror(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_strerror(PyObject *self, PyObject *arg0)
+{
+  rs_result x0;
+  char const * result;
+  PyObject *pyresult;
+
+  if (_cffi_to_c((char *)&x0, _cffi_type(15), arg0) < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_strerror(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(1));
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_strerror _cffi_d_rs_strerror
+#endif
+
+static void _cffi_d_rs_sumset_dump(rs_signature_t const * x0)
+{
+  rs_sumset_dump(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_sumset_dump(PyObject *self, PyObject *arg0)
+{
+  rs_signature_t const * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(151), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (rs_signature_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(151), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_sumset_dump(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_sumset_dump _cffi_d_rs_sumset_dump
+#endif
+
+static int _cffi_d_rs_supports_trace(void)
+{
+  return rs_supports_trace();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_supports_trace(PyObject *self, PyObject *noarg)
+{
+  int result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_supports_trace(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_supports_trace _cffi_d_rs_supports_trace
+#endif
+
+static void _cffi_d_rs_trace_set_level(rs_loglevel x0)
+{
+  rs_trace_set_level(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_trace_set_level(PyObject *self, PyObject *arg0)
+{
+  rs_loglevel x0;
+
+  if (_cffi_to_c((char *)&x0, _cffi_type(129), arg0) < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_trace_set_level(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_trace_set_level _cffi_d_rs_trace_set_level
+#endif
+
+static void _cffi_d_rs_trace_stderr(rs_loglevel x0, char const * x1)
+{
+  rs_trace_stderr(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_trace_stderr(PyObject *self, PyObject *args)
+{
+  rs_loglevel x0;
+  char const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "rs_trace_stderr", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  if (_cffi_to_c((char *)&x0, _cffi_type(129), arg0) < 0)
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_trace_stderr(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_trace_stderr _cffi_d_rs_trace_stderr
+#endif
+
+static void _cffi_d_rs_trace_to(void(* x0)(rs_loglevel, char const *))
+{
+  rs_trace_to(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_trace_to(PyObject *self, PyObject *arg0)
+{
+  void(* x0)(rs_loglevel, char const *);
+
+  x0 = (void(*)(rs_loglevel, char const *))_cffi_to_c_pointer(arg0, _cffi_type(167));
+  if (x0 == (void(*)(rs_loglevel, char const *))NULL && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { rs_trace_to(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_rs_trace_to _cffi_d_rs_trace_to
+#endif
+
+static size_t _cffi_d_rs_unbase64(char * x0)
+{
+  return rs_unbase64(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_rs_unbase64(PyObject *self, PyObject *arg0)
+{
+  char * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(11), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(11), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = rs_unbase64(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_rs_unbase64 _cffi_d_rs_unbase64
+#endif
+
+static void _cffi_d_trace_cb(rs_loglevel x0, char const * x1)
+{
+  trace_cb(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_trace_cb(PyObject *self, PyObject *args)
+{
+  rs_loglevel x0;
+  char const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "trace_cb", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  if (_cffi_to_c((char *)&x0, _cffi_type(129), arg0) < 0)
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { trace_cb(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_trace_cb _cffi_d_trace_cb
+#endif
+
+static int _cffi_d_trace_init(void)
+{
+  return trace_init();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_trace_init(PyObject *self, PyObject *noarg)
+{
+  int result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = trace_init(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  return pyresult;
+}
+#else
+#  define _cffi_f_trace_init _cffi_d_trace_init
+#endif
+
+static size_t _cffi_d_trace_pending(void)
+{
+  return trace_pending();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_trace_pending(PyObject *self, PyObject *noarg)
+{
+  size_t result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = trace_pending(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  return pyresult;
+}
+#else
+#  define _cffi_f_trace_pending _cffi_d_trace_pending
+#endif
+
+static size_t _cffi_d_trace_pop(trace_entry * x0, size_t x1, size_t * x2)
+{
+  return trace_pop(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_trace_pop(PyObject *self, PyObject *args)
+{
+  trace_entry * x0;
+  size_t x1;
+  size_t * x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "trace_pop", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(110), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (trace_entry *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(110), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(65), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(65), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = trace_pop(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_trace_pop _cffi_d_trace_pop
+#endif
+
+static int _cffi_const_RS_DEFAULT_BLOCK_LEN(unsigned long long *o)
+{
+  int n = (RS_DEFAULT_BLOCK_LEN) <= 0;
+  *o = (unsigned long long)((RS_DEFAULT_BLOCK_LEN) | 0);  /* check that RS_DEFAULT_BLOCK_LEN is an integer */
+  if (!_cffi_check_int(*o, n, 2048U))
+    n |= 2;
+  return n;
+}
+
+static int _cffi_const_RS_DEFAULT_MIN_STRONG_LEN(unsigned long long *o)
+{
+  int n = (RS_DEFAULT_MIN_STRONG_LEN) <= 0;
+  *o = (unsigned long long)((RS_DEFAULT_MIN_STRONG_LEN) | 0);  /* check that RS_DEFAULT_MIN_STRONG_LEN is an integer */
+  if (!_cffi_check_int(*o, n, 12U))
+    n |= 2;
+  return n;
+}
+
+static int _cffi_const_RS_MAX_STRONG_SUM_LENGTH(unsigned long long *o)
+{
+  int n = (RS_MAX_STRONG_SUM_LENGTH) <= 0;
+  *o = (unsigned long long)((RS_MAX_STRONG_SUM_LENGTH) | 0);  /* check that RS_MAX_STRONG_SUM_LENGTH is an integer */
+  if (!_cffi_check_int(*o, n, 32U))
+    n |= 2;
+  return n;
+}
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__Rollsum(Rollsum *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->count) | 0);  /* check that 'Rollsum.count' is an integer */
+  (void)((p->s1) | 0);  /* check that 'Rollsum.s1' is an integer */
+  (void)((p->s2) | 0);  /* check that 'Rollsum.s2' is an integer */
+}
+struct _cffi_align__Rollsum { char x; Rollsum y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__hashtable_t(hashtable_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->size) | 0);  /* check that 'hashtable_t.size' is an integer */
+  (void)((p->count) | 0);  /* check that 'hashtable_t.count' is an integer */
+}
+struct _cffi_align__hashtable_t { char x; hashtable_t y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__rabinkarp_t(rabinkarp_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->count) | 0);  /* check that 'rabinkarp_t.count' is an integer */
+  (void)((p->hash) | 0);  /* check that 'rabinkarp_t.hash' is an integer */
+  (void)((p->mult) | 0);  /* check that 'rabinkarp_t.mult' is an integer */
+}
+struct _cffi_align__rabinkarp_t { char x; rabinkarp_t y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__rs_buffers_t(rs_buffers_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { char * *tmp = &p->next_in; (void)tmp; }
+  (void)((p->avail_in) | 0);  /* check that 'rs_buffers_t.avail_in' is an integer */
+  (void)((p->eof_in) | 0);  /* check that 'rs_buffers_t.eof_in' is an integer */
+  { char * *tmp = &p->next_out; (void)tmp; }
+  (void)((p->avail_out) | 0);  /* check that 'rs_buffers_t.avail_out' is an integer */
+}
+struct _cffi_align__rs_buffers_t { char x; rs_buffers_t y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__rs_job_t(rs_job_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->dogtag) | 0);  /* check that 'rs_job_t.dogtag' is an integer */
+  { char const * *tmp = &p->job_name; (void)tmp; }
+  { rs_buffers_t * *tmp = &p->stream; (void)tmp; }
+  { rs_result(* *tmp)(struct rs_job *) = &p->statefn; (void)tmp; }
+  { rs_result *tmp = &p->final_result; (void)tmp; }
+  (void)((p->sig_magic) | 0);  /* check that 'rs_job_t.sig_magic' is an integer */
+  (void)((p->sig_block_len) | 0);  /* check that 'rs_job_t.sig_block_len' is an integer */
+  (void)((p->sig_strong_len) | 0);  /* check that 'rs_job_t.sig_strong_len' is an integer */
+  (void)((p->sig_fsize) | 0);  /* check that 'rs_job_t.sig_fsize' is an integer */
+  { rs_signature_t * *tmp = &p->signature; (void)tmp; }
+  (void)((p->job_owns_sig) | 0);  /* check that 'rs_job_t.job_owns_sig' is an integer */
+  (void)((p->op) | 0);  /* check that 'rs_job_t.op' is an integer */
+  (void)((p->weak_sig) | 0);  /* check that 'rs_job_t.weak_sig' is an integer */
+  { weaksum_t *tmp = &p->weak_sum; (void)tmp; }
+  (void)((p->param1) | 0);  /* check that 'rs_job_t.param1' is an integer */
+  (void)((p->param2) | 0);  /* check that 'rs_job_t.param2' is an integer */
+  { struct rs_prototab_ent const * *tmp = &p->cmd; (void)tmp; }
+  { rs_mdfour_t *tmp = &p->output_md4; (void)tmp; }
+  { rs_stats_t *tmp = &p->stats; (void)tmp; }
+  { uint8_t * *tmp = &p->scoop_buf; (void)tmp; }
+  { uint8_t * *tmp = &p->scoop_next; (void)tmp; }
+  (void)((p->scoop_alloc) | 0);  /* check that 'rs_job_t.scoop_alloc' is an integer */
+  (void)((p->scoop_avail) | 0);  /* check that 'rs_job_t.scoop_avail' is an integer */
+  { uint8_t * *tmp = &p->scan_buf; (void)tmp; }
+  (void)((p->scan_len) | 0);  /* check that 'rs_job_t.scan_len' is an integer */
+  (void)((p->scan_pos) | 0);  /* check that 'rs_job_t.scan_pos' is an integer */
+  { uint8_t(*tmp)[36] = &p->write_buf; (void)tmp; }
+  (void)((p->write_len) | 0);  /* check that 'rs_job_t.write_len' is an integer */
+  (void)((p->copy_len) | 0);  /* check that 'rs_job_t.copy_len' is an integer */
+  (void)((p->basis_pos) | 0);  /* check that 'rs_job_t.basis_pos' is an integer */
+  (void)((p->basis_len) | 0);  /* check that 'rs_job_t.basis_len' is an integer */
+  { rs_result(* *tmp)(void *, intmax_t, size_t *, void * *) = &p->copy_cb; (void)tmp; }
+  { void * *tmp = &p->copy_arg; (void)tmp; }
+}
+struct _cffi_align__rs_job_t { char x; rs_job_t y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__rs_mdfour_t(rs_mdfour_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->A) | 0);  /* check that 'rs_mdfour_t.A' is an integer */
+  (void)((p->B) | 0);  /* check that 'rs_mdfour_t.B' is an integer */
+  (void)((p->C) | 0);  /* check that 'rs_mdfour_t.C' is an integer */
+  (void)((p->D) | 0);  /* check that 'rs_mdfour_t.D' is an integer */
+  (void)((p->totalN) | 0);  /* check that 'rs_mdfour_t.totalN' is an integer */
+  (void)((p->tail_len) | 0);  /* check that 'rs_mdfour_t.tail_len' is an integer */
+  { unsigned char(*tmp)[64] = &p->tail; (void)tmp; }
+}
+struct _cffi_align__rs_mdfour_t { char x; rs_mdfour_t y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__rs_signature_t(rs_signature_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->magic) | 0);  /* check that 'rs_signature_t.magic' is an integer */
+  (void)((p->block_len) | 0);  /* check that 'rs_signature_t.block_len' is an integer */
+  (void)((p->strong_sum_len) | 0);  /* check that 'rs_signature_t.strong_sum_len' is an integer */
+  (void)((p->count) | 0);  /* check that 'rs_signature_t.count' is an integer */
+  (void)((p->size) | 0);  /* check that 'rs_signature_t.size' is an integer */
+  { void * *tmp = &p->block_sigs; (void)tmp; }
+  { hashtable_t * *tmp = &p->hashtable; (void)tmp; }
+}
+struct _cffi_align__rs_signature_t { char x; rs_signature_t y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__rs_stats_t(rs_stats_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { char const * *tmp = &p->op; (void)tmp; }
+  (void)((p->lit_cmds) | 0);  /* check that 'rs_stats_t.lit_cmds' is an integer */
+  (void)((p->lit_bytes) | 0);  /* check that 'rs_stats_t.lit_bytes' is an integer */
+  (void)((p->lit_cmdbytes) | 0);  /* check that 'rs_stats_t.lit_cmdbytes' is an integer */
+  (void)((p->copy_cmds) | 0);  /* check that 'rs_stats_t.copy_cmds' is an integer */
+  (void)((p->copy_bytes) | 0);  /* check that 'rs_stats_t.copy_bytes' is an integer */
+  (void)((p->copy_cmdbytes) | 0);  /* check that 'rs_stats_t.copy_cmdbytes' is an integer */
+  (void)((p->sig_cmds) | 0);  /* check that 'rs_stats_t.sig_cmds' is an integer */
+  (void)((p->sig_bytes) | 0);  /* check that 'rs_stats_t.sig_bytes' is an integer */
+  (void)((p->false_matches) | 0);  /* check that 'rs_stats_t.false_matches' is an integer */
+  (void)((p->sig_blocks) | 0);  /* check that 'rs_stats_t.sig_blocks' is an integer */
+  (void)((p->block_len) | 0);  /* check that 'rs_stats_t.block_len' is an integer */
+  (void)((p->in_bytes) | 0);  /* check that 'rs_stats_t.in_bytes' is an integer */
+  (void)((p->out_bytes) | 0);  /* check that 'rs_stats_t.out_bytes' is an integer */
+  (void)((p->start) | 0);  /* check that 'rs_stats_t.start' is an integer */
+  (void)((p->end) | 0);  /* check that 'rs_stats_t.end' is an integer */
+}
+struct _cffi_align__rs_stats_t { char x; rs_stats_t y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld__weaksum_t(weaksum_t *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { weaksum_kind_t *tmp = &p->kind; (void)tmp; }
+  /* cannot generate 'union $1' in field 'sum': unknown type name */
+}
+struct _cffi_align__weaksum_t { char x; weaksum_t y; };
+
+static int *_cffi_var_rs_inbuflen(void)
+{
+  return &(rs_inbuflen);
+}
+
+static char const *_cffi_var_rs_librsync_version(void)
+{
+  return (rs_librsync_version);
+}
+
+static int *_cffi_var_rs_outbuflen(void)
+{
+  return &(rs_outbuflen);
+}
+
+static const struct _cffi_global_s _cffi_globals[] = {
+  { "RS_BAD_MAGIC", (void *)_cffi_const_RS_BAD_MAGIC, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_BLAKE2", (void *)_cffi_const_RS_BLAKE2, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_BLAKE2_SIG_MAGIC", (void *)_cffi_const_RS_BLAKE2_SIG_MAGIC, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_BLAKE2_SUM_LENGTH", (void *)_cffi_const_RS_BLAKE2_SUM_LENGTH, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "RS_BLOCKED", (void *)_cffi_const_RS_BLOCKED, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_CORRUPT", (void *)_cffi_const_RS_CORRUPT, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_DEFAULT_BLOCK_LEN", (void *)_cffi_const_RS_DEFAULT_BLOCK_LEN, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "RS_DEFAULT_MIN_STRONG_LEN", (void *)_cffi_const_RS_DEFAULT_MIN_STRONG_LEN, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "RS_DELTA_MAGIC", (void *)_cffi_const_RS_DELTA_MAGIC, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_DONE", (void *)_cffi_const_RS_DONE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_INPUT_ENDED", (void *)_cffi_const_RS_INPUT_ENDED, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_INTERNAL_ERROR", (void *)_cffi_const_RS_INTERNAL_ERROR, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_IO_ERROR", (void *)_cffi_const_RS_IO_ERROR, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_ALERT", (void *)_cffi_const_RS_LOG_ALERT, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_CRIT", (void *)_cffi_const_RS_LOG_CRIT, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_DEBUG", (void *)_cffi_const_RS_LOG_DEBUG, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_EMERG", (void *)_cffi_const_RS_LOG_EMERG, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_ERR", (void *)_cffi_const_RS_LOG_ERR, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_INFO", (void *)_cffi_const_RS_LOG_INFO, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_NOTICE", (void *)_cffi_const_RS_LOG_NOTICE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_LOG_WARNING", (void *)_cffi_const_RS_LOG_WARNING, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_MAX_STRONG_SUM_LENGTH", (void *)_cffi_const_RS_MAX_STRONG_SUM_LENGTH, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "RS_MD4", (void *)_cffi_const_RS_MD4, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_MD4_SIG_MAGIC", (void *)_cffi_const_RS_MD4_SIG_MAGIC, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_MD4_SUM_LENGTH", (void *)_cffi_const_RS_MD4_SUM_LENGTH, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "RS_MEM_ERROR", (void *)_cffi_const_RS_MEM_ERROR, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_PARAM_ERROR", (void *)_cffi_const_RS_PARAM_ERROR, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_RABINKARP", (void *)_cffi_const_RS_RABINKARP, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_RK_BLAKE2_SIG_MAGIC", (void *)_cffi_const_RS_RK_BLAKE2_SIG_MAGIC, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_RK_MD4_SIG_MAGIC", (void *)_cffi_const_RS_RK_MD4_SIG_MAGIC, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_ROLLSUM", (void *)_cffi_const_RS_ROLLSUM, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_RUNNING", (void *)_cffi_const_RS_RUNNING, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_SYNTAX_ERROR", (void *)_cffi_const_RS_SYNTAX_ERROR, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_TEST_SKIPPED", (void *)_cffi_const_RS_TEST_SKIPPED, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "RS_UNIMPLEMENTED", (void *)_cffi_const_RS_UNIMPLEMENTED, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "buffer_cb", (void *)_cffi_f_buffer_cb, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 97), (void *)_cffi_d_buffer_cb },
+  { "fclose", (void *)_cffi_f_fclose, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 17), (void *)_cffi_d_fclose },
+  { "fdopen", (void *)_cffi_f_fdopen, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 5), (void *)_cffi_d_fdopen },
+  { "free", (void *)_cffi_f_free, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 163), (void *)_cffi_d_free },
+  { "malloc", (void *)_cffi_f_malloc, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 116), (void *)_cffi_d_malloc },
+  { "read_cb", (void *)&_cffi_externpy__read_cb, _CFFI_OP(_CFFI_OP_EXTERN_PYTHON, 29), (void *)read_cb },
+  { "realloc", (void *)_cffi_f_realloc, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 119), (void *)_cffi_d_realloc },
+  { "rs_base64", (void *)_cffi_f_rs_base64, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 158), (void *)_cffi_d_rs_base64 },
+  { "rs_build_hash_table", (void *)_cffi_f_rs_build_hash_table, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 85), (void *)_cffi_d_rs_build_hash_table },
+  { "rs_delta_begin", (void *)_cffi_f_rs_delta_begin, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 35), (void *)_cffi_d_rs_delta_begin },
+  { "rs_delta_file", (void *)_cffi_f_rs_delta_file, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 88), (void *)_cffi_d_rs_delta_file },
+  { "rs_file_close", (void *)_cffi_f_rs_file_close, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 17), (void *)_cffi_d_rs_file_close },
+  { "rs_file_copy_cb", (void *)_cffi_f_rs_file_copy_cb, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 97), (void *)_cffi_d_rs_file_copy_cb },
+  { "rs_file_open", (void *)_cffi_f_rs_file_open, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 0), (void *)_cffi_d_rs_file_open },
+  { "rs_file_size", (void *)_cffi_f_rs_file_size, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 25), (void *)_cffi_d_rs_file_size },
+  { "rs_format_stats", (void *)_cffi_f_rs_format_stats, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 9), (void *)_cffi_d_rs_format_stats },
+  { "rs_free_sumset", (void *)_cffi_f_rs_free_sumset, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 147), (void *)_cffi_d_rs_free_sumset },
+  { "rs_hexify", (void *)_cffi_f_rs_hexify, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 123), (void *)_cffi_d_rs_hexify },
+  { "rs_inbuflen", (void *)_cffi_var_rs_inbuflen, _CFFI_OP(_CFFI_OP_GLOBAL_VAR_F, 3), (void *)0 },
+  { "rs_job_drive", (void *)_cffi_f_rs_job_drive, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 72), (void *)_cffi_d_rs_job_drive },
+  { "rs_job_free", (void *)_cffi_f_rs_job_free, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 94), (void *)_cffi_d_rs_job_free },
+  { "rs_job_iter", (void *)_cffi_f_rs_job_iter, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 68), (void *)_cffi_d_rs_job_iter },
+  { "rs_job_statistics", (void *)_cffi_f_rs_job_statistics, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 103), (void *)_cffi_d_rs_job_statistics },
+  { "rs_librsync_version", (void *)_cffi_var_rs_librsync_version, _CFFI_OP(_CFFI_OP_GLOBAL_VAR_F, 175), (void *)0 },
+  { "rs_loadsig_begin", (void *)_cffi_f_rs_loadsig_begin, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 32), (void *)_cffi_d_rs_loadsig_begin },
+  { "rs_loadsig_file", (void *)_cffi_f_rs_loadsig_file, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 57), (void *)_cffi_d_rs_loadsig_file },
+  { "rs_log_stats", (void *)_cffi_f_rs_log_stats, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 20), (void *)_cffi_d_rs_log_stats },
+  { "rs_mdfour", (void *)_cffi_f_rs_mdfour, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 153), (void *)_cffi_d_rs_mdfour },
+  { "rs_mdfour_begin", (void *)_cffi_f_rs_mdfour_begin, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 135), (void *)_cffi_d_rs_mdfour_begin },
+  { "rs_mdfour_result", (void *)_cffi_f_rs_mdfour_result, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 138), (void *)_cffi_d_rs_mdfour_result },
+  { "rs_mdfour_update", (void *)_cffi_f_rs_mdfour_update, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 142), (void *)_cffi_d_rs_mdfour_update },
+  { "rs_outbuflen", (void *)_cffi_var_rs_outbuflen, _CFFI_OP(_CFFI_OP_GLOBAL_VAR_F, 3), (void *)0 },
+  { "rs_patch_begin", (void *)_cffi_f_rs_patch_begin, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 28), (void *)_cffi_d_rs_patch_begin },
+  { "rs_patch_file", (void *)_cffi_f_rs_patch_file, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 43), (void *)_cffi_d_rs_patch_file },
+  { "rs_sig_args", (void *)_cffi_f_rs_sig_args, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 62), (void *)_cffi_d_rs_sig_args },
+  { "rs_sig_begin", (void *)_cffi_f_rs_sig_begin, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 38), (void *)_cffi_d_rs_sig_begin },
+  { "rs_sig_file", (void *)_cffi_f_rs_sig_file, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 49), (void *)_cffi_d_rs_sig_file },
+  { "rs_signature_log_stats", (void *)_cffi_f_rs_signature_log_stats, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 150), (void *)_cffi_d_rs_signature_log_stats },
+  { "rs_strerror", (void *)_cffi_f_rs_strerror, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 14), (void *)_cffi_d_rs_strerror },
+  { "rs_sumset_dump", (void *)_cffi_f_rs_sumset_dump, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 150), (void *)_cffi_d_rs_sumset_dump },
+  { "rs_supports_trace", (void *)_cffi_f_rs_supports_trace, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 23), (void *)_cffi_d_rs_supports_trace },
+  { "rs_trace_set_level", (void *)_cffi_f_rs_trace_set_level, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 128), (void *)_cffi_d_rs_trace_set_level },
+  { "rs_trace_stderr", (void *)_cffi_f_rs_trace_stderr, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 131), (void *)_cffi_d_rs_trace_stderr },
+  { "rs_trace_to", (void *)_cffi_f_rs_trace_to, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 166), (void *)_cffi_d_rs_trace_to },
+  { "rs_unbase64", (void *)_cffi_f_rs_unbase64, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 106), (void *)_cffi_d_rs_unbase64 },
+  { "trace_cb", (void *)_cffi_f_trace_cb, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 131), (void *)_cffi_d_trace_cb },
+  { "trace_init", (void *)_cffi_f_trace_init, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 23), (void *)_cffi_d_trace_init },
+  { "trace_pending", (void *)_cffi_f_trace_pending, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 114), (void *)_cffi_d_trace_pending },
+  { "trace_pop", (void *)_cffi_f_trace_pop, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 109), (void *)_cffi_d_trace_pop },
+};
+
+static const struct _cffi_field_s _cffi_fields[] = {
+  { "data", offsetof(buffer_args, data),
+            sizeof(((buffer_args *)0)->data),
+            _CFFI_OP(_CFFI_OP_NOOP, 1) },
+  { "len_", offsetof(buffer_args, len_),
+            sizeof(((buffer_args *)0)->len_),
+            _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "calls", offsetof(buffer_args, calls),
+             sizeof(((buffer_args *)0)->calls),
+             _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "nbytes", offsetof(buffer_args, nbytes),
+              sizeof(((buffer_args *)0)->nbytes),
+              _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "file", offsetof(input_args, file),
+            sizeof(((input_args *)0)->file),
+            _CFFI_OP(_CFFI_OP_NOOP, 30) },
+  { "buffer", offsetof(input_args, buffer),
+              sizeof(((input_args *)0)->buffer),
+              _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "len_", offsetof(input_args, len_),
+            sizeof(((input_args *)0)->len_),
+            _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "calls", offsetof(input_args, calls),
+             sizeof(((input_args *)0)->calls),
+             _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "nbytes", offsetof(input_args, nbytes),
+              sizeof(((input_args *)0)->nbytes),
+              _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "window", offsetof(input_args, window),
+              sizeof(((input_args *)0)->window),
+              _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "start", offsetof(input_args, start),
+             sizeof(((input_args *)0)->start),
+             _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "size", offsetof(input_args, size),
+            sizeof(((input_args *)0)->size),
+            _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "eof", offsetof(input_args, eof),
+           sizeof(((input_args *)0)->eof),
+           _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "hits", offsetof(input_args, hits),
+            sizeof(((input_args *)0)->hits),
+            _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "misses", offsetof(input_args, misses),
+              sizeof(((input_args *)0)->misses),
+              _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "read_bytes", offsetof(input_args, read_bytes),
+                  sizeof(((input_args *)0)->read_bytes),
+                  _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "level", offsetof(trace_entry, level),
+             sizeof(((trace_entry *)0)->level),
+             _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "msg", offsetof(trace_entry, msg),
+           sizeof(((trace_entry *)0)->msg),
+           _CFFI_OP(_CFFI_OP_NOOP, 173) },
+  { "count", offsetof(Rollsum, count),
+             sizeof(((Rollsum *)0)->count),
+             _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "s1", offsetof(Rollsum, s1),
+          sizeof(((Rollsum *)0)->s1),
+          _CFFI_OP(_CFFI_OP_NOOP, 197) },
+  { "s2", offsetof(Rollsum, s2),
+          sizeof(((Rollsum *)0)->s2),
+          _CFFI_OP(_CFFI_OP_NOOP, 197) },
+  { "size", offsetof(hashtable_t, size),
+            sizeof(((hashtable_t *)0)->size),
+            _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "count", offsetof(hashtable_t, count),
+             sizeof(((hashtable_t *)0)->count),
+             _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "count", offsetof(rabinkarp_t, count),
+             sizeof(((rabinkarp_t *)0)->count),
+             _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "hash", offsetof(rabinkarp_t, hash),
+            sizeof(((rabinkarp_t *)0)->hash),
+            _CFFI_OP(_CFFI_OP_NOOP, 191) },
+  { "mult", offsetof(rabinkarp_t, mult),
+            sizeof(((rabinkarp_t *)0)->mult),
+            _CFFI_OP(_CFFI_OP_NOOP, 191) },
+  { "next_in", offsetof(rs_buffers_t, next_in),
+               sizeof(((rs_buffers_t *)0)->next_in),
+               _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "avail_in", offsetof(rs_buffers_t, avail_in),
+                sizeof(((rs_buffers_t *)0)->avail_in),
+                _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "eof_in", offsetof(rs_buffers_t, eof_in),
+              sizeof(((rs_buffers_t *)0)->eof_in),
+              _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "next_out", offsetof(rs_buffers_t, next_out),
+                sizeof(((rs_buffers_t *)0)->next_out),
+                _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "avail_out", offsetof(rs_buffers_t, avail_out),
+                 sizeof(((rs_buffers_t *)0)->avail_out),
+                 _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "dogtag", offsetof(rs_job_t, dogtag),
+              sizeof(((rs_job_t *)0)->dogtag),
+              _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "job_name", offsetof(rs_job_t, job_name),
+                sizeof(((rs_job_t *)0)->job_name),
+                _CFFI_OP(_CFFI_OP_NOOP, 1) },
+  { "stream", offsetof(rs_job_t, stream),
+              sizeof(((rs_job_t *)0)->stream),
+              _CFFI_OP(_CFFI_OP_NOOP, 70) },
+  { "statefn", offsetof(rs_job_t, statefn),
+               sizeof(((rs_job_t *)0)->statefn),
+               _CFFI_OP(_CFFI_OP_NOOP, 184) },
+  { "final_result", offsetof(rs_job_t, final_result),
+                    sizeof(((rs_job_t *)0)->final_result),
+                    _CFFI_OP(_CFFI_OP_NOOP, 15) },
+  { "sig_magic", offsetof(rs_job_t, sig_magic),
+                 sizeof(((rs_job_t *)0)->sig_magic),
+                 _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "sig_block_len", offsetof(rs_job_t, sig_block_len),
+                     sizeof(((rs_job_t *)0)->sig_block_len),
+                     _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "sig_strong_len", offsetof(rs_job_t, sig_strong_len),
+                      sizeof(((rs_job_t *)0)->sig_strong_len),
+                      _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "sig_fsize", offsetof(rs_job_t, sig_fsize),
+                 sizeof(((rs_job_t *)0)->sig_fsize),
+                 _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "signature", offsetof(rs_job_t, signature),
+                 sizeof(((rs_job_t *)0)->signature),
+                 _CFFI_OP(_CFFI_OP_NOOP, 36) },
+  { "job_owns_sig", offsetof(rs_job_t, job_owns_sig),
+                    sizeof(((rs_job_t *)0)->job_owns_sig),
+                    _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "op", offsetof(rs_job_t, op),
+          sizeof(((rs_job_t *)0)->op),
+          _CFFI_OP(_CFFI_OP_NOOP, 199) },
+  { "weak_sig", offsetof(rs_job_t, weak_sig),
+                sizeof(((rs_job_t *)0)->weak_sig),
+                _CFFI_OP(_CFFI_OP_NOOP, 191) },
+  { "weak_sum", offsetof(rs_job_t, weak_sum),
+                sizeof(((rs_job_t *)0)->weak_sum),
+                _CFFI_OP(_CFFI_OP_NOOP, 207) },
+  { "param1", offsetof(rs_job_t, param1),
+              sizeof(((rs_job_t *)0)->param1),
+              _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "param2", offsetof(rs_job_t, param2),
+              sizeof(((rs_job_t *)0)->param2),
+              _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "cmd", offsetof(rs_job_t, cmd),
+           sizeof(((rs_job_t *)0)->cmd),
+           _CFFI_OP(_CFFI_OP_NOOP, 188) },
+  { "output_md4", offsetof(rs_job_t, output_md4),
+                  sizeof(((rs_job_t *)0)->output_md4),
+                  _CFFI_OP(_CFFI_OP_NOOP, 183) },
+  { "stats", offsetof(rs_job_t, stats),
+             sizeof(((rs_job_t *)0)->stats),
+             _CFFI_OP(_CFFI_OP_NOOP, 186) },
+  { "scoop_buf", offsetof(rs_job_t, scoop_buf),
+                 sizeof(((rs_job_t *)0)->scoop_buf),
+                 _CFFI_OP(_CFFI_OP_NOOP, 193) },
+  { "scoop_next", offsetof(rs_job_t, scoop_next),
+                  sizeof(((rs_job_t *)0)->scoop_next),
+                  _CFFI_OP(_CFFI_OP_NOOP, 193) },
+  { "scoop_alloc", offsetof(rs_job_t, scoop_alloc),
+                   sizeof(((rs_job_t *)0)->scoop_alloc),
+                   _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "scoop_avail", offsetof(rs_job_t, scoop_avail),
+                   sizeof(((rs_job_t *)0)->scoop_avail),
+                   _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "scan_buf", offsetof(rs_job_t, scan_buf),
+                sizeof(((rs_job_t *)0)->scan_buf),
+                _CFFI_OP(_CFFI_OP_NOOP, 193) },
+  { "scan_len", offsetof(rs_job_t, scan_len),
+                sizeof(((rs_job_t *)0)->scan_len),
+                _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "scan_pos", offsetof(rs_job_t, scan_pos),
+                sizeof(((rs_job_t *)0)->scan_pos),
+                _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "write_buf", offsetof(rs_job_t, write_buf),
+                 sizeof(((rs_job_t *)0)->write_buf),
+                 _CFFI_OP(_CFFI_OP_NOOP, 195) },
+  { "write_len", offsetof(rs_job_t, write_len),
+                 sizeof(((rs_job_t *)0)->write_len),
+                 _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "copy_len", offsetof(rs_job_t, copy_len),
+                sizeof(((rs_job_t *)0)->copy_len),
+                _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "basis_pos", offsetof(rs_job_t, basis_pos),
+                 sizeof(((rs_job_t *)0)->basis_pos),
+                 _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "basis_len", offsetof(rs_job_t, basis_len),
+                 sizeof(((rs_job_t *)0)->basis_len),
+                 _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "copy_cb", offsetof(rs_job_t, copy_cb),
+               sizeof(((rs_job_t *)0)->copy_cb),
+               _CFFI_OP(_CFFI_OP_NOOP, 29) },
+  { "copy_arg", offsetof(rs_job_t, copy_arg),
+                sizeof(((rs_job_t *)0)->copy_arg),
+                _CFFI_OP(_CFFI_OP_NOOP, 30) },
+  { "A", offsetof(rs_mdfour_t, A),
+         sizeof(((rs_mdfour_t *)0)->A),
+         _CFFI_OP(_CFFI_OP_NOOP, 204) },
+  { "B", offsetof(rs_mdfour_t, B),
+         sizeof(((rs_mdfour_t *)0)->B),
+         _CFFI_OP(_CFFI_OP_NOOP, 204) },
+  { "C", offsetof(rs_mdfour_t, C),
+         sizeof(((rs_mdfour_t *)0)->C),
+         _CFFI_OP(_CFFI_OP_NOOP, 204) },
+  { "D", offsetof(rs_mdfour_t, D),
+         sizeof(((rs_mdfour_t *)0)->D),
+         _CFFI_OP(_CFFI_OP_NOOP, 204) },
+  { "totalN", offsetof(rs_mdfour_t, totalN),
+              sizeof(((rs_mdfour_t *)0)->totalN),
+              _CFFI_OP(_CFFI_OP_NOOP, 192) },
+  { "tail_len", offsetof(rs_mdfour_t, tail_len),
+                sizeof(((rs_mdfour_t *)0)->tail_len),
+                _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "tail", offsetof(rs_mdfour_t, tail),
+            sizeof(((rs_mdfour_t *)0)->tail),
+            _CFFI_OP(_CFFI_OP_NOOP, 202) },
+  { "magic", offsetof(rs_signature_t, magic),
+             sizeof(((rs_signature_t *)0)->magic),
+             _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "block_len", offsetof(rs_signature_t, block_len),
+                 sizeof(((rs_signature_t *)0)->block_len),
+                 _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "strong_sum_len", offsetof(rs_signature_t, strong_sum_len),
+                      sizeof(((rs_signature_t *)0)->strong_sum_len),
+                      _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "count", offsetof(rs_signature_t, count),
+             sizeof(((rs_signature_t *)0)->count),
+             _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "size", offsetof(rs_signature_t, size),
+            sizeof(((rs_signature_t *)0)->size),
+            _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "block_sigs", offsetof(rs_signature_t, block_sigs),
+                  sizeof(((rs_signature_t *)0)->block_sigs),
+                  _CFFI_OP(_CFFI_OP_NOOP, 30) },
+  { "hashtable", offsetof(rs_signature_t, hashtable),
+                 sizeof(((rs_signature_t *)0)->hashtable),
+                 _CFFI_OP(_CFFI_OP_NOOP, 176) },
+  { "op", offsetof(rs_stats_t, op),
+          sizeof(((rs_stats_t *)0)->op),
+          _CFFI_OP(_CFFI_OP_NOOP, 1) },
+  { "lit_cmds", offsetof(rs_stats_t, lit_cmds),
+                sizeof(((rs_stats_t *)0)->lit_cmds),
+                _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "lit_bytes", offsetof(rs_stats_t, lit_bytes),
+                 sizeof(((rs_stats_t *)0)->lit_bytes),
+                 _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "lit_cmdbytes", offsetof(rs_stats_t, lit_cmdbytes),
+                    sizeof(((rs_stats_t *)0)->lit_cmdbytes),
+                    _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "copy_cmds", offsetof(rs_stats_t, copy_cmds),
+                 sizeof(((rs_stats_t *)0)->copy_cmds),
+                 _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "copy_bytes", offsetof(rs_stats_t, copy_bytes),
+                  sizeof(((rs_stats_t *)0)->copy_bytes),
+                  _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "copy_cmdbytes", offsetof(rs_stats_t, copy_cmdbytes),
+                     sizeof(((rs_stats_t *)0)->copy_cmdbytes),
+                     _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "sig_cmds", offsetof(rs_stats_t, sig_cmds),
+                sizeof(((rs_stats_t *)0)->sig_cmds),
+                _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "sig_bytes", offsetof(rs_stats_t, sig_bytes),
+                 sizeof(((rs_stats_t *)0)->sig_bytes),
+                 _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "false_matches", offsetof(rs_stats_t, false_matches),
+                     sizeof(((rs_stats_t *)0)->false_matches),
+                     _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "sig_blocks", offsetof(rs_stats_t, sig_blocks),
+                  sizeof(((rs_stats_t *)0)->sig_blocks),
+                  _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "block_len", offsetof(rs_stats_t, block_len),
+                 sizeof(((rs_stats_t *)0)->block_len),
+                 _CFFI_OP(_CFFI_OP_NOOP, 12) },
+  { "in_bytes", offsetof(rs_stats_t, in_bytes),
+                sizeof(((rs_stats_t *)0)->in_bytes),
+                _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "out_bytes", offsetof(rs_stats_t, out_bytes),
+                 sizeof(((rs_stats_t *)0)->out_bytes),
+                 _CFFI_OP(_CFFI_OP_NOOP, 63) },
+  { "start", offsetof(rs_stats_t, start),
+             sizeof(((rs_stats_t *)0)->start),
+             _CFFI_OP(_CFFI_OP_NOOP, 179) },
+  { "end", offsetof(rs_stats_t, end),
+           sizeof(((rs_stats_t *)0)->end),
+           _CFFI_OP(_CFFI_OP_NOOP, 179) },
+  { "kind", offsetof(weaksum_t, kind),
+            sizeof(((weaksum_t *)0)->kind),
+            _CFFI_OP(_CFFI_OP_NOOP, 206) },
+  { "sum", offsetof(weaksum_t, sum),
+           sizeof(((weaksum_t *)0)->sum),
+           _CFFI_OP(_CFFI_OP_NOOP, 198) },
+  { "rs", (size_t)-1,
+          (size_t)-1,
+          _CFFI_OP(_CFFI_OP_NOOP, 170) },
+  { "rk", (size_t)-1,
+          (size_t)-1,
+          _CFFI_OP(_CFFI_OP_NOOP, 180) },
+};
+
+static const struct _cffi_struct_union_s _cffi_struct_unions[] = {
+  { "$1", 198, _CFFI_F_UNION|_CFFI_F_CHECK_FIELDS,
+    (size_t)-2, -2, 96, 2 /* unnamed */ },
+  { "$buffer_args", 171, _CFFI_F_CHECK_FIELDS,
+    sizeof(buffer_args), offsetof(struct _cffi_align_typedef_buffer_args, y), 0, 4 },
+  { "$input_args", 178, _CFFI_F_CHECK_FIELDS,
+    sizeof(input_args), offsetof(struct _cffi_align_typedef_input_args, y), 4, 12 },
+  { "$trace_entry", 190, _CFFI_F_CHECK_FIELDS,
+    sizeof(trace_entry), offsetof(struct _cffi_align_typedef_trace_entry, y), 16, 2 },
+  { "Rollsum", 170, _CFFI_F_CHECK_FIELDS,
+    sizeof(Rollsum), offsetof(struct _cffi_align__Rollsum, y), 18, 3 },
+  { "_IO_FILE", 169, _CFFI_F_OPAQUE,
+    (size_t)-1, -1, -1, 0 /* opaque */ },
+  { "hashtable", 177, 0,
+    sizeof(hashtable_t), offsetof(struct _cffi_align__hashtable_t, y), 21, 2 },
+  { "rabinkarp", 180, _CFFI_F_CHECK_FIELDS,
+    sizeof(rabinkarp_t), offsetof(struct _cffi_align__rabinkarp_t, y), 23, 3 },
+  { "rs_buffers_s", 181, _CFFI_F_CHECK_FIELDS,
+    sizeof(rs_buffers_t), offsetof(struct _cffi_align__rs_buffers_t, y), 26, 5 },
+  { "rs_job", 182, _CFFI_F_CHECK_FIELDS,
+    sizeof(rs_job_t), offsetof(struct _cffi_align__rs_job_t, y), 31, 33 },
+  { "rs_mdfour", 183, _CFFI_F_CHECK_FIELDS,
+    sizeof(rs_mdfour_t), offsetof(struct _cffi_align__rs_mdfour_t, y), 64, 7 },
+  { "rs_prototab_ent", 189, _CFFI_F_OPAQUE,
+    (size_t)-1, -1, -1, 0 /* opaque */ },
+  { "rs_signature", 185, 0,
+    sizeof(rs_signature_t), offsetof(struct _cffi_align__rs_signature_t, y), 71, 7 },
+  { "rs_stats", 186, _CFFI_F_CHECK_FIELDS,
+    sizeof(rs_stats_t), offsetof(struct _cffi_align__rs_stats_t, y), 78, 16 },
+  { "weaksum", 207, _CFFI_F_CHECK_FIELDS,
+    sizeof(weaksum_t), offsetof(struct _cffi_align__weaksum_t, y), 94, 2 },
+};
+
+static const struct _cffi_enum_s _cffi_enums[] = {
+  { "$rs_loglevel", 129, _cffi_prim_int(sizeof(rs_loglevel), ((rs_loglevel)-1) <= 0),
+    "RS_LOG_EMERG,RS_LOG_ALERT,RS_LOG_CRIT,RS_LOG_ERR,RS_LOG_WARNING,RS_LOG_NOTICE,RS_LOG_INFO,RS_LOG_DEBUG" },
+  { "$rs_magic_number", 41, _cffi_prim_int(sizeof(rs_magic_number), ((rs_magic_number)-1) <= 0),
+    "RS_DELTA_MAGIC,RS_MD4_SIG_MAGIC,RS_BLAKE2_SIG_MAGIC,RS_RK_MD4_SIG_MAGIC,RS_RK_BLAKE2_SIG_MAGIC" },
+  { "$strongsum_kind_t", 187, _cffi_prim_int(sizeof(strongsum_kind_t), ((strongsum_kind_t)-1) <= 0),
+    "RS_MD4,RS_BLAKE2" },
+  { "$weaksum_kind_t", 206, _cffi_prim_int(sizeof(weaksum_kind_t), ((weaksum_kind_t)-1) <= 0),
+    "RS_ROLLSUM,RS_RABINKARP" },
+  { "rs_result", 15, _cffi_prim_int(sizeof(rs_result), ((rs_result)-1) <= 0),
+    "RS_DONE,RS_BLOCKED,RS_RUNNING,RS_TEST_SKIPPED,RS_IO_ERROR,RS_SYNTAX_ERROR,RS_MEM_ERROR,RS_INPUT_ENDED,"
+    "RS_BAD_MAGIC,RS_UNIMPLEMENTED,RS_CORRUPT,RS_INTERNAL_ERROR,RS_PARAM_ERROR" },
+};
+
+static const struct _cffi_typename_s _cffi_typenames[] = {
+  { "FILE", 169 },
+  { "Rollsum", 170 },
+  { "buffer_args", 171 },
+  { "hashtable_t", 177 },
+  { "input_args", 178 },
+  { "rabinkarp_t", 180 },
+  { "rs_buffers_t", 181 },
+  { "rs_byte_t", 194 },
+  { "rs_copy_cb", 97 },
+  { "rs_driven_cb", 80 },
+  { "rs_job_t", 182 },
+  { "rs_loglevel", 129 },
+  { "rs_long_t", 63 },
+  { "rs_magic_number", 41 },
+  { "rs_mdfour_t", 183 },
+  { "rs_result", 15 },
+  { "rs_signature_t", 185 },
+  { "rs_stats_t", 186 },
+  { "rs_strong_sum_t", 200 },
+  { "rs_trace_fn_t", 131 },
+  { "rs_weak_sum_t", 191 },
+  { "strongsum_kind_t", 187 },
+  { "trace_entry", 190 },
+  { "weaksum_kind_t", 206 },
+  { "weaksum_t", 207 },
+};
+
+static const struct _cffi_type_context_s _cffi_type_context = {
+  _cffi_types,
+  _cffi_globals,
+  _cffi_fields,
+  _cffi_struct_unions,
+  _cffi_enums,
+  _cffi_typenames,
+  84,  /* num_globals */
+  15,  /* num_struct_unions */
+  5,  /* num_enums */
+  25,  /* num_typenames */
+  NULL,  /* no includes */
+  208,  /* num_types */
+  1,  /* flags */
+};
+
+#ifdef __GNUC__
+#  pragma GCC visibility push(default)  /* for -fvisibility= */
+#endif
+
+#ifdef PYPY_VERSION
+PyMODINIT_FUNC
+_cffi_pypyinit__rsync(const void *p[])
+{
+    if (((intptr_t)p[0]) >= 0x0A03) {
+        _cffi_call_python_org = (void(*)(struct _cffi_externpy_s *, char *))p[1];
+    }
+    p[0] = (const void *)0x2601;
+    p[1] = &_cffi_type_context;
+    return NULL;
+}
+#  ifdef _MSC_VER
+     PyMODINIT_FUNC
+     PyInit__rsync(void) { return NULL; }
+#  endif
+#else
+PyMODINIT_FUNC
+PyInit__rsync(void)
+{
+  return _cffi_init("pyrsync.backends.cffi._rsync", 0x2601, &_cffi_type_context);
+}
+#endif
+
+#ifdef __GNUC__
+#  pragma GCC visibility pop
+#endif
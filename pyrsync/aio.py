@@ -0,0 +1,153 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import asyncio
+from inspect import isawaitable, iscoroutinefunction
+
+from pyrsync.backends import (
+    RS_JOB_BLOCKSIZE,
+    DeltaJob,
+    PatchJob,
+    Signature,
+    SignatureJob,
+)
+
+__all__ = ["signature", "delta", "patch"]
+
+
+async def _read(reader, size: int) -> bytes:
+    data = reader.read(size)
+    if isawaitable(data):
+        data = await data
+    return data
+
+
+async def _write(writer, data: bytes) -> None:
+    result = writer.write(data)
+    if isawaitable(result):
+        await result
+    # backpressure: wait for the transport buffer to drain before producing more
+    drain = getattr(writer, "drain", None)
+    if drain is not None:
+        await drain()
+
+
+class _BlockingReader:
+    """
+    A blocking ``read`` over an async reader, for code running in an executor while
+    the loop serves the reads.
+    """
+
+    __slots__ = ("reader", "loop")
+
+    def __init__(self, reader, loop):
+        self.reader = reader
+        self.loop = loop
+
+    def read(self, size: int) -> bytes:
+        return asyncio.run_coroutine_threadsafe(_read(self.reader, size), self.loop).result()
+
+
+async def _pump(job, reader, writer, buffer_size: int, executor):
+    """
+    Drive a push-style job: read the next chunk while the current one is
+    crunched in the executor, with the GIL released, then write its output.
+    """
+    loop = asyncio.get_running_loop()
+    data = await _read(reader, buffer_size)
+    while data:
+        next_read = asyncio.ensure_future(_read(reader, buffer_size))
+        try:
+            out = await loop.run_in_executor(executor, job.feed, data)
+            if out:
+                await _write(writer, out)
+            data = await next_read
+        finally:
+            next_read.cancel()
+    out = await loop.run_in_executor(executor, job.finish)
+    if out:
+        await _write(writer, out)
+    return job.statistics()
+
+
+async def signature(
+    reader,
+    writer,
+    strong_len: int,
+    sig_magic: int,
+    block_size: int = None,
+    buffer_size: int = RS_JOB_BLOCKSIZE,
+    executor=None,
+):
+    """
+    Generate a signature for the data read from reader. The signature will be written to writer.
+    :param reader: an object whose ``read(n)`` is a coroutine, such as ``asyncio.StreamReader``
+    :param writer: an object with ``write`` and optionally ``drain``, such as ``asyncio.StreamWriter``
+    :param strong_len:
+    :param sig_magic:
+    :param block_size: defaults to librsync's RS_DEFAULT_BLOCK_LEN
+    :param buffer_size: size of the chunks read from reader
+    :param executor: where the hashing runs, the default executor of the loop if None
+    :return: the job statistics
+    """
+    if block_size is None:
+        job = SignatureJob(strong_len, sig_magic)
+    else:
+        job = SignatureJob(strong_len, sig_magic, block_size)
+    return await _pump(job, reader, writer, buffer_size, executor)
+
+
+async def delta(
+    reader,
+    sigfile,
+    writer,
+    buffer_size: int = RS_JOB_BLOCKSIZE,
+    executor=None,
+):
+    """
+    Create a delta for the data read from reader using the signature sigfile. The delta
+    will be written to writer.
+    :param reader: an object whose ``read(n)`` is a coroutine, such as ``asyncio.StreamReader``
+    :param sigfile: a loaded Signature, a bytes-like object, a file-like object or an async reader;
+        an async reader is loaded chunk by chunk in the executor, without buffering it whole
+    :param writer: an object with ``write`` and optionally ``drain``, such as ``asyncio.StreamWriter``
+    :param buffer_size: size of the chunks read from reader
+    :param executor: where the matching runs, the default executor of the loop if None
+    :return: the job statistics
+    """
+    loop = asyncio.get_running_loop()
+    owned = not isinstance(sigfile, Signature)
+    if owned:
+        if hasattr(sigfile, "read") and iscoroutinefunction(sigfile.read):
+            sigfile = _BlockingReader(sigfile, loop)
+        # loading the signature builds its hash table, keep it off the loop too
+        sigfile = await loop.run_in_executor(executor, Signature, sigfile)
+    try:
+        return await _pump(DeltaJob(sigfile), reader, writer, buffer_size, executor)
+    finally:
+        if owned:
+            sigfile.close()
+
+
+async def patch(
+    basis,
+    reader,
+    writer,
+    buffer_size: int = RS_JOB_BLOCKSIZE,
+    executor=None,
+    use_mmap: bool = True,
+    readahead: int = 0,
+):
+    """
+    Patch basis using the delta read from reader. The patched data will be written to writer.
+    :param basis: a seekable file-like object, or a bytes-like object
+    :param reader: an object whose ``read(n)`` is a coroutine, such as ``asyncio.StreamReader``
+    :param writer: an object with ``write`` and optionally ``drain``, such as ``asyncio.StreamWriter``
+    :param buffer_size: size of the chunks read from reader
+    :param executor: where the patching runs, the default executor of the loop if None
+    :param use_mmap: map basis into memory when it is a regular file
+    :param readahead: read basis by aligned windows of this size when it is not mapped
+    :return: the job statistics
+    """
+    job = PatchJob(basis, use_mmap, readahead)
+    return await _pump(job, reader, writer, buffer_size, executor)
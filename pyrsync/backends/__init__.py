@@ -21,23 +21,59 @@ if not _should_use_cffi():
     from pyrsync.backends.cython import (
         RS_BLAKE2_SIG_MAGIC,
         RS_DELTA_MAGIC,
+        RS_JOB_BLOCKSIZE,
+        RS_JOB_MAX_BLOCKSIZE,
         RS_MD4_SIG_MAGIC,
         RS_RK_BLAKE2_SIG_MAGIC,
         RS_RK_MD4_SIG_MAGIC,
+        DeltaJob,
+        PatchJob,
+        Signature,
+        SignatureJob,
+        Stats,
         delta,
+        delta_bytes,
+        delta_file,
+        flush_trace,
+        get_observer,
         get_signature_args,
         patch,
+        patch_bytes,
+        patch_file,
+        set_observer,
+        set_trace_level,
         signature,
+        signature_bytes,
+        signature_file,
+        supports_trace,
     )
 else:
     from pyrsync.backends.cffi import (
         RS_BLAKE2_SIG_MAGIC,
         RS_DELTA_MAGIC,
+        RS_JOB_BLOCKSIZE,
+        RS_JOB_MAX_BLOCKSIZE,
         RS_MD4_SIG_MAGIC,
         RS_RK_BLAKE2_SIG_MAGIC,
         RS_RK_MD4_SIG_MAGIC,
+        DeltaJob,
+        PatchJob,
+        Signature,
+        SignatureJob,
+        Stats,
         delta,
+        delta_bytes,
+        delta_file,
+        flush_trace,
+        get_observer,
         get_signature_args,
         patch,
+        patch_bytes,
+        patch_file,
+        set_observer,
+        set_trace_level,
         signature,
+        signature_bytes,
+        signature_file,
+        supports_trace,
     )
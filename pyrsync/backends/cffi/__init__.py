@@ -1,6 +1,15 @@
 """
 Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
 """
+import json
+import logging
+import mmap
+import os
+from io import BytesIO
+from stat import S_ISREG
+from threading import Lock
+from time import perf_counter
+
 from pyrsync.backends.cffi._rsync import ffi, lib
 
 
@@ -33,7 +42,117 @@ class LibrsyncError(Exception):
             return "RS_PARAM_ERROR"
 
 
+O_BINARY = getattr(os, "O_BINARY", 0)
+
 RS_JOB_BLOCKSIZE = 65535
+RS_JOB_MAX_BLOCKSIZE = 8 * 1024 * 1024  # cap of the adaptive buffer size
+ADAPTIVE_ROUNDS = 4  # full rounds measured before deciding to grow the buffer
+
+_observer = None  # receives the events of every job loop, see set_observer
+
+
+def set_observer(observer) -> None:
+    """
+    Install an observer for every job loop, or remove it with None.
+    An observer has the methods of ``pyrsync.metrics.Observer``.
+    """
+    global _observer
+    _observer = observer
+
+
+def get_observer():
+    return _observer
+
+
+TRACE_BATCH = 64  # librsync messages moved out of the ring at once
+
+trace_logger = logging.getLogger("pyrsync.librsync")
+# logging level of each rs_loglevel, from RS_LOG_EMERG to RS_LOG_DEBUG
+TRACE_LEVELS = (
+    logging.CRITICAL,
+    logging.CRITICAL,
+    logging.CRITICAL,
+    logging.ERROR,
+    logging.WARNING,
+    logging.INFO,
+    logging.INFO,
+    logging.DEBUG,
+)
+
+
+def flush_trace() -> int:
+    """
+    Emit the queued librsync messages to the "pyrsync.librsync" logger. Jobs flush
+    after every step and the *_file functions when they return; a whole-file run can
+    be flushed from another thread while it goes.
+    :return: the number of messages emitted
+    """
+    install_trace()
+    batch = ffi.new("trace_entry[]", TRACE_BATCH)
+    dropped = ffi.new("size_t*")
+    total = 0
+    while True:
+        n = lib.trace_pop(batch, TRACE_BATCH, dropped)
+        for i in range(n):
+            trace_logger.log(
+                TRACE_LEVELS[batch[i].level & 7],
+                ffi.string(batch[i].msg).decode(errors="replace").rstrip(),
+            )
+        total += n
+        if dropped[0]:
+            trace_logger.warning("%d librsync messages dropped", dropped[0])
+        if n < TRACE_BATCH:
+            return total
+
+
+def maybe_flush_trace() -> None:
+    if lib.trace_pending():
+        flush_trace()
+
+
+_trace_installed = False
+
+
+def install_trace() -> None:
+    """
+    Route librsync's messages to the ring. librsync has a single trace sink for the whole
+    process, so it is only taken over once pyrsync's logging is asked for.
+    """
+    global _trace_installed
+    if not _trace_installed:
+        lib.rs_trace_to(ffi.addressof(lib, "trace_cb"))
+        _trace_installed = True
+
+
+def set_trace_level(level: int) -> None:
+    """
+    Set the lowest level of the librsync messages routed to the "pyrsync.librsync" logger.
+    The first call, like that of ``flush_trace``, takes over librsync's trace sink.
+    :param level: a logging level, such as logging.DEBUG
+    """
+    if level <= logging.DEBUG:
+        c_level = lib.RS_LOG_DEBUG
+    elif level <= logging.INFO:
+        c_level = lib.RS_LOG_INFO
+    elif level <= logging.WARNING:
+        c_level = lib.RS_LOG_WARNING
+    elif level <= logging.ERROR:
+        c_level = lib.RS_LOG_ERR
+    else:
+        c_level = lib.RS_LOG_CRIT
+    install_trace()
+    lib.rs_trace_set_level(c_level)
+
+
+def supports_trace() -> bool:
+    """
+    Whether librsync was built with debug messages, without them DEBUG shows nothing more.
+    """
+    return bool(lib.rs_supports_trace())
+
+
+if not lib.trace_init():
+    raise MemoryError
 
 RS_DELTA_MAGIC = lib.RS_DELTA_MAGIC
 RS_MD4_SIG_MAGIC = lib.RS_MD4_SIG_MAGIC
@@ -42,22 +161,68 @@ RS_RK_MD4_SIG_MAGIC = lib.RS_RK_MD4_SIG_MAGIC
 RS_RK_BLAKE2_SIG_MAGIC = lib.RS_RK_BLAKE2_SIG_MAGIC
 
 
-def PyFile_Check(file) -> bool:
-    if hasattr(file, "read") and hasattr(file, "write") and hasattr(file, "seek"):
+def PyReadable_Check(file) -> bool:
+    # execute reads with readinto when there is one, else with read
+    if hasattr(file, "read") or hasattr(file, "readinto"):
+        return True
+    return False
+
+
+def PyWritable_Check(file) -> bool:
+    if hasattr(file, "write"):
         return True
     return False
 
 
 class Stats:
+    """
+    A snapshot of the statistics of a job, detached from it: it stays valid once the
+    job is freed, and can be pickled or exported as a dict or JSON.
+    """
+
+    __slots__ = ("state", "_op", "buffer_size", "elapsed")
+
     @staticmethod
-    def from_ptr(state):
+    def from_ptr(state, elapsed: float = 0.0, buffer_size: int = 0):
         self = Stats.__new__(Stats)
-        self.state = state
+        self.state = ffi.new("rs_stats_t*", state[0])
+        self._op = None  # op of a snapshot rebuilt from a dict
+        self.elapsed = elapsed  # wall time of the job in seconds
+        self.buffer_size = buffer_size  # the job buffer size finally used
+        return self
+
+    @staticmethod
+    def from_dict(d: dict):
+        """
+        Rebuild a snapshot exported by ``as_dict``.
+        """
+        self = Stats.__new__(Stats)
+        self.state = ffi.new("rs_stats_t*")
+        self._op = d["op"]
+        self.state.lit_cmds = d["lit_cmds"]
+        self.state.lit_bytes = d["lit_bytes"]
+        self.state.lit_cmdbytes = d["lit_cmdbytes"]
+        self.state.copy_cmds = d["copy_cmds"]
+        self.state.copy_bytes = d["copy_bytes"]
+        self.state.copy_cmdbytes = d["copy_cmdbytes"]
+        self.state.sig_cmds = d["sig_cmds"]
+        self.state.sig_bytes = d["sig_bytes"]
+        self.state.false_matches = d["false_matches"]
+        self.state.sig_blocks = d["sig_blocks"]
+        self.state.block_len = d["block_len"]
+        self.state.in_bytes = d["in_bytes"]
+        self.state.out_bytes = d["out_bytes"]
+        self.state.start = d["start"]
+        self.state.end = d["end"]
+        self.buffer_size = d["buffer_size"]
+        self.elapsed = d["elapsed"]
         return self
 
     @property
     def op(self):
-        return ffi.string(self.state.op).decode()
+        if self._op is not None:
+            return self._op
+        return ffi.string(self.state.op).decode() if self.state.op != ffi.NULL else ""
 
     @property
     def lit_cmds(self):
@@ -119,9 +284,68 @@ class Stats:
     def end(self):
         return self.state.end
 
+    @property
+    def throughput(self):
+        """
+        Input bytes processed per second of wall time.
+        """
+        return self.state.in_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "op": self.op,
+            "lit_cmds": self.state.lit_cmds,
+            "lit_bytes": self.state.lit_bytes,
+            "lit_cmdbytes": self.state.lit_cmdbytes,
+            "copy_cmds": self.state.copy_cmds,
+            "copy_bytes": self.state.copy_bytes,
+            "copy_cmdbytes": self.state.copy_cmdbytes,
+            "sig_cmds": self.state.sig_cmds,
+            "sig_bytes": self.state.sig_bytes,
+            "false_matches": self.state.false_matches,
+            "sig_blocks": self.state.sig_blocks,
+            "block_len": self.state.block_len,
+            "in_bytes": self.state.in_bytes,
+            "out_bytes": self.state.out_bytes,
+            "start": self.state.start,
+            "end": self.state.end,
+            "buffer_size": self.buffer_size,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def log(self) -> None:
+        """
+        Log librsync's summary of these statistics to the "pyrsync.librsync" logger, at INFO level.
+        """
+        install_trace()
+        lib.rs_log_stats(self.state)
+        flush_trace()
+
+    def __reduce__(self):
+        return Stats.from_dict, (self.as_dict(),)
+
+    def __repr__(self):
+        return "Stats(%s)" % ", ".join("%s=%r" % item for item in self.as_dict().items())
+
 
 class Job:
     # cdef  rs_job_t * job
+    _out = None  # output buffer of feed/finish
+    _pending = None  # input left unconsumed by the last feed
+    _done = False
+    buffer_size = 0
+    _finished = 0.0  # wall clock of the job, for Stats.elapsed
+    _in_bytes = _out_bytes = 0  # only counted by librsync for whole files
+    _basis = None  # the basis of a patch
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        self._started = perf_counter()
+        return self
 
     @staticmethod
     def from_ptr(job):
@@ -130,58 +354,256 @@ class Job:
         return self
 
     def iter(self, buffer):
+        avail_in = buffer.avail_in
+        avail_out = buffer.avail_out
         result = lib.rs_job_iter(self.job, buffer)
+        maybe_flush_trace()
+        self._in_bytes += avail_in - buffer.avail_in
+        self._out_bytes += avail_out - buffer.avail_out
         return result
 
     def statistics(self):
         state = lib.rs_job_statistics(self.job)
-        return Stats.from_ptr(state)
+        end = self._finished or perf_counter()
+        stats = Stats.from_ptr(state, end - self._started, self.buffer_size)
+        stats.state.in_bytes = self._in_bytes
+        stats.state.out_bytes = self._out_bytes
+        return stats
 
-    def execute(self, input, output=None) -> None:
-        if not PyFile_Check(input):
+    def execute(
+        self,
+        input,
+        output=None,
+        buffer_size: int = RS_JOB_BLOCKSIZE,
+        adaptive: bool = False,
+        observer=None,
+    ) -> None:
+        """
+        Pull input until EOF through the job, pushing the output to output.
+        :param buffer_size: size of the input and output buffers
+        :param adaptive: grow the buffers toward RS_JOB_MAX_BLOCKSIZE as long as throughput improves
+        :param observer: receives the events of the loop, the global observer if None
+        """
+        if not PyReadable_Check(input):
             raise TypeError(
-                "input except a file-like object, got %s" % type(input).__name__
+                "input except a readable file-like object, got %s"
+                % type(input).__name__
             )
-        if output is not None and not PyFile_Check(output):
+        if output is not None and not PyWritable_Check(output):
             raise TypeError(
-                "sigfile except a file-like object, got %s" % type(output).__name__
+                "sigfile except a writable file-like object, got %s"
+                % type(output).__name__
             )
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
         # cdef:
         #     rs_buffers_t buffer
         #     void * out  # sigfile buffer
         #     bytes block
         #     rs_result result
         buffer = ffi.new("rs_buffers_t*")
-        out = ffi.new("char[]", RS_JOB_BLOCKSIZE)
-        if not out:
-            raise MemoryError
+        # input buffer, starts with the bytes librsync left unconsumed
+        inbuf = bytearray(buffer_size)
+        out = bytearray(buffer_size)  # sigfile buffer
+        c_inbuf = ffi.from_buffer(inbuf)
+        c_out = ffi.from_buffer(out)
+        inview = memoryview(inbuf)
+        outview = memoryview(out)
+        readinto = getattr(input, "readinto", None)
+        pending = 0
+        eof = False
+        # adaptive sizing: throughput of the full rounds at the current size
+        started = elapsed = best_rate = 0.0
+        measured = rounds = 0
+        # instrumentation, only timed when there is an observer
+        obs = observer if observer is not None else _observer
+        self.buffer_size = buffer_size
+        if obs is not None:
+            obs.start(ffi.string(lib.rs_job_statistics(self.job).op).decode())
+        try:
+            while True:
+                if adaptive:
+                    started = perf_counter()
+                if obs is not None:
+                    t_read = perf_counter()
+                if not eof and pending < buffer_size:
+                    if readinto is not None:
+                        # read straight into our buffer, no intermediate bytes object
+                        block_size = readinto(inview[pending:]) or 0
+                    else:
+                        block = input.read(buffer_size - pending)  # type: bytes
+                        block_size = len(block)
+                        ffi.memmove(c_inbuf + pending, block, block_size)
+                    if block_size:
+                        pending += block_size
+                    else:
+                        eof = True
+                full = pending == buffer_size
+                buffer.next_in = c_inbuf
+                buffer.avail_in = pending
+                buffer.eof_in = eof
+                buffer.next_out = c_out
+                buffer.avail_out = buffer_size
+                if obs is not None:
+                    t_iter = perf_counter()
+                result = self.iter(buffer)
+                produced = buffer_size - buffer.avail_out
+                if obs is not None:
+                    t_write = perf_counter()
+                if output is not None and produced:
+                    # the view is only valid during the call, writers must copy what they keep
+                    output.write(outview[:produced])
+                if obs is not None:
+                    obs.chunk(
+                        t_iter - t_read,
+                        t_write - t_iter,
+                        perf_counter() - t_write,
+                        pending - buffer.avail_in,
+                        produced,
+                    )
+                if result == lib.RS_DONE:
+                    self._finished = perf_counter()
+                    break
+                elif result != lib.RS_BLOCKED:
+                    raise LibrsyncError(result)
+                if adaptive and full:
+                    rounds += 1
+                    measured += pending - buffer.avail_in
+                    elapsed += perf_counter() - started
+                    if rounds == ADAPTIVE_ROUNDS:
+                        rate = measured / elapsed if elapsed > 0 else 0
+                        if rate > best_rate * 1.1 and buffer_size < RS_JOB_MAX_BLOCKSIZE:
+                            # still getting faster, double the buffers
+                            best_rate = rate
+                            buffer_size = min(buffer_size * 2, RS_JOB_MAX_BLOCKSIZE)
+                            offset = buffer.next_in - c_inbuf
+                            inview.release()
+                            outview.release()
+                            new_inbuf = bytearray(buffer_size)
+                            new_inbuf[: offset + buffer.avail_in] = inbuf[
+                                : offset + buffer.avail_in
+                            ]
+                            inbuf = new_inbuf
+                            out = bytearray(buffer_size)
+                            c_inbuf = ffi.from_buffer(inbuf)
+                            c_out = ffi.from_buffer(out)
+                            buffer.next_in = c_inbuf + offset
+                            inview = memoryview(inbuf)
+                            outview = memoryview(out)
+                            self.buffer_size = buffer_size
+                        else:
+                            adaptive = False
+                        rounds = measured = 0
+                        elapsed = 0.0
+                # Carry the bytes librsync did not consume over to the next round,
+                # so the input is never rewound and needs not be seekable.
+                pending = buffer.avail_in
+                if pending > 0 and buffer.next_in != c_inbuf:
+                    ffi.memmove(c_inbuf, buffer.next_in, pending)
+        except BaseException as e:
+            if obs is not None:
+                obs.error(e)
+            raise
+        finally:
+            inview.release()
+            outview.release()
+            # every start gets its end, a failed job too
+            if obs is not None:
+                if self._basis is not None:
+                    obs.copies(*self._basis.copies())
+                    if self._basis.reads_ahead():
+                        obs.readahead(*self._basis.readahead())
+                obs.end(self.statistics())
+
+    def _run(self, data, eof: bool) -> bytes:
+        if self._done:
+            raise ValueError("the job is already finished")
+        if self._pending is not None:
+            data = self._pending + bytes(data)
+            self._pending = None
+        if self._out is None:
+            self._out = ffi.new("char[]", RS_JOB_BLOCKSIZE)
+            self.buffer_size = RS_JOB_BLOCKSIZE
+        out = self._out
+        chunks = []
+        buffer = ffi.new("rs_buffers_t*")
+        block = ffi.from_buffer(data)
+        buffer.next_in = block
+        buffer.avail_in = len(block)
+        buffer.eof_in = eof
         while True:
-            block = input.read(RS_JOB_BLOCKSIZE)  # type: bytes
-            buffer.next_in = ffi.from_buffer(block)
-            buffer.avail_in = len(block)
-            buffer.eof_in = not block
             buffer.next_out = out
             buffer.avail_out = RS_JOB_BLOCKSIZE
             result = self.iter(buffer)
-            if output is not None:
-                output.write(
-                    ffi.unpack(
-                        out, RS_JOB_BLOCKSIZE - buffer.avail_out
-                    )
-                )
+            if buffer.avail_out < RS_JOB_BLOCKSIZE:
+                chunks.append(ffi.unpack(out, RS_JOB_BLOCKSIZE - buffer.avail_out))
+            if result == lib.RS_DONE:
+                self._done = True
+                self._finished = perf_counter()
+                break
+            elif result != lib.RS_BLOCKED:
+                raise LibrsyncError(result)
+            if buffer.avail_out > 0:
+                # librsync is waiting for more input
+                if eof:
+                    raise LibrsyncError(lib.RS_INPUT_ENDED)
+                break
+        if buffer.avail_in > 0 and not self._done:
+            self._pending = ffi.unpack(buffer.next_in, buffer.avail_in)
+        return b"".join(chunks)
+
+    def feed(self, data) -> bytes:
+        """
+        Push a chunk of input into the job.
+        :param data: a bytes-like object
+        :return: the output produced so far
+        """
+        return self._run(data, False)
+
+    def finish(self) -> bytes:
+        """
+        Signal the end of input and flush the job.
+        :return: the rest of the output
+        """
+        if self._done:
+            return b""
+        return self._run(b"", True)
+
+    def _transform(self, data, size_hint: int) -> bytes:
+        """
+        Run the job over the whole of data at once, writing straight into an output
+        of size_hint bytes which only grows when the hint was too small.
+        """
+        size = size_hint if size_hint > 0 else 64
+        produced = 0
+        out = ffi.new("char[]", size)
+        buffer = ffi.new("rs_buffers_t*")
+        block = data if isinstance(data, ffi.CData) else ffi.from_buffer(data)
+        buffer.next_in = block
+        buffer.avail_in = len(block)
+        buffer.eof_in = True
+        while True:
+            buffer.next_out = out + produced
+            buffer.avail_out = size - produced
+            result = self.iter(buffer)
+            produced = size - buffer.avail_out
             if result == lib.RS_DONE:
+                self._finished = perf_counter()
                 break
             elif result != lib.RS_BLOCKED:
                 raise LibrsyncError(result)
-            if buffer.avail_in > 0:
-                # There is data left in the input buffer, librsync did not consume
-                # all of it. Rewind the file a bit so we include that data in our
-                # next read. It would be better to simply tack data to the end of
-                # this buffer, but that is very difficult in Python.
-                input.seek(input.tell() - buffer.avail_in)
+            if buffer.avail_out > 0:
+                raise LibrsyncError(lib.RS_INPUT_ENDED)
+            # the output is full, double it
+            size *= 2
+            grown = ffi.new("char[]", size)
+            ffi.memmove(grown, out, produced)
+            out = grown
+        self.buffer_size = size
+        return ffi.unpack(out, produced)
 
     def __del__(self):
-        if self.job:
+        if getattr(self, "job", ffi.NULL):
             lib.rs_job_free(self.job)
         self.job = ffi.NULL
 
@@ -207,7 +629,10 @@ def signature(
     strong_len: int,
     sig_magic: int,
     block_size: int = lib.RS_DEFAULT_BLOCK_LEN,
-) -> None:
+    buffer_size: int = RS_JOB_BLOCKSIZE,
+    adaptive: bool = False,
+    observer=None,
+) -> Stats:
     """
      Generate a signature for the file input. The signature will be written to output.
     You can specify the size of the blocks using the optional `block_size` parameter.
@@ -216,50 +641,177 @@ def signature(
     :param strong_len:
     :param sig_magic:
     :param block_size:
-    :return:
+    :param buffer_size: size of the I/O buffers
+    :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+    :param observer: receives the events of the job loop, the global observer if None
+    :return: the job statistics
     """
     # cdef rs_job_t * c_job
     # with nogil:
     c_job = lib.rs_sig_begin(block_size, strong_len, sig_magic)
     job = Job.from_ptr(c_job)
-    job.execute(input, output)
+    job.execute(input, output, buffer_size, adaptive, observer)
+    return job.statistics()
+
+
+class Signature:
+    """
+    A signature loaded and indexed once, ready to serve any number of ``delta`` calls.
+    librsync is built without its match stats counters (HASHTABLE_NSTATS), so a delta
+    only reads the loaded signature and it can be shared by several threads at once.
+    Call ``close`` or use it as a context manager to free it.
+    """
+
+    def __init__(self, sigfile):
+        """
+        :param sigfile: a file-like object or a bytes-like object holding the signature
+        """
+        self._lock = Lock()
+        self._users = 0
+        self._closed = False
+        self._sig = ffi.new("rs_signature_t**")
+        c_job = lib.rs_loadsig_begin(self._sig)
+        try:
+            job = Job.from_ptr(c_job)
+            if not PyReadable_Check(sigfile):
+                job._transform(sigfile, 0)
+            else:
+                job.execute(sigfile)
+            result = lib.rs_build_hash_table(self._sig[0])
+            if result != lib.RS_DONE:
+                raise LibrsyncError(result)
+        except BaseException:
+            self._free()
+            raise
+        self.magic = self._sig[0].magic
+        self.block_len = self._sig[0].block_len
+        self.strong_len = self._sig[0].strong_sum_len
+        self.block_count = self._sig[0].count
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise ValueError("I/O operation on closed signature")
+            self._users += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if self._closed and self._users == 0:
+                self._free()
+
+    def _free(self) -> None:
+        if self._sig[0] != ffi.NULL:
+            lib.rs_free_sumset(self._sig[0])
+        self._sig[0] = ffi.NULL
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
 
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory footprint of the loaded signature and its hash table, 0 once
+        it is freed. A closed signature still used by a delta is not freed yet.
+        """
+        weak_size = ffi.sizeof("rs_weak_sum_t")
+        mask = weak_size - 1
+        total = ffi.sizeof("rs_signature_t")
+        with self._lock:
+            sig = self._sig[0]
+            if sig == ffi.NULL:
+                return 0
+            total += sig.size * (weak_size + ((sig.strong_sum_len + mask) & ~mask))
+            table = sig.hashtable
+            if table != ffi.NULL:
+                total += (
+                    ffi.sizeof("hashtable_t")
+                    + table.size * (ffi.sizeof("unsigned") + ffi.sizeof("void *"))
+                    + (table.size + 7) // 8
+                )
+        return total
+
+    def delta(
+        self,
+        input,
+        output,
+        buffer_size: int = RS_JOB_BLOCKSIZE,
+        adaptive: bool = False,
+        observer=None,
+    ) -> Stats:
+        """
+        Create a delta for the file input using this signature. The delta will be written to output.
+        :param input:
+        :param output: delta file
+        :param buffer_size: size of the I/O buffers
+        :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+        :param observer: receives the events of the job loop, the global observer if None
+        :return: the job statistics
+        """
+        self._acquire()
+        try:
+            c_job = lib.rs_delta_begin(self._sig[0])
+            job = Job.from_ptr(c_job)
+            job.execute(input, output, buffer_size, adaptive, observer)
+            return job.statistics()
+        finally:
+            self._release()
+
+    def close(self) -> None:
+        """
+        Free the signature. If a delta is still running, it is freed once that delta is done.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._users == 0:
+                self._free()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-def delta(input, sigfile, output) -> None:
+    def __del__(self):
+        if hasattr(self, "_sig"):
+            self._free()
+
+
+def delta(
+    input,
+    sigfile,
+    output,
+    buffer_size: int = RS_JOB_BLOCKSIZE,
+    adaptive: bool = False,
+    observer=None,
+) -> Stats:
     """
     Create a delta for the file input using the signature read from sigfile. The delta
     will be written to  output.
     :param input:
-    :param sigfile:
+    :param sigfile: a file-like object or a loaded Signature
     :param output: delta file
-    :return:
+    :param buffer_size: size of the I/O buffers
+    :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+    :param observer: receives the events of the job loop, the global observer if None
+    :return: the job statistics
     """
-    # cdef:
-    #     rs_signature_t* sig
-    #     rs_job_t * c_job = rs_loadsig_begin(&sig)
-    #     Job job
-    #     rs_result result
-    sig = ffi.new("rs_signature_t**")
-    c_job = lib.rs_loadsig_begin(sig)
-    try:
-        job = Job.from_ptr(c_job)
-        job.execute(sigfile)
-        result = lib.rs_build_hash_table(sig[0])
-        if result != lib.RS_DONE:
-            raise LibrsyncError(result)
-        c_job = lib.rs_delta_begin(sig[0])
-        job = Job.from_ptr(c_job)
-        return job.execute(input, output)
-    finally:
-        lib.rs_free_sumset(sig[0])
+    if isinstance(sigfile, Signature):
+        return sigfile.delta(input, output, buffer_size, adaptive, observer)
+    with Signature(sigfile) as sig:
+        return sig.delta(input, output, buffer_size, adaptive, observer)
 
 
-@ffi.def_extern()
-def read_cb(opaque, pos, len_, buf):
-    args = ffi.cast("input_args*", opaque)
+READAHEAD_ALIGN = 4096  # read-ahead windows start on a page boundary
+
+
+def fill(args, pos, size) -> None:
     input = ffi.from_handle(args.file)
     input.seek(pos)
-    block = input.read(len_[0])  # type: bytes
+    block = input.read(size)  # type: bytes
     block_size: int = len(block)  # fixme: why block is bytes but can't len_
     if block_size > args.len_:
         temp = lib.realloc(args.buffer, block_size)
@@ -267,32 +819,457 @@ def read_cb(opaque, pos, len_, buf):
             raise MemoryError
         args.buffer = ffi.cast("char*", temp)
         args.len_ = block_size
-
-    len_[0] = block_size
     ffi.memmove(args.buffer, block, block_size)
-    ffi.cast("char**", buf)[0] = args.buffer
+    args.start = pos
+    args.size = block_size
+    args.eof = block_size < size
+
+
+@ffi.def_extern()
+def read_cb(opaque, pos, len_, buf):
+    args = ffi.cast("input_args*", opaque)
+    offset = pos - args.start
+    if not args.window:
+        fill(args, pos, len_[0])
+        offset = 0
+    elif 0 <= offset < args.size and (offset + len_[0] <= args.size or args.eof):
+        args.hits += 1
+    else:
+        # one page-aligned read of a window serves this copy and the nearby ones after it
+        args.misses += 1
+        offset = pos % READAHEAD_ALIGN
+        fill(args, pos - offset, max(args.window, offset + len_[0]))
+        args.read_bytes += args.size
+    len_[0] = max(min(len_[0], args.size - offset), 0)
+    args.calls += 1
+    args.nbytes += len_[0]
+    ffi.cast("char**", buf)[0] = args.buffer + offset
     return lib.RS_DONE
 
 
-def patch(input, delta, output):
+def mapped_basis(input, use_mmap: bool):
+    """
+    Find a buffer exposing the whole basis: the basis itself if it supports the buffer
+    protocol, the buffer of a BytesIO, or a read-only mmap of a regular file.
+    Return None when the basis has to be read through seek and read.
+    """
+    try:
+        memoryview(input).release()
+        return input
+    except TypeError:
+        pass
+    if isinstance(input, BytesIO):
+        return input.getbuffer()
+    if use_mmap and hasattr(input, "fileno"):
+        try:
+            fd = input.fileno()
+            st = os.fstat(fd)
+        except (OSError, ValueError):
+            return None
+        # an empty file can not be mapped
+        if S_ISREG(st.st_mode) and st.st_size > 0:
+            if hasattr(input, "flush"):
+                input.flush()
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    return None
+
+
+class Basis:
+    """
+    The basis of a patch, handed to librsync through a copy callback.
+    """
+
+    def __init__(self, file, use_mmap: bool, readahead: int = 0):
+        self.file = file
+        self.mapping = mapped_basis(file, use_mmap)  # the buffer exposing the basis, if any
+        self.mapped = self.mapping is not None  # args are buffer_args, else input_args
+        if self.mapped:
+            self.data = ffi.from_buffer(self.mapping)
+            self.args = ffi.new("buffer_args*")
+            self.args.data = self.data
+            self.args.len_ = len(self.data)
+        else:
+            self.data = None
+            # cdef input_args args
+            self.args = ffi.new("input_args*")
+            self.handle = ffi.new_handle(file)  # catch you! keep cdata alive
+            self.args.file = self.handle
+            self.args.buffer = ffi.NULL
+            self.args.len_ = 0
+            self.args.window = readahead
+
+    def patch_begin(self):
+        if self.data is not None:
+            return lib.rs_patch_begin(lib.buffer_cb, ffi.cast("void*", self.args))
+        return lib.rs_patch_begin(lib.read_cb, ffi.cast("void*", self.args))
+
+    def copies(self) -> tuple:
+        """
+        The number of copies served from the basis and their bytes.
+        """
+        return self.args.calls, self.args.nbytes
+
+    def reads_ahead(self) -> bool:
+        return not self.mapped and self.args.window > 0
+
+    def readahead(self) -> tuple:
+        """
+        The copies served from the read-ahead window, those which needed a read, and the bytes read.
+        """
+        if self.mapped:
+            return 0, 0, 0
+        return self.args.hits, self.args.misses, self.args.read_bytes
+
+    def close(self) -> None:
+        if self.data is not None:
+            ffi.release(self.data)
+            self.data = None
+            if self.mapping is not self.file:
+                if isinstance(self.mapping, mmap.mmap):
+                    self.mapping.close()
+                else:
+                    self.mapping.release()
+            self.mapping = None
+        elif not self.mapped and self.args.buffer != ffi.NULL:
+            lib.free(self.args.buffer)
+            self.args.buffer = ffi.NULL
+
+    def __del__(self):
+        if hasattr(self, "args"):
+            self.close()
+
+
+def patch(
+    input,
+    delta,
+    output,
+    buffer_size: int = RS_JOB_BLOCKSIZE,
+    adaptive: bool = False,
+    use_mmap: bool = True,
+    observer=None,
+    readahead: int = 0,
+) -> Stats:
     """
     Patch the file  input using the delta . The patched file will be written to
     output.
-    :param input:
+    :param input: a seekable file-like object, or a bytes-like object
     :param delta:
     :param output:
-    :return:
-    """
-    # cdef input_args args
-    args = ffi.new("input_args*")
-    handle = ffi.new_handle(input)  # catch you! keep cdata alive
-    args.file = handle
-    args.buffer = ffi.NULL
-    args.len_ = 0
-    # cdef rs_job_t * c_job
-    c_job = lib.rs_patch_begin(lib.read_cb, ffi.cast("void*", args))
+    :param buffer_size: size of the I/O buffers
+    :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+    :param use_mmap: map input into memory when it is a regular file, so copies are served without the GIL
+    :param observer: receives the events of the job loop, the global observer if None
+    :param readahead: when input is read through seek and read, read it by aligned windows of this
+        size and serve nearby copies from the last one, 0 reads every copy on its own
+    :return: the job statistics
+    """
+    basis = Basis(input, use_mmap, readahead)
+    try:
+        # cdef rs_job_t * c_job
+        c_job = basis.patch_begin()
+        job = Job.from_ptr(c_job)
+        job._basis = basis
+        job.execute(delta, output, buffer_size, adaptive, observer)
+        return job.statistics()
+    finally:
+        basis.close()
+
+
+def open_file(file, write: bool):
+    """
+    Open a path, or a duplicate of a file descriptor, as a C FILE.
+    """
+    if isinstance(file, int):
+        fd = os.dup(file)
+    elif write:
+        fd = os.open(file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o666)
+    else:
+        fd = os.open(file, os.O_RDONLY | O_BINARY)
+    c_file = lib.fdopen(fd, b"wb" if write else b"rb")
+    if c_file == ffi.NULL:
+        errno = ffi.errno
+        os.close(fd)
+        raise OSError(errno, os.strerror(errno))
+    return c_file
+
+
+def close_file(c_file) -> None:
+    if lib.fclose(c_file) != 0:
+        errno = ffi.errno
+        raise OSError(errno, os.strerror(errno))
+
+
+def signature_file(
+    input,
+    output,
+    strong_len: int,
+    sig_magic: int,
+    block_size: int = lib.RS_DEFAULT_BLOCK_LEN,
+) -> Stats:
+    """
+    Generate a signature for the file input. The signature will be written to output.
+    Both are paths or file descriptors, and the whole job runs in C with the GIL released.
+    :param input: path or file descriptor
+    :param output: path or file descriptor
+    :param strong_len:
+    :param sig_magic:
+    :param block_size:
+    :return: the job statistics
+    """
+    started = perf_counter()
+    stats = ffi.new("rs_stats_t*")
+    c_input = open_file(input, False)
+    c_output = ffi.NULL
+    try:
+        c_output = open_file(output, True)
+        result = lib.rs_sig_file(
+            c_input, c_output, block_size, strong_len, sig_magic, stats
+        )
+        maybe_flush_trace()
+    finally:
+        close_file(c_input)
+        if c_output != ffi.NULL:
+            close_file(c_output)
+    if result != lib.RS_DONE:
+        raise LibrsyncError(result)
+    return Stats.from_ptr(stats, perf_counter() - started)
+
+
+def delta_file(input, sigfile, output) -> Stats:
+    """
+    Create a delta for the file input using the signature read from sigfile. The delta
+    will be written to output. All of them are paths or file descriptors, and the whole
+    job runs in C with the GIL released.
+    :param input: path or file descriptor
+    :param sigfile: path, file descriptor or a loaded Signature
+    :param output: path or file descriptor
+    :return: the job statistics
+    """
+    started = perf_counter()
+    stats = ffi.new("rs_stats_t*")
+    loaded = None
+    sig = ffi.new("rs_signature_t**")
+    result = lib.RS_DONE
+    if isinstance(sigfile, Signature):
+        loaded = sigfile
+        loaded._acquire()
+        sig[0] = loaded._sig[0]
+    else:
+        c_sigfile = open_file(sigfile, False)
+        try:
+            result = lib.rs_loadsig_file(c_sigfile, sig, stats)
+            if result == lib.RS_DONE:
+                result = lib.rs_build_hash_table(sig[0])
+        finally:
+            close_file(c_sigfile)
+    c_input = c_output = ffi.NULL
+    try:
+        if result != lib.RS_DONE:
+            raise LibrsyncError(result)
+        c_input = open_file(input, False)
+        c_output = open_file(output, True)
+        result = lib.rs_delta_file(sig[0], c_input, c_output, stats)
+        maybe_flush_trace()
+    finally:
+        if c_input != ffi.NULL:
+            close_file(c_input)
+        if c_output != ffi.NULL:
+            close_file(c_output)
+        if loaded is not None:
+            loaded._release()
+        elif sig[0] != ffi.NULL:
+            lib.rs_free_sumset(sig[0])
+    if result != lib.RS_DONE:
+        raise LibrsyncError(result)
+    return Stats.from_ptr(stats, perf_counter() - started)
+
+
+def patch_file(input, delta, output) -> Stats:
+    """
+    Patch the file input using the delta. The patched file will be written to output.
+    All of them are paths or file descriptors, input must be seekable, and the whole
+    job runs in C with the GIL released.
+    :param input: path or file descriptor
+    :param delta: path or file descriptor
+    :param output: path or file descriptor
+    :return: the job statistics
+    """
+    started = perf_counter()
+    stats = ffi.new("rs_stats_t*")
+    c_input = open_file(input, False)
+    c_delta = c_output = ffi.NULL
+    try:
+        c_delta = open_file(delta, False)
+        c_output = open_file(output, True)
+        result = lib.rs_patch_file(c_input, c_delta, c_output, stats)
+        maybe_flush_trace()
+    finally:
+        close_file(c_input)
+        if c_delta != ffi.NULL:
+            close_file(c_delta)
+        if c_output != ffi.NULL:
+            close_file(c_output)
+    if result != lib.RS_DONE:
+        raise LibrsyncError(result)
+    return Stats.from_ptr(stats, perf_counter() - started)
+
+
+def signature_bytes(
+    data,
+    strong_len: int = 0,
+    sig_magic: int = 0,
+    block_size: int = 0,
+    stats: bool = False,
+):
+    """
+    Generate the signature of a bytes-like object in one go.
+    Arguments left to 0 are chosen by ``get_signature_args`` from the size of data.
+    :param data: a bytes-like object
+    :param strong_len:
+    :param sig_magic:
+    :param block_size:
+    :param stats: also return the job statistics
+    :return: the signature, or a (signature, Stats) tuple
+    """
+    data = ffi.from_buffer(data)
+    magic, block_size, strong_len = get_signature_args(
+        len(data), sig_magic, block_size, strong_len
+    )
+    # the header, then a weak and a strong sum per block
+    size = 12 + (len(data) + block_size - 1) // block_size * (4 + strong_len)
+    c_job = lib.rs_sig_begin(block_size, strong_len, magic)
     job = Job.from_ptr(c_job)
+    out = job._transform(data, size)
+    return (out, job.statistics()) if stats else out
+
+
+def delta_bytes(data, sig, stats: bool = False):
+    """
+    Create the delta of a bytes-like object in one go.
+    :param data: a bytes-like object
+    :param sig: a bytes-like object holding the signature, or a loaded Signature
+    :param stats: also return the job statistics
+    :return: the delta, or a (delta, Stats) tuple
+    """
+    data = ffi.from_buffer(data)
+    loaded = sig if isinstance(sig, Signature) else Signature(sig)
+    loaded._acquire()
     try:
-        job.execute(delta, output)
+        c_job = lib.rs_delta_begin(loaded._sig[0])
+        job = Job.from_ptr(c_job)
+        # room for all of data as literals plus the command headers
+        out = job._transform(data, len(data) + len(data) // 64 + 64)
+        return (out, job.statistics()) if stats else out
     finally:
-        lib.free(args.buffer)
+        loaded._release()
+        if loaded is not sig:
+            loaded.close()
+
+
+def patch_bytes(basis, delta, stats: bool = False):
+    """
+    Apply a delta to a bytes-like basis in one go.
+    :param basis: a bytes-like object
+    :param delta: a bytes-like object
+    :param stats: also return the job statistics
+    :return: the new data, or a (data, Stats) tuple
+    """
+    delta = ffi.from_buffer(delta)
+    c_basis = Basis(basis, False)
+    try:
+        c_job = c_basis.patch_begin()
+        job = Job.from_ptr(c_job)
+        size = len(c_basis.data) if c_basis.data is not None else 0
+        out = job._transform(delta, size + len(delta))
+        return (out, job.statistics()) if stats else out
+    finally:
+        c_basis.close()
+
+
+class SignatureJob(Job):
+    """
+    Push-style signature generation: ``feed`` chunks of the basis file as they arrive,
+    then ``finish``. Every call returns the part of the signature produced so far.
+    """
+
+    def __init__(
+        self, strong_len: int, sig_magic: int, block_size: int = lib.RS_DEFAULT_BLOCK_LEN
+    ):
+        self.job = lib.rs_sig_begin(block_size, strong_len, sig_magic)
+
+
+class DeltaJob(Job):
+    """
+    Push-style delta generation: ``feed`` chunks of the new file as they arrive,
+    then ``finish``. Every call returns the part of the delta produced so far.
+    """
+
+    _acquired = False
+
+    def __init__(self, sigfile):
+        if isinstance(sigfile, Signature):
+            self._sig = sigfile
+            self._owns_sig = False
+        else:
+            self._sig = Signature(sigfile)
+            self._owns_sig = True
+        self._sig._acquire()
+        self._acquired = True
+        self.job = lib.rs_delta_begin(self._sig._sig[0])
+
+    def finish(self) -> bytes:
+        """
+        Signal the end of input and flush the job.
+        :return: the rest of the output
+        """
+        try:
+            return super().finish()
+        finally:
+            self._detach()
+
+    def _detach(self) -> None:
+        if self._acquired:
+            self._acquired = False
+            self._sig._release()
+            if self._owns_sig:
+                self._sig.close()
+
+    def __del__(self):
+        super().__del__()
+        self._detach()
+
+
+class PatchJob(Job):
+    """
+    Push-style patching of the basis: ``feed`` chunks of the delta as they arrive,
+    then ``finish``. Every call returns the part of the new file produced so far.
+    """
+
+    def __init__(self, basis, use_mmap: bool = True, readahead: int = 0):
+        self._basis = Basis(basis, use_mmap, readahead)
+        self.job = self._basis.patch_begin()
+
+    def basis_stats(self) -> dict:
+        """
+        How the basis served the copies so far: the copies and their bytes, and with
+        read-ahead the copies served from the window, those which needed a read and the bytes read.
+        """
+        calls, nbytes = self._basis.copies()
+        hits, misses, read_bytes = self._basis.readahead()
+        return {
+            "copies": calls,
+            "copy_bytes": nbytes,
+            "hits": hits,
+            "misses": misses,
+            "read_bytes": read_bytes,
+        }
+
+    def finish(self) -> bytes:
+        """
+        Signal the end of input and flush the job.
+        :return: the rest of the output
+        """
+        try:
+            return super().finish()
+        finally:
+            self._basis.close()
@@ -246,8 +246,24 @@ char *rs_format_stats(rs_stats_t const *stats, char *buf,
  * \sa \ref api_stats \sa \ref api_trace */
 int rs_log_stats(rs_stats_t const *stats);
 
+/** The hashtable type. */
+typedef struct hashtable {
+    int size;                   /**< Size of allocated hashtable. */
+    int count;                  /**< Number of entries in hashtable. */
+    ...;
+} hashtable_t;
+
 /** The signature datastructure type. */
-typedef struct rs_signature rs_signature_t;
+typedef struct rs_signature {
+    int magic;                  /**< The signature magic value. */
+    int block_len;              /**< The block length. */
+    int strong_sum_len;         /**< The block strong sum length. */
+    int count;                  /**< Total number of blocks. */
+    int size;                   /**< Total number of blocks allocated. */
+    void *block_sigs;           /**< The packed block_sigs for all blocks. */
+    hashtable_t *hashtable;     /**< The hashtable for finding matches. */
+    ...;
+} rs_signature_t;
 
 /** Log the rs_signature_delta match stats. */
 void rs_signature_log_stats(rs_signature_t const *sig);
@@ -701,13 +717,43 @@ rs_result rs_patch_file(FILE *basis_file, FILE *delta_file,
 void* malloc(size_t n);
 void free(void *p);
 void* realloc(void *p, size_t n);
+FILE *fdopen(int fd, const char *mode);
+int fclose(FILE *stream);
 
 // my event callback
 typedef struct {
     void *file;
     char* buffer;
     size_t len_;
+    size_t calls;
+    rs_long_t nbytes;
+    size_t window;
+    rs_long_t start;
+    size_t size;
+    int eof;
+    size_t hits;
+    size_t misses;
+    rs_long_t read_bytes;
 } input_args;
+
+typedef struct {
+    const char *data;
+    size_t len_;
+    size_t calls;
+    rs_long_t nbytes;
+} buffer_args;
+
+rs_result buffer_cb(void *opaque, rs_long_t pos, size_t *len_, void **buf);
+
+typedef struct {
+    int level;
+    char msg[256];
+} trace_entry;
+
+int trace_init(void);
+void trace_cb(rs_loglevel level, char const *msg);
+size_t trace_pending(void);
+size_t trace_pop(trace_entry *batch, size_t max, size_t *dropped);
                        
 extern "Python" rs_result read_cb(void *opaque, rs_long_t pos, size_t *len_, void ** buf);
 """
@@ -719,10 +765,13 @@ for root, dirs, files in os.walk("./dep/src"):
         if file.endswith(".c") and "rdiff" not in file:
             c_src.append(os.path.join(root, file))
 source = """
+#include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 #include <time.h>
 #include "job.h"
 #include "librsync.h"
+#include "sumset.h"
 #include "cbarg.h"
 """
 ffibuilder.set_source(
@@ -730,7 +779,8 @@ ffibuilder.set_source(
     source,
     sources=c_src,
     include_dirs=["./dep/src", "./dep/src/blake2", "./pyrsync/backends/cffi"],
-    define_macros=[("rsync_EXPORTS", None)],
+    # no hashtable stats counters, concurrent deltas of a signature would race on them
+    define_macros=[("rsync_EXPORTS", None), ("HASHTABLE_NSTATS", None)],
 )
 
 if __name__ == "__main__":
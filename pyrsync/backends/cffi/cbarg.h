@@ -4,5 +4,92 @@ typedef struct {
     void *file;
     char* buffer;
     size_t len_;
+    size_t calls; /* copies served, for the observer */
+    rs_long_t nbytes;
+    size_t window; /* read-ahead size, 0 reads every copy on its own */
+    rs_long_t start; /* offset in the basis of buffer */
+    size_t size; /* bytes of the basis in buffer */
+    int eof; /* buffer reaches the end of the basis */
+    size_t hits; /* copies served from buffer without a read */
+    size_t misses;
+    rs_long_t read_bytes;
 } input_args;
-#endif
\ No newline at end of file
+
+typedef struct {
+    const char *data;
+    size_t len_;
+    size_t calls; /* copies served, for the observer */
+    rs_long_t nbytes;
+} buffer_args;
+
+/* serve the copy straight from the mapped basis, no GIL, no seek and no copy here */
+static rs_result buffer_cb(void *opaque, rs_long_t pos, size_t *len_, void **buf)
+{
+    buffer_args *args = (buffer_args *)opaque;
+    if (pos < 0 || (size_t)pos >= args->len_)
+        return RS_INPUT_ENDED;
+    if (*len_ > args->len_ - (size_t)pos)
+        *len_ = args->len_ - (size_t)pos;
+    args->calls++;
+    args->nbytes += *len_;
+    *buf = (void *)(args->data + pos);
+    return RS_DONE;
+}
+
+#define TRACE_RING_SIZE 1024 /* librsync messages kept between two flushes, more are dropped */
+#define TRACE_MSG_LEN 256
+
+typedef struct {
+    int level;
+    char msg[TRACE_MSG_LEN];
+} trace_entry;
+
+static trace_entry trace_ring[TRACE_RING_SIZE];
+static size_t trace_head = 0, trace_count = 0, trace_dropped = 0;
+static PyThread_type_lock trace_lock = NULL;
+
+static int trace_init(void)
+{
+    if (trace_lock == NULL)
+        trace_lock = PyThread_allocate_lock();
+    return trace_lock != NULL;
+}
+
+/* librsync may log from any thread: queue the message, never wait for the GIL */
+static void trace_cb(rs_loglevel level, char const *msg)
+{
+    trace_entry *entry;
+    PyThread_acquire_lock(trace_lock, WAIT_LOCK);
+    if (trace_count == TRACE_RING_SIZE) {
+        trace_dropped++;
+    } else {
+        entry = &trace_ring[(trace_head + trace_count) % TRACE_RING_SIZE];
+        entry->level = (int)level;
+        strncpy(entry->msg, msg, TRACE_MSG_LEN - 1);
+        entry->msg[TRACE_MSG_LEN - 1] = 0;
+        trace_count++;
+    }
+    PyThread_release_lock(trace_lock);
+}
+
+static size_t trace_pending(void)
+{
+    return trace_count;
+}
+
+/* move up to max queued messages to batch, and take the count of dropped ones */
+static size_t trace_pop(trace_entry *batch, size_t max, size_t *dropped)
+{
+    size_t n, i;
+    PyThread_acquire_lock(trace_lock, WAIT_LOCK);
+    n = trace_count < max ? trace_count : max;
+    for (i = 0; i < n; i++)
+        batch[i] = trace_ring[(trace_head + i) % TRACE_RING_SIZE];
+    trace_head = (trace_head + n) % TRACE_RING_SIZE;
+    trace_count -= n;
+    *dropped = trace_dropped;
+    trace_dropped = 0;
+    PyThread_release_lock(trace_lock);
+    return n;
+}
+#endif
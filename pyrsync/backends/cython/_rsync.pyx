@@ -1,12 +1,22 @@
 # cython: language_level=3
 # cython: cdivision=True
 cimport cython
+from cpython.bytearray cimport (PyByteArray_AS_STRING,
+                                PyByteArray_FromStringAndSize,
+                                PyByteArray_Resize)
+from cpython.buffer cimport (PyBUF_SIMPLE, PyBuffer_Release,
+                             PyObject_CheckBuffer, PyObject_GetBuffer)
 from cpython.bytes cimport (PyBytes_AS_STRING, PyBytes_FromStringAndSize,
                             PyBytes_GET_SIZE)
 from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
 from cpython.object cimport PyObject, PyObject_HasAttrString
+from cpython.pythread cimport (WAIT_LOCK, PyThread_acquire_lock,
+                               PyThread_allocate_lock,
+                               PyThread_release_lock, PyThread_type_lock)
+from libc.errno cimport errno
 from libc.stdint cimport uint8_t
-from libc.string cimport memcpy
+from libc.stdio cimport FILE, fclose
+from libc.string cimport memcpy, memmove, strerror, strncpy
 
 from pyrsync.backends.cython.rsync cimport RS_BAD_MAGIC
 from pyrsync.backends.cython.\
@@ -18,22 +28,42 @@ from pyrsync.backends.cython.rsync cimport (RS_DONE, RS_INPUT_ENDED,
                                             RS_INTERNAL_ERROR, RS_IO_ERROR)
 from pyrsync.backends.cython.\
     rsync cimport RS_MD4_SIG_MAGIC as C_RS_MD4_SIG_MAGIC
-from pyrsync.backends.cython.rsync cimport RS_MEM_ERROR, RS_PARAM_ERROR
+from pyrsync.backends.cython.rsync cimport (RS_LOG_CRIT, RS_LOG_DEBUG,
+                                            RS_LOG_ERR, RS_LOG_INFO,
+                                            RS_LOG_WARNING, RS_MEM_ERROR,
+                                            RS_PARAM_ERROR, fdopen)
 from pyrsync.backends.cython.\
     rsync cimport RS_RK_BLAKE2_SIG_MAGIC as C_RS_RK_BLAKE2_SIG_MAGIC
 from pyrsync.backends.cython.\
     rsync cimport RS_RK_MD4_SIG_MAGIC as C_RS_RK_MD4_SIG_MAGIC
 from pyrsync.backends.cython.rsync cimport (RS_RUNNING, RS_SYNTAX_ERROR,
                                             RS_TEST_SKIPPED, RS_UNIMPLEMENTED,
-                                            rs_buffers_t, rs_build_hash_table,
-                                            rs_delta_begin, rs_free_sumset,
+                                            hashtable_t, rs_buffers_t,
+                                            rs_build_hash_table, rs_copy_cb,
+                                            rs_delta_begin, rs_delta_file,
+                                            rs_free_sumset,
                                             rs_job_free, rs_job_iter,
                                             rs_job_statistics, rs_job_t,
-                                            rs_loadsig_begin, rs_long_t,
+                                            rs_log_stats, rs_loglevel,
+                                            rs_loadsig_begin,
+                                            rs_loadsig_file, rs_long_t,
                                             rs_magic_number, rs_patch_begin,
+                                            rs_patch_file,
                                             rs_result, rs_sig_args,
-                                            rs_sig_begin, rs_signature_t,
-                                            rs_stats_t)
+                                            rs_sig_begin, rs_sig_file,
+                                            rs_signature_t,
+                                            rs_stats_t, rs_supports_trace,
+                                            rs_trace_set_level, rs_trace_to,
+                                            rs_weak_sum_t)
+
+import json
+import logging
+import mmap
+import os
+from io import BytesIO
+from stat import S_ISREG
+from threading import Lock
+from time import perf_counter
 
 
 class LibrsyncError(Exception):
@@ -65,7 +95,131 @@ class LibrsyncError(Exception):
             return "RS_PARAM_ERROR"
 
 
+O_BINARY = getattr(os, "O_BINARY", 0)
+
 RS_JOB_BLOCKSIZE = 65535
+RS_JOB_MAX_BLOCKSIZE = 8 * 1024 * 1024  # cap of the adaptive buffer size
+cdef int ADAPTIVE_ROUNDS = 4  # full rounds measured before deciding to grow the buffer
+
+cdef object _observer = None  # receives the events of every job loop, see set_observer
+
+def set_observer(object observer):
+    """
+    Install an observer for every job loop, or remove it with None.
+    An observer has the methods of ``pyrsync.metrics.Observer``.
+    """
+    global _observer
+    _observer = observer
+
+def get_observer():
+    return _observer
+
+cdef enum:
+    TRACE_RING_SIZE = 1024  # librsync messages kept between two flushes, more are dropped
+    TRACE_MSG_LEN = 256
+    TRACE_BATCH = 64
+
+cdef struct trace_entry:
+    int level
+    char msg[TRACE_MSG_LEN]
+
+cdef trace_entry trace_ring[TRACE_RING_SIZE]
+cdef size_t trace_head = 0, trace_count = 0, trace_dropped = 0
+cdef PyThread_type_lock trace_lock = PyThread_allocate_lock()
+cdef bint trace_installed = False
+
+cdef void trace_cb(rs_loglevel level, const char * msg) noexcept nogil:
+    # librsync may log from any thread: queue the message, never wait for the GIL
+    global trace_count, trace_dropped
+    cdef trace_entry * entry
+    PyThread_acquire_lock(trace_lock, WAIT_LOCK)
+    if trace_count == TRACE_RING_SIZE:
+        trace_dropped += 1
+    else:
+        entry = &trace_ring[(trace_head + trace_count) % TRACE_RING_SIZE]
+        entry.level = <int> level
+        strncpy(entry.msg, msg, TRACE_MSG_LEN - 1)
+        entry.msg[TRACE_MSG_LEN - 1] = 0
+        trace_count += 1
+    PyThread_release_lock(trace_lock)
+
+trace_logger = logging.getLogger("pyrsync.librsync")
+# logging level of each rs_loglevel, from RS_LOG_EMERG to RS_LOG_DEBUG
+cdef tuple TRACE_LEVELS = (logging.CRITICAL, logging.CRITICAL, logging.CRITICAL, logging.ERROR,
+                           logging.WARNING, logging.INFO, logging.INFO, logging.DEBUG)
+
+def flush_trace():
+    """
+    Emit the queued librsync messages to the "pyrsync.librsync" logger. Jobs flush
+    after every step and the *_file functions when they return; a whole-file run can
+    be flushed from another thread while it goes.
+    :return: the number of messages emitted
+    """
+    global trace_head, trace_count, trace_dropped
+    install_trace()
+    cdef:
+        trace_entry batch[TRACE_BATCH]
+        size_t n, i, dropped, total = 0
+    while True:
+        with nogil:
+            PyThread_acquire_lock(trace_lock, WAIT_LOCK)
+            n = trace_count if trace_count < TRACE_BATCH else TRACE_BATCH
+            for i in range(n):
+                batch[i] = trace_ring[(trace_head + i) % TRACE_RING_SIZE]
+            trace_head = (trace_head + n) % TRACE_RING_SIZE
+            trace_count -= n
+            dropped = trace_dropped
+            trace_dropped = 0
+            PyThread_release_lock(trace_lock)
+        for i in range(n):
+            trace_logger.log(TRACE_LEVELS[batch[i].level & 7], (<bytes> batch[i].msg).decode(errors="replace").rstrip())
+        total += n
+        if dropped:
+            trace_logger.warning("%d librsync messages dropped", dropped)
+        if n < TRACE_BATCH:
+            return total
+
+cdef inline int maybe_flush_trace() except -1:
+    if trace_count:
+        flush_trace()
+    return 0
+
+cdef inline void install_trace() noexcept:
+    """
+    Route librsync's messages to the ring. librsync has a single trace sink for the whole
+    process, so it is only taken over once pyrsync's logging is asked for.
+    """
+    global trace_installed
+    if not trace_installed:
+        rs_trace_to(trace_cb)
+        trace_installed = True
+
+def set_trace_level(int level):
+    """
+    Set the lowest level of the librsync messages routed to the "pyrsync.librsync" logger.
+    The first call, like that of ``flush_trace``, takes over librsync's trace sink.
+    :param level: a logging level, such as logging.DEBUG
+    """
+    cdef rs_loglevel c_level
+    if level <= logging.DEBUG:
+        c_level = RS_LOG_DEBUG
+    elif level <= logging.INFO:
+        c_level = RS_LOG_INFO
+    elif level <= logging.WARNING:
+        c_level = RS_LOG_WARNING
+    elif level <= logging.ERROR:
+        c_level = RS_LOG_ERR
+    else:
+        c_level = RS_LOG_CRIT
+    install_trace()
+    rs_trace_set_level(c_level)
+
+def supports_trace():
+    """
+    Whether librsync was built with debug messages, without them DEBUG shows nothing more.
+    """
+    return bool(rs_supports_trace())
+
 
 RS_DELTA_MAGIC = C_RS_DELTA_MAGIC
 RS_MD4_SIG_MAGIC = C_RS_MD4_SIG_MAGIC
@@ -73,9 +227,16 @@ RS_BLAKE2_SIG_MAGIC = C_RS_BLAKE2_SIG_MAGIC
 RS_RK_MD4_SIG_MAGIC = C_RS_RK_MD4_SIG_MAGIC
 RS_RK_BLAKE2_SIG_MAGIC= C_RS_RK_BLAKE2_SIG_MAGIC
 
-cdef inline uint8_t PyFile_Check(object file):
-    if PyObject_HasAttrString(file, "read") and PyObject_HasAttrString(file, "write") and PyObject_HasAttrString(file,
-                                                                                                                 "seek"):
+cdef class Basis
+
+cdef inline uint8_t PyReadable_Check(object file):
+    # execute reads with readinto when there is one, else with read
+    if PyObject_HasAttrString(file, "read") or PyObject_HasAttrString(file, "readinto"):
+        return 1
+    return 0
+
+cdef inline uint8_t PyWritable_Check(object file):
+    if PyObject_HasAttrString(file, "write"):
         return 1
     return 0
 # copyed sthing from https://github.com/smartfile/python-librsync/blob/master/librsync/__init__.py
@@ -83,21 +244,60 @@ cdef inline uint8_t PyFile_Check(object file):
 @cython.final
 @cython.no_gc
 cdef class Stats:
-    cdef rs_stats_t * state
+    """
+    A snapshot of the statistics of a job, detached from it: it stays valid once the
+    job is freed, and can be pickled or exported as a dict or JSON.
+    """
+    cdef:
+        rs_stats_t state
+        str _op  # op of a snapshot rebuilt from a dict
+        readonly size_t buffer_size  # the job buffer size finally used
+        readonly double elapsed  # wall time of the job in seconds
 
     @staticmethod
-    cdef inline Stats from_ptr(rs_stats_t * state):
+    cdef inline Stats from_ptr(const rs_stats_t * state, double elapsed = 0, size_t buffer_size = 0):
         cdef Stats self = Stats.__new__(Stats)
-        self.state = state
+        self.state = state[0]
+        self.elapsed = elapsed
+        self.buffer_size = buffer_size
+        return self
+
+    @staticmethod
+    def from_dict(dict d):
+        """
+        Rebuild a snapshot exported by ``as_dict``.
+        """
+        cdef Stats self = Stats.__new__(Stats)
+        self._op = d["op"]
+        self.state.lit_cmds = d["lit_cmds"]
+        self.state.lit_bytes = d["lit_bytes"]
+        self.state.lit_cmdbytes = d["lit_cmdbytes"]
+        self.state.copy_cmds = d["copy_cmds"]
+        self.state.copy_bytes = d["copy_bytes"]
+        self.state.copy_cmdbytes = d["copy_cmdbytes"]
+        self.state.sig_cmds = d["sig_cmds"]
+        self.state.sig_bytes = d["sig_bytes"]
+        self.state.false_matches = d["false_matches"]
+        self.state.sig_blocks = d["sig_blocks"]
+        self.state.block_len = d["block_len"]
+        self.state.in_bytes = d["in_bytes"]
+        self.state.out_bytes = d["out_bytes"]
+        self.state.start = d["start"]
+        self.state.end = d["end"]
+        self.buffer_size = d["buffer_size"]
+        self.elapsed = d["elapsed"]
         return self
 
     @property
     def op(self):
-        return (<bytes>self.state.op).decode()
+        if self._op is not None:
+            return self._op
+        return (<bytes>self.state.op).decode() if self.state.op != NULL else ""
 
     @property
     def lit_cmds(self):
         return self.state.lit_cmds
+
     @property
     def lit_bytes(self):
         return self.state.lit_bytes
@@ -113,30 +313,39 @@ cdef class Stats:
     @property
     def copy_bytes(self):
         return self.state.copy_bytes
+
     @property
     def copy_cmdbytes(self):
         return self.state.copy_cmdbytes
+
     @property
     def sig_cmds(self):
         return self.state.sig_cmds
+
     @property
     def sig_bytes(self):
         return self.state.sig_bytes
+
     @property
     def false_matches(self):
         return self.state.false_matches
+
     @property
-    def sig_blocks (self):
+    def sig_blocks(self):
         return self.state.sig_blocks
+
     @property
     def block_len(self):
         return self.state.block_len
+
     @property
-    def in_bytes  (self):
+    def in_bytes(self):
         return self.state.in_bytes
+
     @property
     def out_bytes(self):
         return self.state.out_bytes
+
     @property
     def start(self):
         return self.state.start
@@ -145,12 +354,69 @@ cdef class Stats:
     def end(self):
         return self.state.end
 
+    @property
+    def throughput(self):
+        """
+        Input bytes processed per second of wall time.
+        """
+        return self.state.in_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    cpdef dict as_dict(self):
+        return {
+            "op": self.op,
+            "lit_cmds": self.state.lit_cmds,
+            "lit_bytes": self.state.lit_bytes,
+            "lit_cmdbytes": self.state.lit_cmdbytes,
+            "copy_cmds": self.state.copy_cmds,
+            "copy_bytes": self.state.copy_bytes,
+            "copy_cmdbytes": self.state.copy_cmdbytes,
+            "sig_cmds": self.state.sig_cmds,
+            "sig_bytes": self.state.sig_bytes,
+            "false_matches": self.state.false_matches,
+            "sig_blocks": self.state.sig_blocks,
+            "block_len": self.state.block_len,
+            "in_bytes": self.state.in_bytes,
+            "out_bytes": self.state.out_bytes,
+            "start": self.state.start,
+            "end": self.state.end,
+            "buffer_size": self.buffer_size,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def log(self):
+        """
+        Log librsync's summary of these statistics to the "pyrsync.librsync" logger, at INFO level.
+        """
+        install_trace()
+        rs_log_stats(&self.state)
+        flush_trace()
+
+    def __reduce__(self):
+        return Stats.from_dict, (self.as_dict(),)
+
+    def __repr__(self):
+        return "Stats(%s)" % ", ".join("%s=%r" % item for item in self.as_dict().items())
+
 @cython.freelist(8)
-@cython.final
 @cython.no_gc
 @cython.internal
 cdef class Job:
-    cdef  rs_job_t * job
+    cdef:
+        rs_job_t * job
+        char * out  # output buffer of feed/finish
+        bytes pending  # input left unconsumed by the last feed
+        bint done
+        size_t buffer_size
+        double started, finished  # wall clock of the job, for Stats.elapsed
+        Basis basis  # the basis of a patch
+        rs_long_t in_bytes, out_bytes  # only counted by librsync for whole files
+
+    def __cinit__(self, *args, **kwargs):
+        self.started = perf_counter()
 
     @staticmethod
     cdef inline Job from_ptr(rs_job_t * job):
@@ -159,59 +425,256 @@ cdef class Job:
         return self
 
     cdef inline rs_result iter(self, rs_buffers_t * buffer):
-        cdef rs_result result
+        cdef:
+            rs_result result
+            size_t avail_in = buffer.avail_in, avail_out = buffer.avail_out
         with nogil:
             result = rs_job_iter(self.job, buffer)
+        maybe_flush_trace()
+        self.in_bytes += avail_in - buffer.avail_in
+        self.out_bytes += avail_out - buffer.avail_out
         return result
 
-    cpdef inline Stats statistics(self):
-        cdef rs_stats_t * state = <rs_stats_t *>rs_job_statistics(self.job)
-        return Stats.from_ptr(state)
+    cpdef Stats statistics(self):
+        cdef:
+            double end = self.finished if self.finished else perf_counter()
+            Stats stats = Stats.from_ptr(rs_job_statistics(self.job), end - self.started, self.buffer_size)
+        stats.state.in_bytes = self.in_bytes
+        stats.state.out_bytes = self.out_bytes
+        return stats
 
-    cpdef inline int execute(self, object input, object output = None) except -1:
-        if not PyFile_Check(input):
-            raise TypeError("input except a file-like object, got %s" % type(input).__name__)
-        if output is not None and not PyFile_Check(output):
-            raise TypeError("sigfile except a file-like object, got %s" % type(output).__name__)
+    cpdef int execute(self, object input, object output = None, size_t buffer_size = RS_JOB_BLOCKSIZE,
+                      bint adaptive = False, object observer = None) except -1:
+        """
+        Pull input until EOF through the job, pushing the output to output.
+        :param buffer_size: size of the input and output buffers
+        :param adaptive: grow the buffers toward RS_JOB_MAX_BLOCKSIZE as long as throughput improves
+        :param observer: receives the events of the loop, the global observer if None
+        """
+        if not PyReadable_Check(input):
+            raise TypeError("input except a readable file-like object, got %s" % type(input).__name__)
+        if output is not None and not PyWritable_Check(output):
+            raise TypeError("sigfile except a writable file-like object, got %s" % type(output).__name__)
+        if buffer_size == 0:
+            raise ValueError("buffer_size must be positive")
         cdef:
             rs_buffers_t buffer
-            void * out  # sigfile buffer
-            bytes block
+            # input buffer, starts with the bytes librsync left unconsumed
+            bytearray inbuf = PyByteArray_FromStringAndSize(NULL, <Py_ssize_t> buffer_size)
+            bytearray out = PyByteArray_FromStringAndSize(NULL, <Py_ssize_t> buffer_size)  # sigfile buffer
+            char * c_inbuf = PyByteArray_AS_STRING(inbuf)
+            char * c_out = PyByteArray_AS_STRING(out)
+            object inview = memoryview(inbuf)
+            object outview = memoryview(out)
+            object readinto = getattr(input, "readinto", None)
+            object block
+            Py_ssize_t block_size
+            size_t pending = 0
+            size_t produced
+            bint eof = False
+            bint full
             rs_result result
+            # adaptive sizing: throughput of the full rounds at the current size
+            double started = 0, elapsed = 0, best_rate = 0, rate
+            size_t measured = 0
+            int rounds = 0
+            size_t max_size = RS_JOB_MAX_BLOCKSIZE
+            # instrumentation, only timed when there is an observer
+            object obs = observer if observer is not None else _observer
+            double t_read = 0, t_iter = 0, t_write = 0
 
-        out = PyMem_Malloc(RS_JOB_BLOCKSIZE)
-        if not out:
-            raise MemoryError
+        self.buffer_size = buffer_size
+        if obs is not None:
+            obs.start((<bytes>rs_job_statistics(self.job).op).decode())
         try:
             while True:
-                block = input.read(RS_JOB_BLOCKSIZE)  # type: bytes
-                buffer.next_in = PyBytes_AS_STRING(block)
-                buffer.avail_in = <size_t> PyBytes_GET_SIZE(block)
-                buffer.eof_in = not block
-                buffer.next_out = <char *> out
-                buffer.avail_out = <size_t> RS_JOB_BLOCKSIZE
+                if adaptive:
+                    started = perf_counter()
+                if obs is not None:
+                    t_read = perf_counter()
+                if not eof and pending < buffer_size:
+                    if readinto is not None:
+                        # read straight into our buffer, no intermediate bytes object
+                        block_size = readinto(inview[pending:]) or 0
+                    else:
+                        block = input.read(buffer_size - pending)  # type: bytes
+                        block_size = PyBytes_GET_SIZE(block)
+                        memcpy(c_inbuf + pending, PyBytes_AS_STRING(block), <size_t> block_size)
+                    if block_size:
+                        pending += <size_t> block_size
+                    else:
+                        eof = True
+                full = pending == buffer_size
+                buffer.next_in = c_inbuf
+                buffer.avail_in = pending
+                buffer.eof_in = eof
+                buffer.next_out = c_out
+                buffer.avail_out = buffer_size
+                if obs is not None:
+                    t_iter = perf_counter()
                 result = self.iter(&buffer)
-                if output is not None:
-                    output.write(
-                        PyBytes_FromStringAndSize(<char *> out, <Py_ssize_t> (RS_JOB_BLOCKSIZE - buffer.avail_out)))
+                produced = buffer_size - buffer.avail_out
+                if obs is not None:
+                    t_write = perf_counter()
+                if output is not None and produced:
+                    # the view is only valid during the call, writers must copy what they keep
+                    output.write(outview[:produced])
+                if obs is not None:
+                    obs.chunk(t_iter - t_read, t_write - t_iter, perf_counter() - t_write,
+                              pending - buffer.avail_in, produced)
                 if result == RS_DONE:
+                    self.finished = perf_counter()
                     break
                 elif result != RS_BLOCKED:
                     raise LibrsyncError(result)
-                if buffer.avail_in > 0:
-                    # There is data left in the input buffer, librsync did not consume
-                    # all of it. Rewind the file a bit so we include that data in our
-                    # next read. It would be better to simply tack data to the end of
-                    # this buffer, but that is very difficult in Python.
-                    input.seek(input.tell() - buffer.avail_in)
+                if adaptive and full:
+                    rounds += 1
+                    measured += pending - buffer.avail_in
+                    elapsed += perf_counter() - started
+                    if rounds == ADAPTIVE_ROUNDS:
+                        rate = measured / elapsed if elapsed > 0 else 0
+                        if rate > best_rate * 1.1 and buffer_size < max_size:
+                            # still getting faster, double the buffers
+                            best_rate = rate
+                            buffer_size = min(buffer_size * 2, max_size)
+                            inview.release()
+                            outview.release()
+                            PyByteArray_Resize(inbuf, <Py_ssize_t> buffer_size)
+                            PyByteArray_Resize(out, <Py_ssize_t> buffer_size)
+                            buffer.next_in = PyByteArray_AS_STRING(inbuf) + (buffer.next_in - c_inbuf)
+                            c_inbuf = PyByteArray_AS_STRING(inbuf)
+                            c_out = PyByteArray_AS_STRING(out)
+                            inview = memoryview(inbuf)
+                            outview = memoryview(out)
+                            self.buffer_size = buffer_size
+                        else:
+                            adaptive = False
+                        rounds = 0
+                        measured = 0
+                        elapsed = 0
+                # Carry the bytes librsync did not consume over to the next round,
+                # so the input is never rewound and needs not be seekable.
+                pending = buffer.avail_in
+                if pending > 0 and buffer.next_in != c_inbuf:
+                    memmove(c_inbuf, buffer.next_in, pending)
+        except BaseException as e:
+            if obs is not None:
+                obs.error(e)
+            raise
         finally:
-            PyMem_Free(out)
+            inview.release()
+            outview.release()
+            # every start gets its end, a failed job too
+            if obs is not None:
+                if self.basis is not None:
+                    obs.copies(*self.basis.copies())
+                    if self.basis.reads_ahead():
+                        obs.readahead(*self.basis.readahead())
+                obs.end(self.statistics())
         return 0
 
+    cdef bytes run(self, object data, bint eof):
+        cdef:
+            const unsigned char[::1] view
+            rs_buffers_t buffer
+            rs_result result
+            list chunks = []
+        if self.done:
+            raise ValueError("the job is already finished")
+        if self.pending is not None:
+            data = self.pending + bytes(data)
+            self.pending = None
+        if self.out == NULL:
+            self.out = <char *> PyMem_Malloc(RS_JOB_BLOCKSIZE)
+            if not self.out:
+                raise MemoryError
+            self.buffer_size = RS_JOB_BLOCKSIZE
+        view = data
+        buffer.next_in = <char *> &view[0] if view.shape[0] > 0 else NULL
+        buffer.avail_in = <size_t> view.shape[0]
+        buffer.eof_in = eof
+        while True:
+            buffer.next_out = self.out
+            buffer.avail_out = <size_t> RS_JOB_BLOCKSIZE
+            result = self.iter(&buffer)
+            if buffer.avail_out < <size_t> RS_JOB_BLOCKSIZE:
+                chunks.append(
+                    PyBytes_FromStringAndSize(self.out, <Py_ssize_t> (RS_JOB_BLOCKSIZE - buffer.avail_out)))
+            if result == RS_DONE:
+                self.done = True
+                self.finished = perf_counter()
+                break
+            elif result != RS_BLOCKED:
+                raise LibrsyncError(result)
+            if buffer.avail_out > 0:
+                # librsync is waiting for more input
+                if eof:
+                    raise LibrsyncError(RS_INPUT_ENDED)
+                break
+        if buffer.avail_in > 0 and not self.done:
+            self.pending = PyBytes_FromStringAndSize(buffer.next_in, <Py_ssize_t> buffer.avail_in)
+        return b"".join(chunks)
+
+    def feed(self, object data):
+        """
+        Push a chunk of input into the job.
+        :param data: a bytes-like object
+        :return: the output produced so far
+        """
+        return self.run(data, False)
+
+    def finish(self):
+        """
+        Signal the end of input and flush the job.
+        :return: the rest of the output
+        """
+        if self.done:
+            return b""
+        return self.run(b"", True)
+
+    cdef bytes transform(self, const unsigned char[::1] data, size_t size_hint):
+        """
+        Run the job over the whole of data at once, writing straight into an output
+        of size_hint bytes which only grows when the hint was too small.
+        """
+        cdef:
+            rs_buffers_t buffer
+            rs_result result
+            size_t size = size_hint if size_hint > 0 else 64
+            size_t produced = 0
+            bytes out = PyBytes_FromStringAndSize(NULL, <Py_ssize_t> size)
+            bytes grown
+        buffer.next_in = <char *> &data[0] if data.shape[0] > 0 else NULL
+        buffer.avail_in = <size_t> data.shape[0]
+        buffer.eof_in = True
+        while True:
+            buffer.next_out = PyBytes_AS_STRING(out) + produced
+            buffer.avail_out = size - produced
+            result = self.iter(&buffer)
+            produced = size - buffer.avail_out
+            if result == RS_DONE:
+                self.finished = perf_counter()
+                break
+            elif result != RS_BLOCKED:
+                raise LibrsyncError(result)
+            if buffer.avail_out > 0:
+                raise LibrsyncError(RS_INPUT_ENDED)
+            # the output is full, double it
+            size *= 2
+            grown = PyBytes_FromStringAndSize(NULL, <Py_ssize_t> size)
+            memcpy(PyBytes_AS_STRING(grown), PyBytes_AS_STRING(out), produced)
+            out = grown
+        self.buffer_size = size
+        if produced == size:
+            return out
+        return PyBytes_FromStringAndSize(PyBytes_AS_STRING(out), <Py_ssize_t> produced)
+
     def __dealloc__(self):
         if self.job:
             rs_job_free(self.job)
         self.job = NULL
+        PyMem_Free(self.out)
+        self.out = NULL
 
 cpdef inline tuple get_signature_args(rs_long_t old_fsize, int magic = 0, size_t block_len = 0, size_t strong_len= 0):
     cdef:
@@ -224,8 +687,9 @@ cpdef inline tuple get_signature_args(rs_long_t old_fsize, int magic = 0, size_t
         raise LibrsyncError(result)
     return c_magic, block_len, strong_len
 
-cpdef inline signature(object input, object output, size_t strong_len, rs_magic_number sig_magic,
-                           size_t block_size=RS_DEFAULT_BLOCK_LEN):
+cpdef inline Stats signature(object input, object output, size_t strong_len, rs_magic_number sig_magic,
+                           size_t block_size=RS_DEFAULT_BLOCK_LEN, size_t buffer_size=RS_JOB_BLOCKSIZE,
+                           bint adaptive=False, object observer=None):
     """
      Generate a signature for the file input. The signature will be written to output.
     You can specify the size of the blocks using the optional `block_size` parameter.
@@ -234,52 +698,186 @@ cpdef inline signature(object input, object output, size_t strong_len, rs_magic_
     :param strong_len: 
     :param sig_magic: 
     :param block_size: 
-    :return: 
+    :param buffer_size: size of the I/O buffers
+    :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+    :param observer: receives the events of the job loop, the global observer if None
+    :return: the job statistics
     """
     cdef rs_job_t * c_job
     with nogil:
         c_job = rs_sig_begin(block_size, strong_len, sig_magic)
     cdef Job job = Job.from_ptr(c_job)
-    job.execute(input, output)
+    job.execute(input, output, buffer_size, adaptive, observer)
+    return job.statistics()
 
-cpdef inline delta(object input, object sigfile, object output):
+@cython.final
+cdef class Signature:
     """
-    Create a delta for the file input using the signature read from sigfile. The delta
-    will be written to  output.
-    :param input: 
-    :param sigfile: 
-    :param output: delta file
-    :return: 
+    A signature loaded and indexed once, ready to serve any number of ``delta`` calls.
+    librsync is built without its match stats counters (HASHTABLE_NSTATS), so a delta
+    only reads the loaded signature and it can be shared by several threads at once.
+    Call ``close`` or use it as a context manager to free it.
     """
     cdef:
-        rs_signature_t* sig
-        rs_job_t * c_job = rs_loadsig_begin(&sig)
-        Job job
-        rs_result result
-    try:
+        rs_signature_t * sig
+        object lock
+        Py_ssize_t users
+        bint _closed
+        readonly int magic, block_len, strong_len, block_count
+
+    def __cinit__(self, object sigfile):
+        """
+        :param sigfile: a file-like object or a bytes-like object holding the signature
+        """
+        cdef:
+            rs_job_t * c_job
+            Job job
+            rs_result result
+        self.lock = Lock()
+        with nogil:
+            c_job = rs_loadsig_begin(&self.sig)
         job = Job.from_ptr(c_job)
-        job.execute(sigfile)
+        if PyObject_CheckBuffer(sigfile):
+            job.transform(sigfile, 0)
+        else:
+            job.execute(sigfile)
         with nogil:
-            result = rs_build_hash_table(sig)
+            result = rs_build_hash_table(self.sig)
         if result != RS_DONE:
             raise LibrsyncError(result)
-        with nogil:
-            c_job = rs_delta_begin(sig)
-        job = Job.from_ptr(c_job)
-        return job.execute(input, output)
+        self.magic = self.sig.magic
+        self.block_len = self.sig.block_len
+        self.strong_len = self.sig.strong_sum_len
+        self.block_count = self.sig.count
+
+    cdef int acquire(self) except -1:
+        with self.lock:
+            if self._closed:
+                raise ValueError("I/O operation on closed signature")
+            self.users += 1
+        return 0
+
+    cdef void release(self):
+        with self.lock:
+            self.users -= 1
+            if self._closed and self.users == 0:
+                self.free()
+
+    cdef inline void free(self):
+        if self.sig:
+            rs_free_sumset(self.sig)
+        self.sig = NULL
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def nbytes(self):
+        """
+        Approximate memory footprint of the loaded signature and its hash table, 0 once
+        it is freed. A closed signature still used by a delta is not freed yet.
+        """
+        cdef:
+            size_t mask = sizeof(rs_weak_sum_t) - 1
+            size_t total = sizeof(rs_signature_t)
+            hashtable_t * table
+        with self.lock:
+            if self.sig == NULL:
+                return 0
+            total += <size_t>self.sig.size * (sizeof(rs_weak_sum_t) + ((<size_t>self.sig.strong_sum_len + mask) & ~mask))
+            table = self.sig.hashtable
+            if table:
+                total += sizeof(hashtable_t) + <size_t>table.size * (sizeof(unsigned) + sizeof(void *)) + (<size_t>table.size + 7) / 8
+        return total
+
+    cpdef inline Stats delta(self, object input, object output, size_t buffer_size=RS_JOB_BLOCKSIZE,
+                             bint adaptive=False, object observer=None):
+        """
+        Create a delta for the file input using this signature. The delta will be written to output.
+        :param input:
+        :param output: delta file
+        :param buffer_size: size of the I/O buffers
+        :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+        :param observer: receives the events of the job loop, the global observer if None
+        :return: the job statistics
+        """
+        cdef:
+            rs_job_t * c_job
+            Job job
+        self.acquire()
+        try:
+            with nogil:
+                c_job = rs_delta_begin(self.sig)
+            job = Job.from_ptr(c_job)
+            job.execute(input, output, buffer_size, adaptive, observer)
+            return job.statistics()
+        finally:
+            self.release()
+
+    cpdef inline close(self):
+        """
+        Free the signature. If a delta is still running, it is freed once that delta is done.
+        """
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self.users == 0:
+                self.free()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __dealloc__(self):
+        self.free()
+
+cpdef inline Stats delta(object input, object sigfile, object output, size_t buffer_size=RS_JOB_BLOCKSIZE,
+                         bint adaptive=False, object observer=None):
+    """
+    Create a delta for the file input using the signature read from sigfile. The delta
+    will be written to  output.
+    :param input: 
+    :param sigfile: a file-like object or a loaded Signature
+    :param output: delta file
+    :param buffer_size: size of the I/O buffers
+    :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+    :param observer: receives the events of the job loop, the global observer if None
+    :return: the job statistics
+    """
+    cdef Signature sig
+    if isinstance(sigfile, Signature):
+        return (<Signature>sigfile).delta(input, output, buffer_size, adaptive, observer)
+    sig = Signature(sigfile)
+    try:
+        return sig.delta(input, output, buffer_size, adaptive, observer)
     finally:
-        rs_free_sumset(sig)
+        sig.close()
+
+cdef enum:
+    READAHEAD_ALIGN = 4096  # read-ahead windows start on a page boundary
 
 cdef struct input_args:
     PyObject *file
     char* buffer
     Py_ssize_t len
+    size_t calls  # copies served, for the observer
+    rs_long_t nbytes
+    size_t window  # read-ahead size, 0 reads every copy on its own
+    rs_long_t start  # offset in the basis of buffer
+    Py_ssize_t size  # bytes of the basis in buffer
+    bint eof  # buffer reaches the end of the basis
+    size_t hits  # copies served from buffer without a read
+    size_t misses
+    rs_long_t read_bytes
 
-cdef rs_result read_cb(void *opaque, rs_long_t pos, size_t *len, void ** buf) except * with gil:
-    cdef  input_args* args = <input_args*>opaque
+cdef int fill(input_args* args, rs_long_t pos, size_t size) except -1:
     input = <object>args.file
     input.seek(pos)
-    block = input.read(len[0]) # type: bytes
+    block = input.read(size) # type: bytes
     cdef Py_ssize_t block_size = PyBytes_GET_SIZE(block)
     cdef void* temp
     if block_size > args.len:
@@ -288,31 +886,500 @@ cdef rs_result read_cb(void *opaque, rs_long_t pos, size_t *len, void ** buf) ex
             raise MemoryError
         args.buffer = <char*>temp
         args.len = block_size
-
-    len[0] = <size_t>block_size
     memcpy(args.buffer, PyBytes_AS_STRING(block), <size_t>block_size)
-    (<char**> buf)[0] = args.buffer
+    args.start = pos
+    args.size = block_size
+    args.eof = <size_t>block_size < size
+    return 0
+
+cdef rs_result read_cb(void *opaque, rs_long_t pos, size_t *len, void ** buf) except * with gil:
+    cdef  input_args* args = <input_args*>opaque
+    cdef rs_long_t offset = pos - args.start
+    if not args.window:
+        fill(args, pos, len[0])
+        offset = 0
+    elif offset >= 0 and offset < args.size and (offset + <rs_long_t> len[0] <= args.size or args.eof):
+        args.hits += 1
+    else:
+        # one page-aligned read of a window serves this copy and the nearby ones after it
+        args.misses += 1
+        offset = pos % READAHEAD_ALIGN
+        fill(args, pos - offset, max(args.window, <size_t> offset + len[0]))
+        args.read_bytes += args.size
+    if offset >= args.size:
+        len[0] = 0
+    elif len[0] > <size_t> (args.size - offset):
+        len[0] = <size_t> (args.size - offset)
+    args.calls += 1
+    args.nbytes += len[0]
+    (<char**> buf)[0] = args.buffer + offset
+    return RS_DONE
+
+
+cdef struct buffer_args:
+    const char * data
+    size_t len
+    size_t calls  # copies served, for the observer
+    rs_long_t nbytes
+
+cdef rs_result buffer_cb(void *opaque, rs_long_t pos, size_t *len, void ** buf) noexcept nogil:
+    # serve the copy straight from the mapped basis, no GIL, no seek and no copy here
+    cdef buffer_args * args = <buffer_args *> opaque
+    if pos < 0 or <size_t> pos >= args.len:
+        return RS_INPUT_ENDED
+    if len[0] > args.len - <size_t> pos:
+        len[0] = args.len - <size_t> pos
+    args.calls += 1
+    args.nbytes += len[0]
+    buf[0] = <void *> (args.data + pos)
     return RS_DONE
 
+cdef object mapped_basis(object input, bint use_mmap):
+    """
+    Find a buffer exposing the whole basis: the basis itself if it supports the buffer
+    protocol, the buffer of a BytesIO, or a read-only mmap of a regular file.
+    Return None when the basis has to be read through seek and read.
+    """
+    cdef int fd
+    if PyObject_CheckBuffer(input):
+        return input
+    if isinstance(input, BytesIO):
+        return input.getbuffer()
+    if use_mmap and PyObject_HasAttrString(input, "fileno"):
+        try:
+            fd = input.fileno()
+            st = os.fstat(fd)
+        except (OSError, ValueError):
+            return None
+        # an empty file can not be mapped
+        if S_ISREG(st.st_mode) and st.st_size > 0:
+            if PyObject_HasAttrString(input, "flush"):
+                input.flush()
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    return None
 
-cpdef inline patch(object input, object delta, object output):
+@cython.final
+@cython.no_gc
+@cython.internal
+cdef class Basis:
+    """
+    The basis of a patch, handed to librsync through a copy callback.
+    """
+    cdef:
+        object file
+        object mapping  # the buffer exposing the basis, if any
+        Py_buffer view
+        bint has_view
+        bint is_mapped  # copies are served by buffer_cb from mapped, else by read_cb
+        buffer_args mapped
+        input_args args
+
+    def __cinit__(self, object file, bint use_mmap, size_t readahead=0):
+        self.file = file
+        self.args.file = <PyObject *> file
+        self.args.buffer = NULL
+        self.args.len = 0
+        self.args.calls = 0
+        self.args.nbytes = 0
+        self.args.window = readahead
+        self.args.start = 0
+        self.args.size = 0
+        self.args.eof = False
+        self.args.hits = 0
+        self.args.misses = 0
+        self.args.read_bytes = 0
+        self.mapped.calls = 0
+        self.mapped.nbytes = 0
+        self.mapping = mapped_basis(file, use_mmap)
+        self.is_mapped = self.mapping is not None
+        if self.is_mapped:
+            PyObject_GetBuffer(self.mapping, &self.view, PyBUF_SIMPLE)
+            self.has_view = True
+            self.mapped.data = <const char *> self.view.buf
+            self.mapped.len = <size_t> self.view.len
+
+    cdef rs_job_t * patch_begin(self) noexcept nogil:
+        if self.has_view:
+            return rs_patch_begin(<rs_copy_cb *> buffer_cb, <void *> &self.mapped)
+        return rs_patch_begin(read_cb, <void *> &self.args)
+
+    cdef tuple copies(self):
+        """
+        The number of copies served from the basis and their bytes.
+        """
+        if self.is_mapped:
+            return self.mapped.calls, self.mapped.nbytes
+        return self.args.calls, self.args.nbytes
+
+    cdef bint reads_ahead(self):
+        return not self.is_mapped and self.args.window > 0
+
+    cdef tuple readahead(self):
+        """
+        The copies served from the read-ahead window, those which needed a read, and the bytes read.
+        """
+        return self.args.hits, self.args.misses, self.args.read_bytes
+
+    cdef close(self):
+        if self.has_view:
+            PyBuffer_Release(&self.view)
+            self.has_view = False
+        if self.mapping is not None and self.mapping is not self.file:
+            if isinstance(self.mapping, mmap.mmap):
+                self.mapping.close()
+            else:
+                self.mapping.release()
+        self.mapping = None
+        PyMem_Free(self.args.buffer)
+        self.args.buffer = NULL
+
+    def __dealloc__(self):
+        if self.has_view:
+            PyBuffer_Release(&self.view)
+            self.has_view = False
+        PyMem_Free(self.args.buffer)
+        self.args.buffer = NULL
+
+cpdef inline Stats patch(object input, object delta, object output, size_t buffer_size=RS_JOB_BLOCKSIZE,
+                         bint adaptive=False, bint use_mmap=True, object observer=None, size_t readahead=0):
     """
     Patch the file  input using the delta . The patched file will be written to
     output.
-    :param input: 
+    :param input: a seekable file-like object, or a bytes-like object
     :param delta: 
     :param output: 
-    :return: 
+    :param buffer_size: size of the I/O buffers
+    :param adaptive: grow buffer_size toward RS_JOB_MAX_BLOCKSIZE while throughput improves
+    :param use_mmap: map input into memory when it is a regular file, so copies are served without the GIL
+    :param observer: receives the events of the job loop, the global observer if None
+    :param readahead: when input is read through seek and read, read it by aligned windows of this
+        size and serve nearby copies from the last one, 0 reads every copy on its own
+    :return: the job statistics
     """
-    cdef input_args args
-    args.file= <PyObject *>input
-    args.buffer = NULL
-    args.len = 0
+    cdef Basis basis = Basis(input, use_mmap, readahead)
     cdef rs_job_t * c_job
+    cdef Job job
+    try:
+        with nogil:
+            c_job = basis.patch_begin()
+        job = Job.from_ptr(c_job)
+        job.basis = basis
+        job.execute(delta, output, buffer_size, adaptive, observer)
+        return job.statistics()
+    finally:
+        basis.close()
+
+cdef FILE * open_file(object file, bint write) except NULL:
+    """
+    Open a path, or a duplicate of a file descriptor, as a C FILE.
+    """
+    cdef:
+        int fd
+        FILE * c_file
+    if isinstance(file, int):
+        fd = os.dup(file)
+    elif write:
+        fd = os.open(file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o666)
+    else:
+        fd = os.open(file, os.O_RDONLY | O_BINARY)
+    if write:
+        c_file = fdopen(fd, "wb")
+    else:
+        c_file = fdopen(fd, "rb")
+    if c_file == NULL:
+        os.close(fd)
+        raise OSError(errno, (<bytes>strerror(errno)).decode())
+    return c_file
+
+cdef int close_file(FILE * c_file) except -1:
+    if fclose(c_file) != 0:
+        raise OSError(errno, (<bytes>strerror(errno)).decode())
+    return 0
+
+cpdef inline Stats signature_file(object input, object output, size_t strong_len, rs_magic_number sig_magic,
+                                  size_t block_size=RS_DEFAULT_BLOCK_LEN):
+    """
+    Generate a signature for the file input. The signature will be written to output.
+    Both are paths or file descriptors, and the whole job runs in C with the GIL released.
+    :param input: path or file descriptor
+    :param output: path or file descriptor
+    :param strong_len:
+    :param sig_magic:
+    :param block_size:
+    :return: the job statistics
+    """
+    cdef:
+        double started = perf_counter()
+        FILE * c_input = open_file(input, False)
+        FILE * c_output = NULL
+        rs_stats_t stats
+        rs_result result
+    try:
+        c_output = open_file(output, True)
+        with nogil:
+            result = rs_sig_file(c_input, c_output, block_size, strong_len, sig_magic, &stats)
+        maybe_flush_trace()
+    finally:
+        close_file(c_input)
+        if c_output != NULL:
+            close_file(c_output)
+    if result != RS_DONE:
+        raise LibrsyncError(result)
+    return Stats.from_ptr(&stats, perf_counter() - started)
+
+cpdef inline Stats delta_file(object input, object sigfile, object output):
+    """
+    Create a delta for the file input using the signature read from sigfile. The delta
+    will be written to output. All of them are paths or file descriptors, and the whole
+    job runs in C with the GIL released.
+    :param input: path or file descriptor
+    :param sigfile: path, file descriptor or a loaded Signature
+    :param output: path or file descriptor
+    :return: the job statistics
+    """
+    cdef:
+        double started = perf_counter()
+        Signature loaded = None
+        rs_signature_t * sig = NULL
+        FILE * c_sigfile
+        FILE * c_input = NULL
+        FILE * c_output = NULL
+        rs_stats_t stats
+        rs_result result = RS_DONE
+    if isinstance(sigfile, Signature):
+        loaded = <Signature>sigfile
+        loaded.acquire()
+        sig = loaded.sig
+    else:
+        c_sigfile = open_file(sigfile, False)
+        try:
+            with nogil:
+                result = rs_loadsig_file(c_sigfile, &sig, &stats)
+                if result == RS_DONE:
+                    result = rs_build_hash_table(sig)
+        finally:
+            close_file(c_sigfile)
+    try:
+        if result != RS_DONE:
+            raise LibrsyncError(result)
+        c_input = open_file(input, False)
+        c_output = open_file(output, True)
+        with nogil:
+            result = rs_delta_file(sig, c_input, c_output, &stats)
+        maybe_flush_trace()
+    finally:
+        if c_input != NULL:
+            close_file(c_input)
+        if c_output != NULL:
+            close_file(c_output)
+        if loaded is not None:
+            loaded.release()
+        elif sig != NULL:
+            rs_free_sumset(sig)
+    if result != RS_DONE:
+        raise LibrsyncError(result)
+    return Stats.from_ptr(&stats, perf_counter() - started)
+
+cpdef inline Stats patch_file(object input, object delta, object output):
+    """
+    Patch the file input using the delta. The patched file will be written to output.
+    All of them are paths or file descriptors, input must be seekable, and the whole
+    job runs in C with the GIL released.
+    :param input: path or file descriptor
+    :param delta: path or file descriptor
+    :param output: path or file descriptor
+    :return: the job statistics
+    """
+    cdef:
+        double started = perf_counter()
+        FILE * c_input = open_file(input, False)
+        FILE * c_delta = NULL
+        FILE * c_output = NULL
+        rs_stats_t stats
+        rs_result result
+    try:
+        c_delta = open_file(delta, False)
+        c_output = open_file(output, True)
+        with nogil:
+            result = rs_patch_file(c_input, c_delta, c_output, &stats)
+        maybe_flush_trace()
+    finally:
+        close_file(c_input)
+        if c_delta != NULL:
+            close_file(c_delta)
+        if c_output != NULL:
+            close_file(c_output)
+    if result != RS_DONE:
+        raise LibrsyncError(result)
+    return Stats.from_ptr(&stats, perf_counter() - started)
+
+cpdef inline object signature_bytes(object data, size_t strong_len=0, int sig_magic=0, size_t block_size=0,
+                                    bint stats=False):
+    """
+    Generate the signature of a bytes-like object in one go.
+    Arguments left to 0 are chosen by ``get_signature_args`` from the size of data.
+    :param data: a bytes-like object
+    :param strong_len:
+    :param sig_magic:
+    :param block_size:
+    :param stats: also return the job statistics
+    :return: the signature, or a (signature, Stats) tuple
+    """
+    cdef:
+        const unsigned char[::1] view = data
+        rs_magic_number c_magic
+        rs_job_t * c_job
+        size_t size
+    c_magic, block_size, strong_len = get_signature_args(view.shape[0], sig_magic, block_size, strong_len)
+    # the header, then a weak and a strong sum per block
+    size = 12 + (<size_t> view.shape[0] + block_size - 1) / block_size * (4 + strong_len)
     with nogil:
-        c_job = rs_patch_begin(read_cb, <void*>&args)
+        c_job = rs_sig_begin(block_size, strong_len, c_magic)
     cdef Job job = Job.from_ptr(c_job)
+    out = job.transform(view, size)
+    return (out, job.statistics()) if stats else out
+
+cpdef inline object delta_bytes(object data, object sig, bint stats=False):
+    """
+    Create the delta of a bytes-like object in one go.
+    :param data: a bytes-like object
+    :param sig: a bytes-like object holding the signature, or a loaded Signature
+    :param stats: also return the job statistics
+    :return: the delta, or a (delta, Stats) tuple
+    """
+    cdef:
+        const unsigned char[::1] view = data
+        Signature loaded
+        rs_job_t * c_job
+        Job job
+    if isinstance(sig, Signature):
+        loaded = <Signature>sig
+    else:
+        loaded = Signature(sig)
+    loaded.acquire()
     try:
-        job.execute(delta, output)
+        with nogil:
+            c_job = rs_delta_begin(loaded.sig)
+        job = Job.from_ptr(c_job)
+        # room for all of data as literals plus the command headers
+        out = job.transform(view, <size_t> view.shape[0] + <size_t> view.shape[0] / 64 + 64)
+        return (out, job.statistics()) if stats else out
     finally:
-        PyMem_Free(args.buffer)
+        loaded.release()
+        if loaded is not sig:
+            loaded.close()
+
+cpdef inline object patch_bytes(object basis, object delta, bint stats=False):
+    """
+    Apply a delta to a bytes-like basis in one go.
+    :param basis: a bytes-like object
+    :param delta: a bytes-like object
+    :param stats: also return the job statistics
+    :return: the new data, or a (data, Stats) tuple
+    """
+    cdef:
+        const unsigned char[::1] view = delta
+        Basis c_basis = Basis(basis, False)
+        rs_job_t * c_job
+        Job job
+    try:
+        with nogil:
+            c_job = c_basis.patch_begin()
+        job = Job.from_ptr(c_job)
+        out = job.transform(view, <size_t> c_basis.mapped.len + <size_t> view.shape[0])
+        return (out, job.statistics()) if stats else out
+    finally:
+        c_basis.close()
+
+@cython.final
+cdef class SignatureJob(Job):
+    """
+    Push-style signature generation: ``feed`` chunks of the basis file as they arrive,
+    then ``finish``. Every call returns the part of the signature produced so far.
+    """
+    def __cinit__(self, size_t strong_len, rs_magic_number sig_magic, size_t block_size=RS_DEFAULT_BLOCK_LEN):
+        with nogil:
+            self.job = rs_sig_begin(block_size, strong_len, sig_magic)
+
+@cython.final
+cdef class DeltaJob(Job):
+    """
+    Push-style delta generation: ``feed`` chunks of the new file as they arrive,
+    then ``finish``. Every call returns the part of the delta produced so far.
+    """
+    cdef:
+        Signature sig
+        bint owns_sig
+        bint acquired
+
+    def __cinit__(self, object sigfile):
+        if isinstance(sigfile, Signature):
+            self.sig = <Signature>sigfile
+        else:
+            self.sig = Signature(sigfile)
+            self.owns_sig = True
+        self.sig.acquire()
+        self.acquired = True
+        with nogil:
+            self.job = rs_delta_begin(self.sig.sig)
+
+    def finish(self):
+        """
+        Signal the end of input and flush the job.
+        :return: the rest of the output
+        """
+        try:
+            return Job.finish(self)
+        finally:
+            self.detach()
+
+    cdef inline void detach(self):
+        if self.acquired:
+            self.acquired = False
+            self.sig.release()
+            if self.owns_sig:
+                self.sig.close()
+
+    def __dealloc__(self):
+        if self.job:
+            rs_job_free(self.job)
+        self.job = NULL
+        if self.sig is not None:
+            self.detach()
+
+@cython.final
+cdef class PatchJob(Job):
+    """
+    Push-style patching of the basis: ``feed`` chunks of the delta as they arrive,
+    then ``finish``. Every call returns the part of the new file produced so far.
+    """
+
+    def __cinit__(self, object basis, bint use_mmap=True, size_t readahead=0):
+        self.basis = Basis(basis, use_mmap, readahead)
+        with nogil:
+            self.job = self.basis.patch_begin()
+
+    def basis_stats(self):
+        """
+        How the basis served the copies so far: the copies and their bytes, and with
+        read-ahead the copies served from the window, those which needed a read and the bytes read.
+        """
+        calls, nbytes = self.basis.copies()
+        hits, misses, read_bytes = self.basis.readahead()
+        return {
+            "copies": calls,
+            "copy_bytes": nbytes,
+            "hits": hits,
+            "misses": misses,
+            "read_bytes": read_bytes,
+        }
+
+    def finish(self):
+        """
+        Signal the end of input and flush the job.
+        :return: the rest of the output
+        """
+        try:
+            return Job.finish(self)
+        finally:
+            self.basis.close()
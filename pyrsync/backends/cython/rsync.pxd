@@ -24,10 +24,10 @@ cdef extern from "librsync.h" nogil:
         RS_LOG_NOTICE    #     /**< Normal but significant condition */
         RS_LOG_INFO      #     /**< Informational */
         RS_LOG_DEBUG      #     /**< Debug-level messages */
-    ctypedef void rs_trace_fn_t(rs_loglevel level, char *msg)
+    ctypedef void rs_trace_fn_t(rs_loglevel level, const char *msg)
     void rs_trace_set_level(rs_loglevel level)
     void rs_trace_to(rs_trace_fn_t *)
-    void rs_trace_stderr(rs_loglevel level, char * msg)
+    void rs_trace_stderr(rs_loglevel level, const char * msg)
     int rs_supports_trace()
     void rs_hexify(char *to_buf, void * from_buf, int from_len)
     size_t rs_unbase64(char *s)
@@ -87,7 +87,14 @@ cdef extern from "librsync.h" nogil:
     void rs_mdfour_result(rs_mdfour_t *md, unsigned char *out)
     char *rs_format_stats(rs_stats_t * stats, char * buf, size_t size )
     int rs_log_stats(rs_stats_t * stats)
-    ctypedef struct rs_signature_t
+    ctypedef struct rs_signature_t:
+        int magic
+        int block_len
+        int strong_sum_len
+        int count
+        int size
+        void *block_sigs
+        hashtable_t *hashtable
 
     void rs_signature_log_stats(rs_signature_t *sig)
     void rs_free_sumset(rs_signature_t *sig)
@@ -142,5 +149,13 @@ cdef extern from "librsync.h" nogil:
     rs_result rs_patch_file(FILE *basis_file, FILE *delta_file,
                             FILE *new_file, rs_stats_t *)
 
+cdef extern from "stdio.h" nogil:
+    FILE *fdopen(int fd, const char *mode)
+
+cdef extern from "sumset.h" nogil:
+    ctypedef struct hashtable_t:
+        int size
+        int count
+
 cdef extern from "job.h" nogil:
     rs_job_t *rs_job_new(const char *, rs_result (*statefn)(rs_job_t *))
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from pyrsync.backends import (
+    delta_file,
+    get_signature_args,
+    patch_file,
+    signature_file,
+)
+
+__all__ = ["BatchResult", "sign_many", "delta_many", "patch_many"]
+
+BatchResult = namedtuple("BatchResult", ["input", "output", "stats", "error"])
+BatchResult.__doc__ = """
+The outcome of one file of a batch: the job statistics, or the exception raised.
+"""
+
+
+def _run(func, items, workers):
+    """
+    Run func over items on a thread pool. The *_file functions run the whole job in
+    C with the GIL released, so the threads scale with cores on every backend.
+    """
+
+    def call(args):
+        try:
+            return BatchResult(args[0], args[-1], func(*args), None)
+        except Exception as e:
+            return BatchResult(args[0], args[-1], None, e)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, items))
+
+
+def sign_many(
+    items,
+    workers: int = None,
+    strong_len: int = 0,
+    sig_magic: int = 0,
+    block_size: int = 0,
+    suffix: str = ".sig",
+) -> list:
+    """
+    Generate the signatures of many files at once.
+    Arguments left to 0 are chosen by ``get_signature_args`` from the size of each file.
+    :param items: paths, str or bytes, signed to path + suffix, or (input, output) pairs of paths
+    :param workers: number of threads, the number of CPUs if None
+    :param strong_len:
+    :param sig_magic:
+    :param block_size:
+    :param suffix: appended to a bare path to name its signature
+    :return: a BatchResult per item, in order
+    """
+
+    def sign(input, output):
+        magic, block_len, strong = get_signature_args(
+            os.stat(input).st_size, sig_magic, block_size, strong_len
+        )
+        return signature_file(input, output, strong, magic, block_len)
+
+    def named(path):
+        path = os.fspath(path)
+        return path + (os.fsencode(suffix) if isinstance(path, bytes) else suffix)
+
+    items = [
+        (item, named(item))
+        if isinstance(item, (str, bytes, os.PathLike))
+        else tuple(item)
+        for item in items
+    ]
+    return _run(sign, items, workers)
+
+
+def delta_many(items, workers: int = None) -> list:
+    """
+    Create the deltas of many files at once.
+    :param items: (input, sigfile, output) triples of paths; sigfile may also be a loaded
+        Signature, which is then shared by all the threads using it
+    :param workers: number of threads, the number of CPUs if None
+    :return: a BatchResult per item, in order
+    """
+    return _run(delta_file, [tuple(item) for item in items], workers)
+
+
+def patch_many(items, workers: int = None) -> list:
+    """
+    Patch many files at once.
+    :param items: (basis, delta, output) triples of paths
+    :param workers: number of threads, the number of CPUs if None
+    :return: a BatchResult per item, in order
+    """
+    return _run(patch_file, [tuple(item) for item in items], workers)
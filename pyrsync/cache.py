@@ -0,0 +1,180 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import hashlib
+import os
+from collections import OrderedDict
+from io import BytesIO
+from threading import Lock
+
+from pyrsync.backends import get_signature_args, signature
+
+__all__ = ["SignatureCache"]
+
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # default memory budget of a SignatureCache
+
+
+class SignatureCache:
+    """
+    Signatures of files, reused as long as the files do not change. A file is known by
+    its path, size, modification time and inode, so an unchanged file is only stat'ed.
+    Signatures are kept in memory, least recently used first out once they exceed
+    max_bytes, and optionally in a directory where they survive the process.
+    Safe to share between threads.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_entries",
+        "max_bytes",
+        "directory",
+        "size",
+        "hits",
+        "disk_hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, directory: str = None):
+        """
+        :param max_bytes: total size of the signatures kept in memory
+        :param directory: where signatures are also stored, created if needed; None keeps them in memory only
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.size = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Zero the counters, the cached signatures stay.
+        """
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(path, st: os.stat_result, magic: int, block_len: int, strong_len: int) -> tuple:
+        return (
+            os.path.abspath(os.fspath(path)),
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ino,
+            magic,
+            block_len,
+            strong_len,
+        )
+
+    def _disk_path(self, key: tuple) -> str:
+        name = hashlib.sha256(repr(key).encode("utf-8", "surrogateescape")).hexdigest()
+        return os.path.join(self.directory, name + ".sig")
+
+    def _get(self, key: tuple):
+        with self._lock:
+            sig = self._entries.get(key)
+            if sig is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return sig
+        if self.directory is not None:
+            try:
+                with open(self._disk_path(key), "rb") as f:
+                    sig = f.read()
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self.disk_hits += 1
+                self._put(key, sig, False)
+                return sig
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _put(self, key: tuple, sig: bytes, persist: bool = True) -> None:
+        if persist and self.directory is not None:
+            path = self._disk_path(key)
+            tmp = "%s.%d.%d.tmp" % (path, os.getpid(), id(sig))
+            with open(tmp, "wb") as f:
+                f.write(sig)
+            os.replace(tmp, path)
+        if len(sig) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = sig
+            self.size += len(sig)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def signature(
+        self,
+        path,
+        strong_len: int = 0,
+        sig_magic: int = 0,
+        block_size: int = 0,
+    ) -> bytes:
+        """
+        The signature of the file at path, computed only when it is not cached.
+        Arguments left to 0 are chosen by ``get_signature_args`` from the size of the file.
+        :param path: path of a regular file
+        :param strong_len:
+        :param sig_magic:
+        :param block_size:
+        :return: the signature, as ``signature`` would write it
+        """
+        st = os.stat(path)
+        magic, block_len, strong_len = get_signature_args(
+            st.st_size, sig_magic, block_size, strong_len
+        )
+        key = self.key(path, st, magic, block_len, strong_len)
+        sig = self._get(key)
+        if sig is not None:
+            return sig
+        output = BytesIO()
+        with open(path, "rb") as f:
+            signature(f, output, strong_len, magic, block_len)
+            after = os.fstat(f.fileno())
+        sig = output.getvalue()
+        # a file written to while it was read gets a fresh signature next time
+        if (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            self._put(key, sig)
+        return sig
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Drop the signatures kept in memory, and those in the directory if disk is true.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".sig"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
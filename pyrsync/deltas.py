@@ -0,0 +1,523 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import os
+import time
+from array import array
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from time import perf_counter
+
+from pyrsync.backends import (
+    RS_DELTA_MAGIC,
+    RS_JOB_BLOCKSIZE,
+    Stats,
+    delta,
+    signature_bytes,
+)
+
+__all__ = [
+    "LITERAL",
+    "COPY",
+    "DeltaCommand",
+    "DeltaParser",
+    "DeltaTable",
+    "iter_delta",
+    "inspect_delta",
+    "DeltaSource",
+    "delta_precheck",
+]
+
+LITERAL = 0
+COPY = 1
+
+DeltaCommand = namedtuple("DeltaCommand", ["kind", "offset", "length", "position"])
+DeltaCommand.__doc__ = """
+A command of a delta: kind is LITERAL or COPY, offset and length locate its output in the
+patched data, position is where its bytes come from: the offset in the basis of a COPY,
+the offset in the delta of the data of a LITERAL.
+"""
+
+PRECHECK_CHUNK_SIZE = 1024 * 1024  # input bytes hashed at once by delta_precheck
+SIG_HEADER_SIZE = 12  # magic, block_len and strong_len as big-endian u32
+
+_WIDTHS = (1, 2, 4, 8)
+# header bytes and parameter widths of every opcode, None for END and the reserved ones
+_OPCODES = [None] * 256
+for _op in range(0x01, 0x41):
+    _OPCODES[_op] = (LITERAL, 1, 0, 0)  # the length is the opcode
+for _op in range(0x41, 0x45):
+    _OPCODES[_op] = (LITERAL, 1 + _WIDTHS[_op - 0x41], _WIDTHS[_op - 0x41], 0)
+for _op in range(0x45, 0x55):
+    _pos, _len = _WIDTHS[(_op - 0x45) // 4], _WIDTHS[(_op - 0x45) % 4]
+    _OPCODES[_op] = (COPY, 1 + _pos + _len, _pos, _len)
+del _op, _pos, _len
+
+
+class DeltaParser:
+    """
+    Decode the commands of a delta as it is fed, without the data of its literals.
+    """
+
+    __slots__ = ("_buffer", "_base", "_skip", "_started", "done", "output_size")
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._base = 0  # offset in the delta of the start of _buffer
+        self._skip = 0  # literal bytes still to pass over
+        self._started = False
+        self.done = False
+        self.output_size = 0
+
+    def feed(self, data) -> list:
+        """
+        Decode what data completes, the rest waits for the next call.
+        :param data: the next bytes of the delta
+        :return: the DeltaCommands decoded
+        """
+        commands = []
+        if self.done:
+            return commands
+        buffer = self._buffer
+        if self._skip and not buffer:
+            # pass over literal data without copying it
+            n = min(self._skip, len(data))
+            self._skip -= n
+            self._base += n
+            data = memoryview(data)[n:]
+        buffer += data
+        i = 0
+        end = len(buffer)
+        if not self._started:
+            if end < 4:
+                return commands
+            magic = int.from_bytes(buffer[:4], "big")
+            if magic != RS_DELTA_MAGIC:
+                raise ValueError("not a delta, magic %#x" % magic)
+            self._started = True
+            i = 4
+        out = self.output_size
+        while i < end and not self._skip:
+            op = buffer[i]
+            if op == 0:
+                self.done = True
+                i += 1
+                break
+            command = _OPCODES[op]
+            if command is None:
+                raise ValueError(
+                    "reserved opcode %#x at offset %d of the delta" % (op, self._base + i)
+                )
+            kind, size, first, second = command
+            if end - i < size:
+                break
+            if kind == LITERAL:
+                length = (
+                    int.from_bytes(buffer[i + 1 : i + size], "big") if first else op
+                )
+                i += size
+                commands.append(DeltaCommand(LITERAL, out, length, self._base + i))
+                n = min(length, end - i)
+                i += n
+                self._skip = length - n
+            else:
+                position = int.from_bytes(buffer[i + 1 : i + 1 + first], "big")
+                length = int.from_bytes(buffer[i + 1 + first : i + size], "big")
+                i += size
+                commands.append(DeltaCommand(COPY, out, length, position))
+            out += length
+        self.output_size = out
+        self._consume(i)
+        return commands
+
+    def _consume(self, n: int) -> None:
+        del self._buffer[:n]
+        self._base += n
+
+    def finish(self) -> None:
+        """
+        Check that the delta ended.
+        """
+        if not self.done:
+            raise ValueError("truncated delta, no end command")
+
+
+def _chunks(input, buffer_size: int):
+    if isinstance(input, (str, os.PathLike)):
+        with open(input, "rb") as f:
+            yield from _chunks(f, buffer_size)
+        return
+    if not hasattr(input, "read"):
+        yield input
+        return
+    while True:
+        data = input.read(buffer_size)
+        if not data:
+            return
+        yield data
+
+
+def iter_delta(input, buffer_size: int = RS_JOB_BLOCKSIZE):
+    """
+    Decode the commands of a delta while it is read, literal data is skipped.
+    :param input: a path, a readable file-like object or a bytes-like object
+    :param buffer_size: size of the chunks read from input
+    :return: an iterator of DeltaCommand
+    """
+    parser = DeltaParser()
+    for data in _chunks(input, buffer_size):
+        yield from parser.feed(data)
+        if parser.done:
+            return
+    parser.finish()
+
+
+class DeltaTable:
+    """
+    The commands of a delta in four flat arrays, kinds, offsets, lengths and positions,
+    without an object per command.
+    """
+
+    __slots__ = ("kinds", "offsets", "lengths", "positions")
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.offsets = array("Q")
+        self.lengths = array("Q")
+        self.positions = array("Q")
+
+    def append(self, command: DeltaCommand) -> None:
+        self.kinds.append(command.kind)
+        self.offsets.append(command.offset)
+        self.lengths.append(command.length)
+        self.positions.append(command.position)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> DeltaCommand:
+        return DeltaCommand(
+            self.kinds[index],
+            self.offsets[index],
+            self.lengths[index],
+            self.positions[index],
+        )
+
+    def __iter__(self):
+        return map(DeltaCommand, self.kinds, self.offsets, self.lengths, self.positions)
+
+    @property
+    def output_size(self) -> int:
+        """
+        Size of the patched data.
+        """
+        return self.offsets[-1] + self.lengths[-1] if self.kinds else 0
+
+    def _total(self, kind: int):
+        return sum(
+            length for k, length in zip(self.kinds, self.lengths) if k == kind
+        )
+
+    @property
+    def literal_cmds(self) -> int:
+        return self.kinds.count(LITERAL)
+
+    @property
+    def copy_cmds(self) -> int:
+        return self.kinds.count(COPY)
+
+    @property
+    def literal_bytes(self) -> int:
+        return self._total(LITERAL)
+
+    @property
+    def copy_bytes(self) -> int:
+        return self._total(COPY)
+
+    def basis_ranges(self, gap: int = 0) -> list:
+        """
+        The ranges of the basis read by the copies, sorted and merged.
+        :param gap: also merge ranges at most gap bytes apart, to read them at once
+        :return: a list of (start, stop)
+        """
+        ranges = sorted(
+            (position, position + length)
+            for kind, position, length in zip(self.kinds, self.positions, self.lengths)
+            if kind == COPY and length
+        )
+        merged = []
+        for start, stop in ranges:
+            if merged and start <= merged[-1][1] + gap:
+                if stop > merged[-1][1]:
+                    merged[-1][1] = stop
+            else:
+                merged.append([start, stop])
+        return [tuple(r) for r in merged]
+
+    def __repr__(self):
+        return "DeltaTable(literal_cmds=%d, copy_cmds=%d, output_size=%d)" % (
+            self.literal_cmds,
+            self.copy_cmds,
+            self.output_size,
+        )
+
+
+def inspect_delta(
+    input, max_output_size: int = None, buffer_size: int = RS_JOB_BLOCKSIZE
+) -> DeltaTable:
+    """
+    Decode a whole delta into a DeltaTable, without patching anything.
+    :param input: a path, a readable file-like object or a bytes-like object
+    :param max_output_size: raise ValueError as soon as the patched data would be larger
+    :param buffer_size: size of the chunks read from input
+    """
+    table = DeltaTable()
+    for command in iter_delta(input, buffer_size):
+        if (
+            max_output_size is not None
+            and command.offset + command.length > max_output_size
+        ):
+            raise ValueError(
+                "the delta patches more than %d bytes" % max_output_size
+            )
+        table.append(command)
+    return table
+
+
+
+class DeltaSource:
+    """
+    A delta opened for random access: ``file`` is positioned for ``inspect_delta``, and
+    ``read`` returns the literal data at a position of a DeltaCommand.
+    """
+
+    __slots__ = ("file", "start", "close")
+
+    def __init__(self, delta):
+        """
+        :param delta: a path, a file descriptor, a seekable file-like object or a bytes-like object
+        """
+        self.close = None
+        if isinstance(delta, (str, os.PathLike)):
+            self.file = open(delta, "rb")
+            self.close = self.file.close
+        elif isinstance(delta, int):
+            self.file = open(delta, "rb", closefd=False)
+            self.close = self.file.close
+        elif hasattr(delta, "read"):
+            self.file = delta
+        else:
+            self.file = BytesIO(delta)
+        self.start = self.file.tell()
+
+    def read(self, position: int, size: int) -> bytes:
+        self.file.seek(self.start + position)
+        data = self.file.read(size)
+        if len(data) < size:
+            raise ValueError("truncated delta")
+        return data
+
+def _copy_command(position: int, length: int) -> bytes:
+    """
+    Encode a COPY with the narrowest widths.
+    """
+    p = next(i for i, w in enumerate(_WIDTHS) if position < 1 << 8 * w)
+    n = next(i for i, w in enumerate(_WIDTHS) if length < 1 << 8 * w)
+    return (
+        bytes((0x45 + 4 * p + n,))
+        + position.to_bytes(_WIDTHS[p], "big")
+        + length.to_bytes(_WIDTHS[n], "big")
+    )
+
+
+class _Rest:
+    """
+    What is left of the input: the chunks read ahead but not matched, then the rest of input.
+    """
+
+    __slots__ = ("head", "input")
+
+    def __init__(self, head, input):
+        self.head = deque(memoryview(chunk) for chunk in head if len(chunk))
+        self.input = input
+
+    def read(self, size: int) -> bytes:
+        if self.head:
+            chunk = self.head[0]
+            data = chunk[:size].tobytes()
+            if len(chunk) > size:
+                self.head[0] = chunk[size:]
+            else:
+                self.head.popleft()
+            return data
+        return self.input.read(size) if self.input is not None else b""
+
+
+class _SkipMagic:
+    """
+    An output dropping the magic the delta of the rest starts with.
+    """
+
+    __slots__ = ("output", "skip")
+
+    def __init__(self, output):
+        self.output = output
+        self.skip = 4
+
+    def write(self, data) -> int:
+        n = len(data)
+        if self.skip:
+            k = min(self.skip, n)
+            self.skip -= k
+            data = memoryview(data)[k:]
+        if len(data):
+            self.output.write(data)
+        return n
+
+
+def _read_full(input, size: int) -> bytes:
+    data = input.read(size)
+    while data and len(data) < size:
+        more = input.read(size - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+
+def delta_precheck(
+    input,
+    sig,
+    output,
+    buffer_size: int = RS_JOB_BLOCKSIZE,
+    loaded=None,
+    workers: int = None,
+) -> Stats:
+    """
+    Create a delta like ``delta``, first checking whether input starts as the basis did:
+    the blocks of input are hashed in order on several threads and compared with those
+    of the signature, without the rolling search nor the hash table. The longest such
+    prefix becomes a single COPY, and only what follows it goes through ``delta``. An
+    unchanged file costs one pass of hashing spread over the threads, a file which only
+    grew at the end is searched from its last old block on. When input does not start
+    as the basis, the delta is that of ``delta``.
+    :param input: a path, a readable file-like object or a bytes-like object
+    :param sig: a bytes-like object holding the signature
+    :param output: a writable file-like object
+    :param buffer_size: size of the I/O buffers of ``delta``
+    :param loaded: the same signature as a loaded Signature, to search the rest of input without loading it again;
+        ValueError if its header or number of blocks differ from those of sig
+    :param workers: number of hashing threads, the number of CPUs if None
+    :return: the statistics of the delta
+    """
+    started = perf_counter()
+    sig = memoryview(sig).cast("B")
+    if len(sig) < SIG_HEADER_SIZE:
+        raise ValueError("truncated signature")
+    if isinstance(input, (str, os.PathLike)):
+        with open(input, "rb") as f:
+            return delta_precheck(f, sig, output, buffer_size, loaded, workers)
+    if not hasattr(input, "read"):
+        input = BytesIO(input)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    magic = int.from_bytes(sig[:4], "big")
+    block_len = int.from_bytes(sig[4:8], "big")
+    strong_len = int.from_bytes(sig[8:12], "big")
+    entry = 4 + strong_len
+    entries = sig[SIG_HEADER_SIZE:]
+    if loaded is not None and (
+        loaded.magic,
+        loaded.block_len,
+        loaded.strong_len,
+        loaded.block_count,
+    ) != (magic, block_len, strong_len, len(entries) // entry):
+        raise ValueError("loaded is not the signature in sig")
+    chunk_size = max(PRECHECK_CHUNK_SIZE // block_len, 1) * block_len
+
+    def sums(chunk):
+        return signature_bytes(chunk, strong_len, magic, block_len)[SIG_HEADER_SIZE:]
+
+    matched = 0  # bytes of input equal to the start of the basis
+    head = []  # chunks read but not matched
+    eof = False
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # keep a bounded number of chunks hashing ahead, as long as there is input
+            while not eof and len(pending) < 2 * workers:
+                chunk = _read_full(input, chunk_size)
+                eof = len(chunk) < chunk_size
+                if chunk:
+                    pending.append((chunk, executor.submit(sums, chunk)))
+            if not pending:
+                break
+            chunk, future = pending.popleft()
+            new = future.result()
+            start = matched // block_len * entry
+            old = entries[start : start + len(new)].tobytes()
+            if new == old:
+                matched += len(chunk)
+                continue
+            # the first block which differs
+            k = 0
+            while k + entry <= min(len(new), len(old)) and (
+                new[k : k + entry] == old[k : k + entry]
+            ):
+                k += entry
+            matched += k // entry * block_len
+            head.append(memoryview(chunk)[k // entry * block_len :])
+            for chunk, future in pending:
+                future.cancel()
+                head.append(chunk)
+            pending.clear()
+            break
+
+    rest = _Rest(head, None if eof else input)
+    if not matched:
+        stats = delta(
+            rest, loaded if loaded is not None else BytesIO(sig), output, buffer_size
+        ).as_dict()
+        # the time spent on the pre-check counts too
+        stats["elapsed"] = perf_counter() - started
+        return Stats.from_dict(stats)
+    command = _copy_command(0, matched)
+    output.write(RS_DELTA_MAGIC.to_bytes(4, "big"))
+    output.write(command)
+    if rest.head or not eof:
+        tail = delta(
+            rest,
+            loaded if loaded is not None else BytesIO(sig),
+            _SkipMagic(output),
+            buffer_size,
+        ).as_dict()
+    else:
+        # nothing left to search
+        output.write(b"\0")
+        now = int(time.time())
+        tail = dict.fromkeys(
+            (
+                "lit_cmds",
+                "lit_bytes",
+                "lit_cmdbytes",
+                "copy_cmds",
+                "copy_bytes",
+                "copy_cmdbytes",
+                "sig_cmds",
+                "sig_bytes",
+                "false_matches",
+                "sig_blocks",
+                "block_len",
+                "in_bytes",
+            ),
+            0,
+        )
+        tail.update(op="delta", out_bytes=5, start=now, end=now, buffer_size=chunk_size)
+    tail["copy_cmds"] += 1
+    tail["copy_bytes"] += matched
+    tail["copy_cmdbytes"] += len(command)
+    tail["in_bytes"] += matched
+    tail["out_bytes"] += len(command)
+    tail["elapsed"] = perf_counter() - started
+    return Stats.from_dict(tail)
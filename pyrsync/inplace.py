@@ -0,0 +1,214 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import os
+import tempfile
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from heapq import heapify, heappop
+from time import perf_counter
+
+from pyrsync.backends import Stats
+from pyrsync.deltas import COPY, DeltaSource, inspect_delta
+
+__all__ = ["plan_inplace", "patch_inplace"]
+
+INPLACE_MEMORY = 64 * 1024 * 1024  # sources of cyclic copies kept in memory, beyond that in a temp file
+INPLACE_PIECE_SIZE = 1024 * 1024  # largest single read and write
+
+
+def plan_inplace(table):
+    """
+    Order the copies of a delta so that none overwrites a region of the basis before
+    another copy has read it. A copy reading from where it writes is left out, the data
+    is already there. Copies in a cycle cannot all be ordered: the smallest of a cycle
+    gets its source read in advance instead, which breaks the cycle.
+    :param table: a DeltaTable
+    :return: the indices in table of the copies in a safe order, and the set of those
+        whose source has to be read before anything is written
+    """
+    moves = [
+        i
+        for i, (kind, offset, position) in enumerate(
+            zip(table.kinds, table.offsets, table.positions)
+        )
+        if kind == COPY and offset != position and table.lengths[i]
+    ]
+    lengths = table.lengths
+    # the writes of a delta do not overlap and come in order, so those over a source
+    # are a run of them, found by bisection: only overlapping pairs are visited
+    offsets = [table.offsets[j] for j in moves]
+    ends = [offset + lengths[j] for offset, j in zip(offsets, moves)]
+    after = {i: [] for i in moves}  # copies which must wait for i to have read
+    waiting = dict.fromkeys(moves, 0)  # reads a copy has to wait for before writing
+    for i in moves:
+        lo = table.positions[i]
+        hi = lo + lengths[i]
+        for n in range(bisect_right(ends, lo), bisect_left(offsets, hi)):
+            j = moves[n]
+            if j != i:
+                after[i].append(j)
+                waiting[j] += 1
+
+    order = []
+    buffered = set()
+    ready = deque(i for i in moves if not waiting[i])
+    smallest = [(lengths[i], i) for i in moves]
+    heapify(smallest)
+    left = len(moves)
+    while left:
+        if not ready:
+            # only cycles remain: read the smallest source in advance, so that
+            # whatever writes over it does not have to wait any more
+            i = heappop(smallest)[1]
+            if i in buffered or waiting[i] < 0:
+                continue
+            buffered.add(i)
+            for j in after[i]:
+                waiting[j] -= 1
+                if not waiting[j]:
+                    ready.append(j)
+            after[i] = []
+            if waiting[i] > 0:
+                continue
+        else:
+            i = ready.popleft()
+        order.append(i)
+        waiting[i] = -1  # done
+        left -= 1
+        for j in after[i]:
+            waiting[j] -= 1
+            if not waiting[j]:
+                ready.append(j)
+    return order, buffered
+
+
+def _read(file, position: int, size: int) -> bytes:
+    file.seek(position)
+    return file.read(size)
+
+
+def _write(file, position: int, data) -> None:
+    file.seek(position)
+    file.write(data)
+
+
+def _move(file, source: int, target: int, length: int) -> None:
+    """
+    Copy length bytes of file from source to target, in pieces ordered so that an
+    overlap of the two is read before it is overwritten.
+    """
+    starts = range(0, length, INPLACE_PIECE_SIZE)
+    if source < target < source + length:
+        starts = reversed(starts)
+    for start in starts:
+        n = min(INPLACE_PIECE_SIZE, length - start)
+        _write(file, target + start, _read(file, source + start, n))
+
+
+def patch_inplace(
+    basis, delta, memory: int = INPLACE_MEMORY, spill_dir: str = None
+) -> Stats:
+    """
+    Patch basis into itself using delta, without writing a new file: only the regions
+    which change are written, data which stays in place is neither read nor written.
+    The delta is decoded first, checked against the size of the basis, then its copies
+    are applied in an order where no source is overwritten before it is read, the few
+    sources in a cycle being read beforehand. The literals follow and the file is cut
+    to the patched size. The delta must have been computed from this very basis, and
+    an interrupted patch leaves the basis neither old nor new.
+    :param basis: a path, or a seekable file object opened for reading and writing
+    :param delta: a path, a file descriptor, a seekable file-like object or a bytes-like object
+    :param memory: sources of cyclic copies held in memory; a larger total goes to a temporary file
+    :param spill_dir: directory of that temporary file, that of basis if None
+    :return: the statistics of the patch, out_bytes being the bytes actually written
+    """
+    started = perf_counter()
+    reader = DeltaSource(delta)
+    f = None
+    close = False
+    spill = None
+    try:
+        table = inspect_delta(reader.file)
+        in_bytes = reader.file.tell() - reader.start
+        if isinstance(basis, (str, os.PathLike)):
+            f = open(basis, "r+b")
+            close = True
+            if spill_dir is None:
+                spill_dir = os.path.dirname(os.path.abspath(basis))
+        else:
+            f = basis
+        size = f.seek(0, os.SEEK_END)
+        for kind, position, length in zip(table.kinds, table.positions, table.lengths):
+            if kind == COPY and position + length > size:
+                raise ValueError(
+                    "the delta copies past the end of the basis, at %d" % position
+                )
+        order, buffered = plan_inplace(table)
+        positions = table.positions
+        lengths = table.lengths
+        # read the sources of cycles while the basis is still intact
+        saved = {}
+        if sum(lengths[i] for i in buffered) > memory:
+            spill = tempfile.TemporaryFile(dir=spill_dir)
+            for i in buffered:
+                saved[i] = spill.tell()
+                for start in range(0, lengths[i], INPLACE_PIECE_SIZE):
+                    n = min(INPLACE_PIECE_SIZE, lengths[i] - start)
+                    spill.write(_read(f, positions[i] + start, n))
+        else:
+            for i in buffered:
+                saved[i] = _read(f, positions[i], lengths[i])
+        written = 0
+        for i in order:
+            offset = table.offsets[i]
+            if i not in saved:
+                _move(f, positions[i], offset, lengths[i])
+            elif spill is None:
+                _write(f, offset, saved.pop(i))
+            else:
+                for start in range(0, lengths[i], INPLACE_PIECE_SIZE):
+                    n = min(INPLACE_PIECE_SIZE, lengths[i] - start)
+                    _write(f, offset + start, _read(spill, saved[i] + start, n))
+            written += lengths[i]
+        for kind, offset, length, position in zip(
+            table.kinds, table.offsets, table.lengths, positions
+        ):
+            if kind != COPY:
+                for start in range(0, length, INPLACE_PIECE_SIZE):
+                    n = min(INPLACE_PIECE_SIZE, length - start)
+                    _write(f, offset + start, reader.read(position + start, n))
+                written += length
+        f.truncate(table.output_size)
+        f.flush()
+    finally:
+        if spill is not None:
+            spill.close()
+        if close:
+            f.close()
+        if reader.close is not None:
+            reader.close()
+    now = int(time.time())
+    return Stats.from_dict(
+        {
+            "op": "patch",
+            "lit_cmds": table.literal_cmds,
+            "lit_bytes": table.literal_bytes,
+            "lit_cmdbytes": 0,
+            "copy_cmds": table.copy_cmds,
+            "copy_bytes": table.copy_bytes,
+            "copy_cmdbytes": 0,
+            "sig_cmds": 0,
+            "sig_bytes": 0,
+            "false_matches": 0,
+            "sig_blocks": 0,
+            "block_len": 0,
+            "in_bytes": in_bytes,
+            "out_bytes": written,
+            "start": now,
+            "end": now,
+            "buffer_size": INPLACE_PIECE_SIZE,
+            "elapsed": perf_counter() - started,
+        }
+    )
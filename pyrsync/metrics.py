@@ -0,0 +1,129 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+from threading import Lock
+
+__all__ = ["Observer", "Counters"]
+
+
+class Observer:
+    """
+    Receives the events of the job loop of signature, delta and patch. Pass one as
+    ``observer`` to a call, or install it for every call with ``set_observer``.
+    Without an observer the loop is not timed at all.
+    """
+
+    __slots__ = ()
+
+    def start(self, op: str) -> None:
+        """
+        A job starts, op is librsync's name of it such as "signature" or "delta".
+        """
+
+    def chunk(
+        self,
+        read_time: float,
+        iter_time: float,
+        write_time: float,
+        in_bytes: int,
+        out_bytes: int,
+    ) -> None:
+        """
+        A round of the loop is done: seconds spent reading the input, in rs_job_iter and
+        writing the output, with the bytes consumed and produced by librsync.
+        """
+
+    def copies(self, calls: int, nbytes: int) -> None:
+        """
+        A patch is done: number of copies served from the basis, and their bytes.
+        """
+
+    def readahead(self, hits: int, misses: int, nbytes: int) -> None:
+        """
+        A patch reading its basis ahead is done: copies served from the read-ahead window,
+        copies which needed a read, and the bytes read.
+        """
+
+    def error(self, exc: BaseException) -> None:
+        """
+        The job failed with exc, which propagates to the caller. ``end`` follows.
+        """
+
+    def end(self, stats) -> None:
+        """
+        The job is done, with its Stats, whether it succeeded or failed.
+        """
+
+
+class Counters(Observer):
+    """
+    An observer adding up the events of every job it sees, safe to share between threads.
+    """
+
+    __slots__ = (
+        "_lock",
+        "jobs",
+        "errors",
+        "chunks",
+        "read_time",
+        "iter_time",
+        "write_time",
+        "in_bytes",
+        "out_bytes",
+        "copy_calls",
+        "copy_bytes",
+        "readahead_hits",
+        "readahead_misses",
+        "readahead_bytes",
+    )
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.jobs = 0
+        self.errors = 0
+        self.chunks = 0
+        self.read_time = 0.0
+        self.iter_time = 0.0
+        self.write_time = 0.0
+        self.in_bytes = 0
+        self.out_bytes = 0
+        self.copy_calls = 0
+        self.copy_bytes = 0
+        self.readahead_hits = 0
+        self.readahead_misses = 0
+        self.readahead_bytes = 0
+
+    def start(self, op: str) -> None:
+        with self._lock:
+            self.jobs += 1
+
+    def chunk(self, read_time, iter_time, write_time, in_bytes, out_bytes) -> None:
+        with self._lock:
+            self.chunks += 1
+            self.read_time += read_time
+            self.iter_time += iter_time
+            self.write_time += write_time
+            self.in_bytes += in_bytes
+            self.out_bytes += out_bytes
+
+    def error(self, exc) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def copies(self, calls, nbytes) -> None:
+        with self._lock:
+            self.copy_calls += calls
+            self.copy_bytes += nbytes
+
+    def readahead(self, hits, misses, nbytes) -> None:
+        with self._lock:
+            self.readahead_hits += hits
+            self.readahead_misses += misses
+            self.readahead_bytes += nbytes
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {name: getattr(self, name) for name in self.__slots__[1:]}
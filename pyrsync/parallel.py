@@ -0,0 +1,386 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import mmap
+import os
+import time
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from stat import S_ISREG
+from time import perf_counter
+
+from pyrsync.backends import Stats, get_signature_args, patch, signature_bytes
+from pyrsync.deltas import COPY, inspect_delta
+
+__all__ = ["signature_parallel", "patch_parallel"]
+
+PARALLEL_CHUNK_SIZE = 16 * 1024 * 1024  # bytes hashed or patched by one task
+PATCH_PIECE_SIZE = 1024 * 1024  # largest single read and write of patch_parallel
+SIG_HEADER_SIZE = 12  # magic, block_len and strong_len as big-endian u32
+_SUMMED_STATS = ("sig_cmds", "sig_bytes", "sig_blocks", "in_bytes", "out_bytes")
+
+
+def _file_size(input):
+    """
+    Size of input if it is a path, a file descriptor or a file object of a regular file, else None.
+    """
+    try:
+        if isinstance(input, (str, os.PathLike, int)):
+            st = os.stat(input)
+        elif hasattr(input, "fileno"):
+            st = os.fstat(input.fileno())
+        else:
+            return None
+    except (OSError, ValueError):
+        return None
+    return st.st_size if S_ISREG(st.st_mode) else None
+
+
+def _read_chunks(input, chunk_size: int):
+    readinto = getattr(input, "readinto", None)
+    while True:
+        if readinto is not None:
+            chunk = bytearray(chunk_size)
+            size = 0
+            # fill the chunk completely, every range but the last must be block-aligned
+            while size < chunk_size:
+                n = readinto(memoryview(chunk)[size:])
+                if not n:
+                    break
+                size += n
+            del chunk[size:]
+        else:
+            chunk = b""
+            while len(chunk) < chunk_size:
+                block = input.read(chunk_size - len(chunk))
+                if not block:
+                    break
+                chunk += block
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+
+
+def _view_chunks(view, chunk_size: int):
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
+
+def signature_parallel(
+    input,
+    output,
+    strong_len: int = 0,
+    sig_magic: int = 0,
+    block_size: int = 0,
+    workers: int = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> Stats:
+    """
+    Generate a signature for input on several threads. input is split into block-aligned
+    ranges hashed concurrently with the GIL released, and the output is byte-identical
+    to that of ``signature``.
+    Arguments left to 0 are chosen by ``get_signature_args`` from the size of input.
+    :param input: a path, a file descriptor, a bytes-like object or a readable file-like object;
+        regular files are memory mapped from their current position, and left at their end
+    :param output: a writable file-like object
+    :param strong_len:
+    :param sig_magic:
+    :param block_size:
+    :param workers: number of threads, the number of CPUs if None
+    :param chunk_size: bytes hashed by one task
+    :return: the statistics of the ranges added up, with the wall time of the whole signature
+    """
+    started = perf_counter()
+    try:
+        view = memoryview(input)
+    except TypeError:
+        view = None
+    pos = 0  # where signature would start reading a file
+    if view is not None:
+        view = view.cast("B")
+        size = view.nbytes
+    else:
+        size = _file_size(input)
+        if size is not None and not isinstance(input, (str, os.PathLike)):
+            if isinstance(input, int):
+                pos = os.lseek(input, 0, os.SEEK_CUR)
+            else:
+                pos = input.tell()
+            size = max(size - pos, 0)
+    magic, block_len, strong_len = get_signature_args(
+        -1 if size is None else size, sig_magic, block_size, strong_len
+    )
+    chunk_size = max(chunk_size // block_len, 1) * block_len
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def sign(chunk):
+        try:
+            return signature_bytes(chunk, strong_len, magic, block_len, stats=True)
+        finally:
+            if isinstance(chunk, memoryview):
+                chunk.release()
+
+    mapping = None
+    mapped = None
+    fd = None
+    try:
+        if view is None and size:
+            if isinstance(input, (str, os.PathLike)):
+                fd = os.open(input, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+                mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            else:
+                if hasattr(input, "flush"):
+                    input.flush()
+                fileno = input if isinstance(input, int) else input.fileno()
+                mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            mapped = memoryview(mapping)
+            view = mapped[pos:]
+        if view is not None:
+            chunks = _view_chunks(view, chunk_size)
+        elif isinstance(input, (str, os.PathLike, int)):
+            # an empty file
+            chunks = iter(())
+        else:
+            chunks = _read_chunks(input, chunk_size)
+
+        total = None
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def write(result):
+                nonlocal total
+                sig, stats = result
+                if total is None:
+                    total = stats.as_dict()
+                    output.write(sig)
+                else:
+                    output.write(memoryview(sig)[SIG_HEADER_SIZE:])
+                    stats = stats.as_dict()
+                    for key in _SUMMED_STATS:
+                        total[key] += stats[key]
+                    total["out_bytes"] -= SIG_HEADER_SIZE
+                    total["start"] = min(total["start"], stats["start"])
+                    total["end"] = max(total["end"], stats["end"])
+
+            # keep a bounded number of ranges in flight, and write them back in order
+            for chunk in chunks:
+                pending.append(executor.submit(sign, chunk))
+                del chunk
+                if len(pending) >= 2 * workers:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+        if total is None:
+            # nothing to hash, the signature is only the header
+            write(signature_bytes(b"", strong_len, magic, block_len, stats=True))
+    finally:
+        if view is not None:
+            view.release()
+        if mapped is not None:
+            mapped.release()
+        if mapping is not None:
+            mapping.close()
+        if fd is not None:
+            os.close(fd)
+    if mapping is not None and fd is None:
+        # leave the file at its end, as signature does
+        if isinstance(input, int):
+            os.lseek(input, 0, os.SEEK_END)
+        else:
+            input.seek(0, os.SEEK_END)
+    total["buffer_size"] = chunk_size
+    total["elapsed"] = perf_counter() - started
+    return Stats.from_dict(total)
+
+
+def _open_input(input):
+    """
+    A pread-like function over input, and what to close once done with it.
+    """
+    try:
+        view = memoryview(input)
+    except TypeError:
+        view = None
+    if view is None and isinstance(input, BytesIO):
+        view = input.getbuffer()
+    if view is not None:
+        view = view.cast("B")
+
+        def read(pos, size):
+            return view[pos : pos + size]
+
+        return read, view.release
+    if isinstance(input, (str, os.PathLike)):
+        fd = os.open(input, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+        def close():
+            os.close(fd)
+
+    else:
+        fd = input if isinstance(input, int) else input.fileno()
+        close = None
+
+    def read(pos, size):
+        return os.pread(fd, size, pos)
+
+    return read, close
+
+
+class _Sequential:
+    """
+    A readable file-like object over a pread-like function, from offset 0.
+    """
+
+    __slots__ = ("_read", "pos")
+
+    def __init__(self, read):
+        self._read = read
+        self.pos = 0
+
+    def read(self, size: int):
+        data = self._read(self.pos, size)
+        self.pos += len(data)
+        return data
+
+
+def _serial_patch(input, delta, output) -> Stats:
+    with ExitStack() as stack:
+        files = []
+        for file, mode in ((input, "rb"), (delta, "rb"), (output, "wb")):
+            if isinstance(file, (str, os.PathLike)):
+                file = stack.enter_context(open(file, mode))
+            elif isinstance(file, int):
+                file = stack.enter_context(open(file, mode, closefd=False))
+            files.append(file)
+        if not hasattr(files[1], "read"):
+            files[1] = BytesIO(files[1])
+        return patch(*files)
+
+
+def _pieces(table, chunk_size: int):
+    """
+    Group the commands of table into tasks of about chunk_size output bytes, each command
+    cut into pieces of at most PATCH_PIECE_SIZE.
+    """
+    task = []
+    size = 0
+    for kind, offset, length, position in zip(
+        table.kinds, table.offsets, table.lengths, table.positions
+    ):
+        for start in range(0, length, PATCH_PIECE_SIZE):
+            n = min(PATCH_PIECE_SIZE, length - start)
+            task.append((kind, offset + start, n, position + start))
+            size += n
+            if size >= chunk_size:
+                yield task
+                task = []
+                size = 0
+    if task:
+        yield task
+
+
+def patch_parallel(
+    input,
+    delta,
+    output,
+    workers: int = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> Stats:
+    """
+    Patch input using delta on several threads. The delta is decoded first into its
+    commands and their offsets in the output, then the commands are applied in any order
+    with positional reads and writes, which release the GIL. The output is byte-identical
+    to that of ``patch``. Without ``os.pread`` (Windows), this falls back to ``patch``.
+    :param input: the basis, a path, a file descriptor, a file object with a file descriptor or a bytes-like object
+    :param delta: a path, a file descriptor, a file object with a file descriptor or a bytes-like object
+    :param output: a path, or the file descriptor or file object of a seekable file, truncated to the patched size
+    :param workers: number of threads, the number of CPUs if None
+    :param chunk_size: output bytes written by one task
+    :return: the statistics of the patch, with its wall time
+    """
+    started = perf_counter()
+    if not hasattr(os, "pread"):
+        return _serial_patch(input, delta, output)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    read_basis, close_basis = _open_input(input)
+    read_delta = close_delta = None
+    out_fd = None
+    try:
+        read_delta, close_delta = _open_input(delta)
+        reader = _Sequential(read_delta)
+        table = inspect_delta(reader)
+        if isinstance(output, (str, os.PathLike)):
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            out_fd = os.open(output, flags, 0o666)
+            fd = out_fd
+        else:
+            if hasattr(output, "flush"):
+                output.flush()
+            fd = output if isinstance(output, int) else output.fileno()
+        os.ftruncate(fd, table.output_size)
+
+        def run(task):
+            for kind, offset, length, position in task:
+                if kind == COPY:
+                    data = read_basis(position, length)
+                    if len(data) < length:
+                        raise ValueError(
+                            "the delta copies past the end of the basis, at %d" % position
+                        )
+                else:
+                    data = read_delta(position, length)
+                    if len(data) < length:
+                        raise ValueError("truncated delta")
+                while data:
+                    n = os.pwrite(fd, data, offset)
+                    data = data[n:]
+                    offset += n
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for task in _pieces(table, chunk_size):
+                    pending.append(executor.submit(run, task))
+                    if len(pending) >= 2 * workers:
+                        pending.popleft().result()
+                while pending:
+                    pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    finally:
+        if close_basis is not None:
+            close_basis()
+        if close_delta is not None:
+            close_delta()
+        if out_fd is not None:
+            os.close(out_fd)
+    now = int(time.time())
+    return Stats.from_dict(
+        {
+            "op": "patch",
+            "lit_cmds": table.literal_cmds,
+            "lit_bytes": table.literal_bytes,
+            "lit_cmdbytes": 0,
+            "copy_cmds": table.copy_cmds,
+            "copy_bytes": table.copy_bytes,
+            "copy_cmdbytes": 0,
+            "sig_cmds": 0,
+            "sig_bytes": 0,
+            "false_matches": 0,
+            "sig_blocks": 0,
+            "block_len": 0,
+            "in_bytes": reader.pos,
+            "out_bytes": table.output_size,
+            "start": now,
+            "end": now,
+            "buffer_size": chunk_size,
+            "elapsed": perf_counter() - started,
+        }
+    )
@@ -0,0 +1,401 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+from pyrsync.backends import (
+    RS_BLAKE2_SIG_MAGIC,
+    RS_MD4_SIG_MAGIC,
+    RS_RK_BLAKE2_SIG_MAGIC,
+    RS_RK_MD4_SIG_MAGIC,
+    Signature,
+)
+
+__all__ = ["SignatureTable", "SignatureDiff", "diff_signatures"]
+
+SIG_MAGICS = (
+    RS_MD4_SIG_MAGIC,
+    RS_BLAKE2_SIG_MAGIC,
+    RS_RK_MD4_SIG_MAGIC,
+    RS_RK_BLAKE2_SIG_MAGIC,
+)
+RS_HEADER = struct.Struct(">III")  # magic, block_len, strong_len of a librsync signature
+# the compact format: tag, magic, block_len, strong_len, block count, then the weak sums
+# as little-endian u32 and the strong sums back to back
+TABLE_TAG = b"PRST"
+TABLE_HEADER = struct.Struct("<4sIIIQ")
+WEAK_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+
+class SignatureTable:
+    """
+    A parsed signature: the weak sums of the blocks in one uint32 array and their strong
+    sums in one bytes buffer, without an object per block. Both are exposed as buffers,
+    ``numpy.asarray(table.weak_sums)`` works without a copy. A table loaded from the
+    compact format with ``load`` maps the file instead of reading it.
+    """
+
+    __slots__ = ("magic", "block_len", "strong_len", "_weak", "_strong", "_mapping")
+
+    def __init__(self, magic: int, block_len: int, strong_len: int, weak, strong):
+        """
+        :param weak: the weak sums, a buffer of native uint32
+        :param strong: the strong sums, a buffer of strong_len bytes per block
+        """
+        if magic not in SIG_MAGICS:
+            raise ValueError("not a signature magic: %#x" % magic)
+        if block_len <= 0 or strong_len <= 0:
+            raise ValueError("block_len and strong_len must be positive")
+        weak = memoryview(weak).cast("B").cast(WEAK_TYPECODE)
+        strong = memoryview(strong).cast("B")
+        if len(strong) != len(weak) * strong_len:
+            raise ValueError(
+                "%d bytes of strong sums for %d blocks" % (len(strong), len(weak))
+            )
+        self.magic = magic
+        self.block_len = block_len
+        self.strong_len = strong_len
+        self._weak = weak
+        self._strong = strong
+        self._mapping = None
+
+    @classmethod
+    def from_bytes(cls, data) -> "SignatureTable":
+        """
+        Parse a signature as written by ``signature``.
+        :param data: a bytes-like object
+        """
+        data = memoryview(data).cast("B")
+        if len(data) < RS_HEADER.size:
+            raise ValueError("truncated signature header")
+        magic, block_len, strong_len = RS_HEADER.unpack_from(data)
+        if magic not in SIG_MAGICS:
+            raise ValueError("not a signature magic: %#x" % magic)
+        stride = 4 + strong_len
+        count, rest = divmod(len(data) - RS_HEADER.size, stride)
+        if rest:
+            raise ValueError("truncated signature, %d bytes after the last block" % rest)
+        blocks = bytearray(data[RS_HEADER.size : RS_HEADER.size + count * stride])
+        # work on whole byte columns with strided slices, never on single blocks
+        weak = bytearray(4 * count)
+        for k in range(4):
+            weak[k::4] = blocks[k::stride]
+        weak = array(WEAK_TYPECODE, bytes(weak))
+        if sys.byteorder == "little":
+            weak.byteswap()
+        # dropping the weak sums leaves the strong sums back to back
+        for k in range(4):
+            del blocks[:: stride - k]
+        strong = blocks
+        return cls(magic, block_len, strong_len, weak, strong)
+
+    @classmethod
+    def read(cls, input) -> "SignatureTable":
+        """
+        Parse a signature as written by ``signature`` from a path or a readable file-like object.
+        """
+        if isinstance(input, (str, os.PathLike)):
+            with open(input, "rb") as f:
+                return cls.from_bytes(f.read())
+        return cls.from_bytes(input.read())
+
+    def to_bytes(self) -> bytes:
+        """
+        The signature as written by ``signature``.
+        """
+        strong_len = self.strong_len
+        # interleave whole columns, of the widest unit that divides both sums
+        unit = 4 if strong_len % 4 == 0 else 2 if strong_len % 2 == 0 else 1
+        typecode = {1: "B", 2: "H", 4: WEAK_TYPECODE}[unit]
+        row = (4 + strong_len) // unit
+        weak_units = 4 // unit
+        strong_units = strong_len // unit
+        out = array(typecode, bytes(len(self) * row * unit))
+        weak = array(WEAK_TYPECODE, self._weak)
+        if sys.byteorder == "little":
+            weak.byteswap()
+        weak = array(typecode, weak.tobytes())
+        for k in range(weak_units):
+            out[k::row] = weak[k::weak_units]
+        strong = array(typecode, self._strong.tobytes())
+        for k in range(strong_units):
+            out[weak_units + k :: row] = strong[k::strong_units]
+        return RS_HEADER.pack(self.magic, self.block_len, strong_len) + out.tobytes()
+
+    def to_signature(self) -> Signature:
+        """
+        Load the table into librsync, to create deltas with it.
+        """
+        return Signature(self.to_bytes())
+
+    def dumps(self) -> bytes:
+        """
+        The table in the compact format read by ``loads`` and ``load``.
+        """
+        weak = self._weak
+        if sys.byteorder == "big":
+            weak = array(WEAK_TYPECODE, weak)
+            weak.byteswap()
+        return b"".join(
+            (
+                TABLE_HEADER.pack(
+                    TABLE_TAG, self.magic, self.block_len, self.strong_len, len(self)
+                ),
+                weak,
+                self._strong,
+            )
+        )
+
+    def dump(self, output) -> None:
+        """
+        Write the table in the compact format to a path or a writable file-like object.
+        """
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, "wb") as f:
+                self.dump(f)
+            return
+        output.write(self.dumps())
+
+    @classmethod
+    def loads(cls, data) -> "SignatureTable":
+        """
+        A table in the compact format. The sums are views of data, not copies, except
+        for the weak sums on a big-endian machine.
+        :param data: a bytes-like object
+        """
+        data = memoryview(data).cast("B")
+        if len(data) < TABLE_HEADER.size:
+            raise ValueError("truncated signature table header")
+        tag, magic, block_len, strong_len, count = TABLE_HEADER.unpack_from(data)
+        if tag != TABLE_TAG:
+            raise ValueError("not a signature table")
+        weak_end = TABLE_HEADER.size + 4 * count
+        end = weak_end + strong_len * count
+        if len(data) < end:
+            raise ValueError("truncated signature table")
+        weak = data[TABLE_HEADER.size : weak_end]
+        if sys.byteorder == "big":
+            weak = array(WEAK_TYPECODE, weak)
+            weak.byteswap()
+        return cls(magic, block_len, strong_len, weak, data[weak_end:end])
+
+    @classmethod
+    def load(cls, input) -> "SignatureTable":
+        """
+        Map a file in the compact format. The table reads the sums from the mapping,
+        close it, or use it as a context manager, to unmap the file.
+        :param input: a path, a file descriptor or a file object
+        """
+        if isinstance(input, (str, os.PathLike)):
+            fd = os.open(input, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+        else:
+            fileno = input if isinstance(input, int) else input.fileno()
+            mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        try:
+            self = cls.loads(mapping)
+        except BaseException:
+            mapping.close()
+            raise
+        self._mapping = mapping
+        return self
+
+    def close(self) -> None:
+        """
+        Release the sums, and unmap the file of a loaded table. Views handed out by
+        weak_sums and strong_sums must be released first.
+        """
+        self._weak.release()
+        self._strong.release()
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def weak_sums(self) -> memoryview:
+        """
+        The weak sums of the blocks, a uint32 buffer.
+        """
+        return self._weak[:]
+
+    @property
+    def strong_sums(self) -> memoryview:
+        """
+        The strong sums of the blocks, a (blocks, strong_len) buffer of bytes,
+        flat when there is no block since a buffer cannot have a 0 dimension.
+        """
+        if not len(self):
+            return self._strong[:]
+        return self._strong.cast("B", (len(self), self.strong_len))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory taken by the sums.
+        """
+        return self._weak.nbytes + self._strong.nbytes
+
+    def __len__(self):
+        return len(self._weak)
+
+    def __getitem__(self, index: int):
+        """
+        The weak sum and the strong sum of a block.
+        """
+        weak = self._weak[index]
+        if index < 0:
+            index += len(self)
+        start = index * self.strong_len
+        return weak, bytes(self._strong[start : start + self.strong_len])
+
+    def __repr__(self):
+        return "SignatureTable(magic=%#x, block_len=%d, strong_len=%d, blocks=%d)" % (
+            self.magic,
+            self.block_len,
+            self.strong_len,
+            len(self),
+        )
+
+
+SignatureDiff = namedtuple(
+    "SignatureDiff", ["changed", "unchanged", "moved", "literal_blocks", "estimated_bytes"]
+)
+SignatureDiff.__doc__ = """
+The blocks of a new signature compared with an old one, at the same index: changed and
+unchanged are lists of (start, stop) block ranges, moved counts the changed blocks found
+elsewhere in the old signature, which a delta copies, and literal_blocks the others.
+estimated_bytes is the literal data of a delta, block_len per literal block.
+"""
+
+DIFF_FANOUT = 16  # parts a differing range is split into before comparing again
+DIFF_LEAF = 256  # blocks of a differing range compared one by one
+DIFF_SEARCH_MAX = 64  # changed blocks searched in the old signature one by one, above that it is indexed
+
+
+def _ranges(indices) -> list:
+    """
+    Sorted block indices to (start, stop) ranges.
+    """
+    ranges = []
+    start = stop = None
+    for index in indices:
+        if index != stop:
+            if start is not None:
+                ranges.append((start, stop))
+            start = index
+        stop = index + 1
+    if start is not None:
+        ranges.append((start, stop))
+    return ranges
+
+
+def diff_signatures(old, new) -> SignatureDiff:
+    """
+    Find which blocks of new differ from old without the data, for instance to skip a
+    sync or to estimate the size of a delta. Equal ranges are found by comparing whole
+    ranges of both sum arrays at once, so identical regions cost a memcmp however many
+    blocks they have. Blocks shifted by an insertion count as changed, the estimate is
+    an upper bound for such data.
+    :param old: the signature of the basis, a SignatureTable or a bytes-like signature
+    :param new: the signature of the new data, with the same magic, block_len and strong_len
+    """
+    if not isinstance(old, SignatureTable):
+        old = SignatureTable.from_bytes(old)
+    if not isinstance(new, SignatureTable):
+        new = SignatureTable.from_bytes(new)
+    if (old.magic, old.block_len, old.strong_len) != (
+        new.magic,
+        new.block_len,
+        new.strong_len,
+    ):
+        raise ValueError(
+            "signatures differ in magic, block_len or strong_len: %r and %r" % (old, new)
+        )
+    strong_len = new.strong_len
+    # bytes, whose comparison is a memcmp, unlike that of memoryviews
+    old_weak = old._weak.tobytes()
+    new_weak = new._weak.tobytes()
+    old_strong = old._strong.tobytes()
+    new_strong = new._strong.tobytes()
+    changed = []
+
+    def match(i: int, j: int) -> bool:
+        return (
+            old_strong[j * strong_len : (j + 1) * strong_len]
+            == new_strong[i * strong_len : (i + 1) * strong_len]
+        )
+
+    def scan(lo: int, hi: int) -> None:
+        if (
+            old_weak[lo * 4 : hi * 4] == new_weak[lo * 4 : hi * 4]
+            and old_strong[lo * strong_len : hi * strong_len]
+            == new_strong[lo * strong_len : hi * strong_len]
+        ):
+            return
+        if hi - lo <= DIFF_LEAF:
+            pairs = zip(old._weak[lo:hi].tolist(), new._weak[lo:hi].tolist())
+            for i, (a, b) in enumerate(pairs, lo):
+                if a != b or not match(i, i):
+                    changed.append(i)
+            return
+        step = -(-(hi - lo) // DIFF_FANOUT)
+        for start in range(lo, hi, step):
+            scan(start, min(start + step, hi))
+
+    common = min(len(old), len(new))
+    if common:
+        scan(0, common)
+    changed.extend(range(common, len(new)))
+
+    # changed blocks may still be copies of blocks elsewhere in old
+    moved = 0
+
+    if len(changed) <= DIFF_SEARCH_MAX:
+        # a few blocks: search their weak sums in the bytes of the old ones
+        for i in changed:
+            weak = new_weak[i * 4 : (i + 1) * 4]
+            j = old_weak.find(weak)
+            while j >= 0:
+                if j % 4 == 0 and match(i, j // 4):
+                    moved += 1
+                    break
+                j = old_weak.find(weak, j + 1)
+    else:
+        new_sums = new._weak.tolist()
+        found = {new_sums[i] for i in changed}
+        positions = {}
+        for j, weak in enumerate(old._weak.tolist()):
+            if weak in found:
+                positions.setdefault(weak, []).append(j)
+        for i in changed:
+            for j in positions.get(new_sums[i], ()):
+                if match(i, j):
+                    moved += 1
+                    break
+    changed_ranges = _ranges(changed)
+    unchanged = []
+    start = 0
+    for lo, hi in changed_ranges:
+        if lo > start:
+            unchanged.append((start, lo))
+        start = hi
+    if start < len(new):
+        unchanged.append((start, len(new)))
+    literal_blocks = len(changed) - moved
+    return SignatureDiff(
+        changed_ranges, unchanged, moved, literal_blocks, literal_blocks * new.block_len
+    )
@@ -0,0 +1,335 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import errno
+import os
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from time import perf_counter
+
+from pyrsync.backends import Stats, get_signature_args, signature_bytes
+from pyrsync.deltas import COPY, DeltaSource, inspect_delta
+
+__all__ = ["data_extents", "signature_sparse", "patch_sparse"]
+
+SPARSE_CHUNK_SIZE = 4 * 1024 * 1024  # data bytes hashed or patched at once
+HOLE_SIZE = 4096  # smallest run of zeros left unwritten by patch_sparse
+SIG_HEADER_SIZE = 12
+_ZEROS = bytes(SPARSE_CHUNK_SIZE)
+_ZERO_VIEW = memoryview(_ZEROS)  # slices of it are the data of holes, without a copy
+
+
+def data_extents(fd: int, size: int = None) -> list:
+    """
+    The ranges of a file holding data, found with SEEK_DATA and SEEK_HOLE; what lies
+    between them is a hole, which reads as zeros. Where the system or the file system
+    does not tell holes apart, the whole file is one range.
+    :param fd: file descriptor of a regular file
+    :param size: size of the file, fstat'ed if None
+    :return: a sorted list of (start, stop)
+    """
+    if size is None:
+        size = os.fstat(fd).st_size
+    if not size:
+        return []
+    seek_data = getattr(os, "SEEK_DATA", None)
+    seek_hole = getattr(os, "SEEK_HOLE", None)
+    if seek_data is None or seek_hole is None:
+        return [(0, size)]
+    extents = []
+    pos = 0
+    offset = os.lseek(fd, 0, os.SEEK_CUR)  # the scan moves it, the caller may rely on it
+    try:
+        while pos < size:
+            try:
+                start = os.lseek(fd, pos, seek_data)
+            except OSError as e:
+                if e.errno == errno.ENXIO:  # nothing but a hole up to the end
+                    break
+                raise
+            stop = min(os.lseek(fd, start, seek_hole), size)
+            extents.append((start, stop))
+            pos = stop
+    except OSError:
+        return [(0, size)]
+    finally:
+        os.lseek(fd, offset, os.SEEK_SET)
+    return extents
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+@lru_cache(maxsize=32)
+def _zero_entry(length: int, strong_len: int, magic: int, block_len: int) -> bytes:
+    """
+    The signature entry of a block of length zeros.
+    """
+    return signature_bytes(bytes(length), strong_len, magic, block_len)[
+        SIG_HEADER_SIZE:
+    ]
+
+
+def _aligned(extents: list, block_len: int, size: int) -> list:
+    """
+    extents widened to whole blocks and merged.
+    """
+    merged = []
+    for start, stop in extents:
+        start -= start % block_len
+        stop = min(-(-stop // block_len) * block_len, size)
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], stop)
+        else:
+            merged.append([start, stop])
+    return merged
+
+
+def signature_sparse(
+    input,
+    output,
+    strong_len: int = 0,
+    sig_magic: int = 0,
+    block_size: int = 0,
+    chunk_size: int = SPARSE_CHUNK_SIZE,
+) -> Stats:
+    """
+    Generate a signature for a sparse file without reading its holes: the blocks in a
+    hole get the precomputed signature of a block of zeros, only the data is read and
+    hashed. The output is byte-identical to that of ``signature``.
+    Arguments left to 0 are chosen by ``get_signature_args`` from the size of input.
+    :param input: a path, a file descriptor or a file object of a regular file
+    :param output: a writable file-like object
+    :param strong_len:
+    :param sig_magic:
+    :param block_size:
+    :param chunk_size: data bytes hashed at once
+    :return: the statistics of the signature, in_bytes being the bytes actually read
+    """
+    started = perf_counter()
+    if isinstance(input, (str, os.PathLike)):
+        fd = os.open(input, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        close = True
+    else:
+        if hasattr(input, "flush"):
+            input.flush()
+        fd = input if isinstance(input, int) else input.fileno()
+        close = False
+    try:
+        size = os.fstat(fd).st_size
+        magic, block_len, strong_len = get_signature_args(
+            size, sig_magic, block_size, strong_len
+        )
+        chunk_size = max(chunk_size // block_len, 1) * block_len
+        header = signature_bytes(b"", strong_len, magic, block_len)
+        output.write(header)
+        out_bytes = len(header)
+        in_bytes = 0
+        entry = _zero_entry(block_len, strong_len, magic, block_len)
+
+        def zeros(start, stop):
+            nonlocal out_bytes
+            count, tail = divmod(stop - start, block_len)
+            # a bounded run of entries at a time, holes can be huge
+            step = max(SPARSE_CHUNK_SIZE // len(entry), 1)
+            for done in range(0, count, step):
+                data = entry * min(step, count - done)
+                output.write(data)
+                out_bytes += len(data)
+            if tail:
+                data = _zero_entry(tail, strong_len, magic, block_len)
+                output.write(data)
+                out_bytes += len(data)
+
+        pos = 0
+        for start, stop in _aligned(data_extents(fd, size), block_len, size):
+            zeros(pos, start)
+            for offset in range(start, stop, chunk_size):
+                n = min(chunk_size, stop - offset)
+                data = _pread(fd, n, offset)
+                in_bytes += len(data)
+                sig = memoryview(signature_bytes(data, strong_len, magic, block_len))
+                output.write(sig[SIG_HEADER_SIZE:])
+                out_bytes += len(sig) - SIG_HEADER_SIZE
+            pos = stop
+        zeros(pos, size)
+    finally:
+        if close:
+            os.close(fd)
+    now = int(time.time())
+    return Stats.from_dict(
+        {
+            "op": "signature",
+            "lit_cmds": 0,
+            "lit_bytes": 0,
+            "lit_cmdbytes": 0,
+            "copy_cmds": 0,
+            "copy_bytes": 0,
+            "copy_cmdbytes": 0,
+            "sig_cmds": 0,
+            "sig_bytes": 0,
+            "false_matches": 0,
+            "sig_blocks": -(-size // block_len),
+            "block_len": block_len,
+            "in_bytes": in_bytes,
+            "out_bytes": out_bytes,
+            "start": now,
+            "end": now,
+            "buffer_size": chunk_size,
+            "elapsed": perf_counter() - started,
+        }
+    )
+
+
+class _Basis:
+    """
+    Reads of a basis file which skip its holes.
+    """
+
+    __slots__ = ("file", "close", "size", "starts", "stops", "read_bytes")
+
+    def __init__(self, basis):
+        self.close = None
+        if isinstance(basis, (str, os.PathLike)):
+            self.file = open(basis, "rb")
+            self.close = self.file.close
+        else:
+            self.file = basis
+        self.size = self.file.seek(0, os.SEEK_END)
+        try:
+            extents = data_extents(self.file.fileno(), self.size)
+        except (AttributeError, OSError, ValueError):
+            # no file descriptor, such as a BytesIO
+            extents = [(0, self.size)]
+        self.starts = [start for start, _ in extents]
+        self.stops = [stop for _, stop in extents]
+        self.read_bytes = 0
+
+    def read(self, position: int, size: int):
+        k = bisect_right(self.starts, position) - 1
+        if position + size <= self.size and (k < 0 or self.stops[k] <= position) and (
+            k + 1 == len(self.starts) or self.starts[k + 1] >= position + size
+        ):
+            # entirely in a hole
+            return _ZERO_VIEW[:size]
+        self.file.seek(position)
+        data = self.file.read(size)
+        self.read_bytes += len(data)
+        return data
+
+
+def patch_sparse(basis, delta, output, chunk_size: int = SPARSE_CHUNK_SIZE) -> Stats:
+    """
+    Patch basis using delta into a sparse output: the output is cut to its final size
+    first, which leaves it a hole, then only the runs of at least HOLE_SIZE aligned bytes
+    which are not all zeros are written. Copies from holes of the basis are not read.
+    The content is byte-identical to the output of ``patch``.
+    :param basis: a path or a seekable file object of the basis
+    :param delta: a path, a file descriptor, a seekable file-like object or a bytes-like object
+    :param output: a path, or a seekable file object opened for writing, truncated first
+    :param chunk_size: largest single read of the basis or the delta
+    :return: the statistics of the patch, out_bytes being the bytes actually written
+    """
+    started = perf_counter()
+    chunk_size = min(max(chunk_size // HOLE_SIZE, 1) * HOLE_SIZE, SPARSE_CHUNK_SIZE)
+    reader = DeltaSource(delta)
+    source = None
+    out = None
+    close = False
+    try:
+        table = inspect_delta(reader.file)
+        in_bytes = reader.file.tell() - reader.start
+        source = _Basis(basis)
+        if isinstance(output, (str, os.PathLike)):
+            out = open(output, "wb")
+            close = True
+        else:
+            out = output
+            out.seek(0)
+            out.truncate(0)
+        out.truncate(table.output_size)
+        written = 0
+        for kind, offset, length, position in zip(
+            table.kinds, table.offsets, table.lengths, table.positions
+        ):
+            read = source.read if kind == COPY else reader.read
+            done = 0
+            while done < length:
+                # pieces end on HOLE_SIZE boundaries of the output
+                n = min(chunk_size - (offset + done) % chunk_size, length - done)
+                data = read(position + done, n)
+                if kind == COPY and len(data) < n:
+                    raise ValueError(
+                        "the delta copies past the end of the basis, at %d"
+                        % (position + done)
+                    )
+                written += _write_data(out, offset + done, data)
+                done += n
+        out.flush()
+    finally:
+        if close and out is not None:
+            out.close()
+        if source is not None and source.close is not None:
+            source.close()
+        if reader.close is not None:
+            reader.close()
+    now = int(time.time())
+    return Stats.from_dict(
+        {
+            "op": "patch",
+            "lit_cmds": table.literal_cmds,
+            "lit_bytes": table.literal_bytes,
+            "lit_cmdbytes": 0,
+            "copy_cmds": table.copy_cmds,
+            "copy_bytes": table.copy_bytes,
+            "copy_cmdbytes": 0,
+            "sig_cmds": 0,
+            "sig_bytes": 0,
+            "false_matches": 0,
+            "sig_blocks": 0,
+            "block_len": 0,
+            "in_bytes": in_bytes,
+            "out_bytes": written,
+            "start": now,
+            "end": now,
+            "buffer_size": chunk_size,
+            "elapsed": perf_counter() - started,
+        }
+    )
+
+
+def _write_data(out, offset: int, data) -> int:
+    """
+    Write the parts of data which are not runs of zeros covering whole HOLE_SIZE
+    blocks of the output, and return the bytes written.
+    """
+    n = len(data)
+    # data is never longer than _ZEROS, startswith compares without slicing it
+    if _ZEROS.startswith(data):
+        return 0
+    view = memoryview(data)
+    written = 0
+    pos = 0
+    run = None  # start of the pending run of data to write
+    while pos < n:
+        stop = min(pos + HOLE_SIZE - (offset + pos) % HOLE_SIZE, n)
+        whole = stop - pos == HOLE_SIZE
+        if whole and _ZEROS.startswith(view[pos:stop]):
+            if run is not None:
+                out.seek(offset + run)
+                out.write(view[run:pos])
+                written += pos - run
+                run = None
+        elif run is None:
+            run = pos
+        pos = stop
+    if run is not None:
+        out.seek(offset + run)
+        out.write(view[run:])
+        written += n - run
+    return written
@@ -0,0 +1,264 @@
+"""
+Copyright (c) 2008-2021 synodriver <synodriver@gmail.com>
+"""
+import json
+import os
+from threading import Lock
+
+from pyrsync.backends import (
+    RS_BLAKE2_SIG_MAGIC,
+    RS_RK_BLAKE2_SIG_MAGIC,
+    delta_bytes,
+    get_signature_args,
+    signature_bytes,
+)
+
+__all__ = ["BlockTuner", "file_class", "min_strong_len"]
+
+TUNE_BLOCK_LENS = (256, 512, 1024, 2048, 4096, 8192, 16384, 65536)  # tried by a trial
+TUNE_SAMPLE_SIZE = 8 * 1024 * 1024  # bytes of each file a trial works on
+TUNE_MAX_SAMPLES = 256  # samples kept per file class, oldest out first
+TUNE_MAGICS = (RS_RK_BLAKE2_SIG_MAGIC, RS_BLAKE2_SIG_MAGIC)  # weak sums tried, preferred first
+
+
+def file_class(path) -> str:
+    """
+    The default class of a file, its lower-cased extension.
+    """
+    return os.path.splitext(os.fspath(path))[1].lower()
+
+
+def min_strong_len(size: int, block_len: int) -> int:
+    """
+    The shortest strong sum librsync deems safe for a basis of size bytes: a collision in
+    a delta stays under 1 in 2**32 even for 16 MiB of new data matching nothing.
+    """
+    return 2 + (
+        (size + (1 << 24)).bit_length() - 1 + (size // block_len + 1).bit_length() - 1 + 7
+    ) // 8
+
+
+def _args(size: int, magic: int, block_len: int) -> tuple:
+    magic, block_len, strong_len = get_signature_args(size, magic, block_len, 0)
+    return magic, block_len, min(min_strong_len(size, block_len), strong_len)
+
+
+def _rank(magic: int) -> int:
+    return TUNE_MAGICS.index(magic) if magic in TUNE_MAGICS else len(TUNE_MAGICS)
+
+
+def _head(data, size: int):
+    if isinstance(data, (str, os.PathLike)):
+        with open(data, "rb") as f:
+            return f.read(size)
+    return memoryview(data).cast("B")[:size]
+
+
+class BlockTuner:
+    """
+    Recommends signature arguments from what they cost before. Every sample is the size
+    of a basis with the block length used, and the bytes of its signature and of the delta
+    against it. For a class of files, such as an extension, the block length with the
+    least signature plus delta bytes per basis byte wins. False matches are collisions of
+    the weak sum, so the magic whose weak sum had the fewest per basis byte wins, RabinKarp
+    on a tie; strong sums are as short as librsync deems safe for the size of the file.
+    Samples come from the Stats of real transfers with ``record``, or from a ``trial`` of
+    several block lengths and weak sums on the start of a pair of files. The history is
+    kept in a JSON file, so it grows across processes.
+    Safe to share between threads.
+    """
+
+    __slots__ = ("_lock", "_classes", "path", "max_samples")
+
+    def __init__(self, path: str = None, max_samples: int = TUNE_MAX_SAMPLES):
+        """
+        :param path: JSON file of the history, loaded if it exists; None keeps it in memory only
+        :param max_samples: samples kept per file class
+        """
+        if max_samples < 1:
+            raise ValueError("max_samples must be positive")
+        self._lock = Lock()
+        self._classes = {}
+        self.path = path
+        self.max_samples = max_samples
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._classes = json.load(f)["classes"]
+
+    def save(self) -> None:
+        """
+        Write the history to path, atomically.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            data = json.dumps({"version": 1, "classes": self._classes}, indent=1)
+        tmp = "%s.%d.%d.tmp" % (self.path, os.getpid(), id(data))
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+    def add(
+        self,
+        cls: str,
+        size: int,
+        block_len: int,
+        sig_bytes: int,
+        delta_len: int,
+        false_matches: int = 0,
+        save: bool = True,
+        magic: int = 0,
+    ) -> None:
+        """
+        Add a sample to the history of a class.
+        :param cls: the class of the file, see ``file_class``
+        :param size: size of the basis
+        :param block_len: block length of the signature
+        :param sig_bytes: size of the signature
+        :param delta_len: size of the delta
+        :param false_matches: weak sums matching without their strong sums
+        :param save: write the history to path
+        :param magic: magic of the signature, 0 for the default of ``get_signature_args``
+        """
+        if size <= 0:
+            return
+        if not magic:
+            magic = get_signature_args(size)[0]
+        with self._lock:
+            samples = self._classes.setdefault(cls, [])
+            samples.append(
+                [size, block_len, sig_bytes, delta_len, false_matches, magic]
+            )
+            del samples[: -self.max_samples]
+        if save:
+            self.save()
+
+    def record(
+        self, cls: str, sig_stats, delta_stats, save: bool = True, magic: int = 0
+    ) -> None:
+        """
+        Add a sample from the Stats of a signature and of a delta made against it.
+        The Stats do not tell the magic, it is that of ``get_signature_args`` unless given.
+        """
+        self.add(
+            cls,
+            sig_stats.in_bytes,
+            sig_stats.block_len,
+            sig_stats.out_bytes,
+            delta_stats.out_bytes,
+            delta_stats.false_matches,
+            save,
+            magic,
+        )
+
+    def trial(
+        self,
+        old,
+        new,
+        cls: str = None,
+        block_lens=TUNE_BLOCK_LENS,
+        sample_size: int = TUNE_SAMPLE_SIZE,
+        magics=TUNE_MAGICS,
+    ) -> tuple:
+        """
+        Make the signature of the start of old and the delta of the start of new with every
+        block length and magic, add them as samples and recommend from them.
+        :param old: the basis, a path or a bytes-like object
+        :param new: the new version, a path or a bytes-like object
+        :param cls: the class of the files, that of new if it is a path
+        :param block_lens: the block lengths to try
+        :param sample_size: bytes of old and new used
+        :param magics: the magics to try
+        :return: the recommendation for the size of old, as ``recommend``
+        """
+        if cls is None:
+            if not isinstance(new, (str, os.PathLike)):
+                raise ValueError("cls is needed unless new is a path")
+            cls = file_class(new)
+        size = (
+            os.path.getsize(old) if isinstance(old, (str, os.PathLike)) else len(old)
+        )
+        old = _head(old, sample_size)
+        new = _head(new, sample_size)
+        for magic in magics:
+            for block_len in block_lens:
+                magic, block_len, strong_len = _args(size, magic, block_len)
+                sig, sig_stats = signature_bytes(
+                    old, strong_len, magic, block_len, stats=True
+                )
+                _, delta_stats = delta_bytes(new, sig, stats=True)
+                self.record(cls, sig_stats, delta_stats, False, magic)
+        self.save()
+        return self.recommend(cls, size)
+
+    def costs(self, cls: str) -> dict:
+        """
+        The samples of a class summed per block length.
+        :return: {block_len: (samples, signature plus delta bytes per basis byte, false matches)}
+        """
+        totals = {}
+        with self._lock:
+            samples = list(self._classes.get(cls, ()))
+        for size, block_len, sig_bytes, delta_len, false_matches, *_ in samples:
+            total = totals.setdefault(block_len, [0, 0, 0, 0])
+            total[0] += 1
+            total[1] += size
+            total[2] += sig_bytes + delta_len
+            total[3] += false_matches
+        return {
+            block_len: (count, cost / size, false_matches)
+            for block_len, (count, size, cost, false_matches) in totals.items()
+        }
+
+    def collisions(self, cls: str) -> dict:
+        """
+        The false matches of the samples of a class per magic.
+        :return: {magic: (samples, false matches per basis byte)}
+        """
+        totals = {}
+        with self._lock:
+            samples = list(self._classes.get(cls, ()))
+        for size, _, _, _, false_matches, *rest in samples:
+            # samples saved before magics were kept used the default one
+            magic = rest[0] if rest else get_signature_args(size)[0]
+            total = totals.setdefault(magic, [0, 0, 0])
+            total[0] += 1
+            total[1] += size
+            total[2] += false_matches
+        return {
+            magic: (count, false_matches / size)
+            for magic, (count, size, false_matches) in totals.items()
+        }
+
+    def recommend(self, cls: str, size: int) -> tuple:
+        """
+        Signature arguments for a file of a class, from its samples: the cheapest block
+        length and the magic with the fewest false matches. Without samples, those of
+        ``get_signature_args``.
+        :param cls: the class of the file
+        :param size: size of the file
+        :return: (magic, block_len, strong_len), to pass to ``signature``
+        """
+        costs = self.costs(cls)
+        if not costs:
+            return get_signature_args(size)
+        block_len = min(costs, key=lambda b: (costs[b][1], b))
+        collisions = self.collisions(cls)
+        magic = min(collisions, key=lambda m: (collisions[m][1], _rank(m), m))
+        return _args(size, magic, block_len)
+
+    def clear(self, cls: str = None) -> None:
+        """
+        Forget the samples of a class, or of every class if cls is None.
+        """
+        with self._lock:
+            if cls is None:
+                self._classes.clear()
+            else:
+                self._classes.pop(cls, None)
+        self.save()
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            classes = list(self._classes)
+        return {cls: self.costs(cls) for cls in classes}
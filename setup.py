@@ -87,7 +87,9 @@ else:
             if file.endswith(".c") and "rdiff" not in file:
                 c_src.append(os.path.join(root, file))
 
-defined_macros = [("rsync_EXPORTS", None)]
+# a loaded signature is shared by concurrent deltas, the hashtable stats counters
+# would be written by all of them at once
+defined_macros = [("rsync_EXPORTS", None), ("HASHTABLE_NSTATS", None)]
 if sysconfig.get_config_var("Py_GIL_DISABLED"):
     print("build nogil")
     defined_macros.append(
@@ -1,12 +1,43 @@
 
 import sys
 sys.path.append(".")
+import asyncio
+import json
+import logging
+import pickle
+import tempfile
 from io import BytesIO
 from unittest import TestCase
 import os
 os.environ["RSYNC_USE_CFFI"] = "1"
 
-from pyrsync import delta, get_signature_args, patch, signature
+from pyrsync import (
+    RS_JOB_BLOCKSIZE,
+    RS_JOB_MAX_BLOCKSIZE,
+    RS_BLAKE2_SIG_MAGIC,
+    RS_MD4_SIG_MAGIC,
+    RS_RK_BLAKE2_SIG_MAGIC,
+    DeltaJob,
+    PatchJob,
+    Signature,
+    SignatureJob,
+    Stats,
+    delta,
+    delta_bytes,
+    delta_file,
+    flush_trace,
+    get_observer,
+    get_signature_args,
+    patch,
+    patch_bytes,
+    patch_file,
+    set_observer,
+    set_trace_level,
+    signature,
+    signature_bytes,
+    signature_file,
+    supports_trace,
+)
 
 
 class TestPatch(TestCase):
@@ -40,6 +71,956 @@ class TestPatch(TestCase):
         self.assertEqual(out.getvalue(), src.getvalue())
 
 
+    def test_signature_reuse(self):
+        s = b"aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa" * 50
+        magic, block_len, strong_len = get_signature_args(len(s))
+        sig = BytesIO()
+        signature(BytesIO(s), sig, strong_len, magic, block_len)
+        sig.seek(0, 0)
+        with Signature(sig) as loaded:
+            self.assertEqual(loaded.block_len, block_len)
+            self.assertGreater(loaded.nbytes, 0)
+            for d in (s + b"2", b"2" + s, s[:100]):
+                _delta = BytesIO()
+                delta(BytesIO(d), loaded, _delta)
+                _delta.seek(0, 0)
+                out = BytesIO()
+                patch(BytesIO(s), _delta, out)
+                self.assertEqual(out.getvalue(), d)
+        self.assertTrue(loaded.closed)
+        self.assertEqual(loaded.nbytes, 0)
+        with self.assertRaises(ValueError):
+            loaded.delta(BytesIO(s), BytesIO())
+
+        # closed during a delta: freed, and counted as such, only once the delta is done
+        loaded = Signature(sig.getvalue())
+        size = loaded.nbytes
+        seen = []
+
+        class Closing:
+            def __init__(self, data):
+                self.data = BytesIO(data)
+
+            def read(self, n):
+                if not seen:
+                    loaded.close()
+                    seen.append(loaded.nbytes)
+                return self.data.read(n)
+
+        delta(Closing(s), loaded, BytesIO())
+        self.assertTrue(loaded.closed)
+        self.assertEqual(seen, [size])
+        self.assertEqual(loaded.nbytes, 0)
+
+
+    def test_push_jobs(self):
+        s = bytes(range(256)) * 64
+        d = s[:5000] + b"inserted" + s[5000:]
+
+        def push(job, data, step=777):
+            out = b""
+            for i in range(0, len(data), step):
+                out += job.feed(data[i : i + step])
+            return out + job.finish()
+
+        magic, block_len, strong_len = get_signature_args(len(s))
+        sig = push(SignatureJob(strong_len, magic, block_len), s)
+        expected = BytesIO()
+        signature(BytesIO(s), expected, strong_len, magic, block_len)
+        self.assertEqual(sig, expected.getvalue())
+        _delta = push(DeltaJob(BytesIO(sig)), d)
+        self.assertEqual(push(PatchJob(BytesIO(s)), _delta, 13), d)
+
+
+    def test_unseekable_streams(self):
+        class Pipe:
+            # only read(), short reads like a pipe or a socket
+            def __init__(self, data):
+                self.data = data
+
+            def read(self, size=-1):
+                block, self.data = self.data[:1000], self.data[1000:]
+                return block
+
+        s = bytes(range(256)) * 500
+        d = s[:70000] + b"inserted" + s[70000:]
+        magic, block_len, strong_len = get_signature_args(len(s))
+        sig = BytesIO()
+        signature(Pipe(s), sig, strong_len, magic, block_len)
+        expected = BytesIO()
+        signature(BytesIO(s), expected, strong_len, magic, block_len)
+        self.assertEqual(sig.getvalue(), expected.getvalue())
+        _delta = BytesIO()
+        delta(Pipe(d), Pipe(sig.getvalue()), _delta)
+        out = BytesIO()
+        patch(BytesIO(s), Pipe(_delta.getvalue()), out)
+        self.assertEqual(out.getvalue(), d)
+
+
+    def test_buffer_size(self):
+        s = bytes(range(256)) * 4096
+        d = s[:300000] + b"inserted" + s[300000:]
+        magic, block_len, strong_len = get_signature_args(len(s))
+        sig = BytesIO()
+        stats = signature(BytesIO(s), sig, strong_len, magic, block_len, buffer_size=1000)
+        self.assertEqual(stats.buffer_size, 1000)
+        expected = BytesIO()
+        stats = signature(BytesIO(s), expected, strong_len, magic, block_len, adaptive=True)
+        self.assertGreaterEqual(stats.buffer_size, RS_JOB_BLOCKSIZE)
+        self.assertLessEqual(stats.buffer_size, RS_JOB_MAX_BLOCKSIZE)
+        self.assertEqual(sig.getvalue(), expected.getvalue())
+        sig.seek(0, 0)
+        _delta = BytesIO()
+        delta(BytesIO(d), sig, _delta, buffer_size=4096, adaptive=True)
+        _delta.seek(0, 0)
+        out = BytesIO()
+        stats = patch(BytesIO(s), _delta, out, buffer_size=333)
+        self.assertEqual(stats.buffer_size, 333)
+        self.assertEqual(out.getvalue(), d)
+
+
+    def test_file_api(self):
+        s = bytes(range(256)) * 500
+        d = s[:70000] + b"inserted" + s[70000:]
+        magic, block_len, strong_len = get_signature_args(len(s))
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {name: os.path.join(tmp, name) for name in ("old", "new", "sig", "delta", "out")}
+            with open(paths["old"], "wb") as f:
+                f.write(s)
+            with open(paths["new"], "wb") as f:
+                f.write(d)
+            stats = signature_file(paths["old"], paths["sig"], strong_len, magic, block_len)
+            self.assertEqual(stats.in_bytes, len(s))
+            expected = BytesIO()
+            signature(BytesIO(s), expected, strong_len, magic, block_len)
+            with open(paths["sig"], "rb") as f:
+                self.assertEqual(f.read(), expected.getvalue())
+            with open(paths["new"], "rb") as f:
+                delta_file(f.fileno(), paths["sig"], paths["delta"])
+            with open(paths["sig"], "rb") as f, Signature(f) as loaded:
+                delta_file(paths["new"], loaded, paths["out"])
+            with open(paths["delta"], "rb") as f1, open(paths["out"], "rb") as f2:
+                self.assertEqual(f1.read(), f2.read())
+            patch_file(paths["old"], paths["delta"], paths["out"])
+            with open(paths["out"], "rb") as f:
+                self.assertEqual(f.read(), d)
+
+
+    def test_mapped_basis(self):
+        s = bytes(range(256)) * 500
+        d = s[:70000] + b"inserted" + s[70000:] + s[:1000]
+        magic, block_len, strong_len = get_signature_args(len(s))
+        sig = BytesIO()
+        signature(BytesIO(s), sig, strong_len, magic, block_len)
+        sig.seek(0, 0)
+        _delta = BytesIO()
+        delta(BytesIO(d), sig, _delta)
+        with tempfile.TemporaryFile() as f:
+            f.write(s)
+            for basis in (s, bytearray(s), memoryview(s), BytesIO(s), f):
+                for use_mmap in (True, False):
+                    out = BytesIO()
+                    patch(basis, BytesIO(_delta.getvalue()), out, use_mmap=use_mmap)
+                    self.assertEqual(out.getvalue(), d)
+            job = PatchJob(f)
+            self.assertEqual(job.feed(_delta.getvalue()) + job.finish(), d)
+        with self.assertRaises(Exception):
+            patch(s[:100], BytesIO(_delta.getvalue()), BytesIO())
+
+
+    def test_bytes_api(self):
+        s = b"aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa" * 50
+        d = s + b"2"
+        for s, d in ((b"", b"new"), (b"old", b""), (s, d), (s * 200, b"1" + d * 200)):
+            sig = signature_bytes(s)
+            magic, block_len, strong_len = get_signature_args(len(s))
+            _sig = BytesIO()
+            signature(BytesIO(s), _sig, strong_len, magic, block_len)
+            self.assertEqual(sig, _sig.getvalue())
+            _delta = delta_bytes(d, sig)
+            self.assertEqual(patch_bytes(s, _delta), d)
+            with Signature(sig) as loaded:
+                self.assertEqual(delta_bytes(bytearray(d), loaded), _delta)
+            self.assertEqual(patch_bytes(memoryview(s), bytearray(_delta)), d)
+
+
+    def test_aio(self):
+        from pyrsync import aio
+
+        class Writer:
+            def __init__(self):
+                self.chunks = []
+                self.drained = 0
+
+            def write(self, data):
+                self.chunks.append(bytes(data))
+
+            async def drain(self):
+                self.drained += 1
+
+            def getvalue(self):
+                return b"".join(self.chunks)
+
+        def stream(data):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            return reader
+
+        s = bytes(range(256)) * 500
+        d = s[:70000] + b"inserted" + s[70000:]
+        magic, block_len, strong_len = get_signature_args(len(s))
+
+        async def main():
+            sig = Writer()
+            await aio.signature(stream(s), sig, strong_len, magic, block_len, buffer_size=4096)
+            self.assertEqual(sig.getvalue(), signature_bytes(s, strong_len, magic, block_len))
+            self.assertGreater(sig.drained, 0)
+            outs = []
+            for sigfile in (stream(sig.getvalue()), sig.getvalue(), BytesIO(sig.getvalue())):
+                _delta = Writer()
+                stats = await aio.delta(stream(d), sigfile, _delta, buffer_size=4096)
+                self.assertLess(stats.lit_bytes, 1000)
+                outs.append(_delta.getvalue())
+            self.assertEqual(outs[0], outs[1])
+            self.assertEqual(outs[0], outs[2])
+            # an async signature is loaded in bounded reads, not buffered whole
+            sizes = []
+            sig_stream = stream(sig.getvalue())
+            read = sig_stream.read
+
+            async def bounded_read(n=-1):
+                sizes.append(n)
+                return await read(min(n, 1000))
+
+            sig_stream.read = bounded_read
+            _delta = Writer()
+            await aio.delta(stream(d), sig_stream, _delta, buffer_size=4096)
+            self.assertEqual(_delta.getvalue(), outs[0])
+            self.assertGreater(len(sizes), 1)
+            self.assertTrue(all(n > 0 for n in sizes))
+            # several transfers at once on one loop
+            results = await asyncio.gather(*(aio.patch(s, stream(outs[0]), Writer(), 1000) for _ in range(8)))
+            self.assertEqual(len(results), 8)
+            out = Writer()
+            await aio.patch(BytesIO(s), stream(outs[0]), out)
+            self.assertEqual(out.getvalue(), d)
+
+        asyncio.run(main())
+
+
+    def test_batch(self):
+        from pyrsync.batch import delta_many, patch_many, sign_many
+
+        with tempfile.TemporaryDirectory() as tmp:
+            olds, news = [], []
+            for i in range(6):
+                s = bytes(range(256)) * (100 + i)
+                d = s[:5000] + b"changed%d" % i + s[5000:]
+                for name, data, names in (("old%d" % i, s, olds), ("new%d" % i, d, news)):
+                    path = os.path.join(tmp, name)
+                    with open(path, "wb") as f:
+                        f.write(data)
+                    names.append(path)
+            missing = os.path.join(tmp, "missing")
+            results = sign_many(olds + [missing], workers=3)
+            self.assertEqual([r.input for r in results], olds + [missing])
+            self.assertIsInstance(results[-1].error, OSError)
+            for path, result in zip(olds, results):
+                self.assertIsNone(result.error)
+                self.assertEqual(result.output, path + ".sig")
+                with open(path, "rb") as f, open(result.output, "rb") as sig:
+                    self.assertEqual(sig.read(), signature_bytes(f.read()))
+            # bytes paths are signed to bytes paths
+            results = sign_many([os.fsencode(olds[0])], suffix=".bsig")
+            self.assertIsNone(results[0].error)
+            self.assertEqual(results[0].output, os.fsencode(olds[0] + ".bsig"))
+            with open(olds[0] + ".sig", "rb") as f, open(olds[0] + ".bsig", "rb") as sig:
+                self.assertEqual(sig.read(), f.read())
+            results = delta_many([(n, o + ".sig", n + ".delta") for o, n in zip(olds, news)], workers=3)
+            self.assertTrue(all(r.error is None for r in results))
+            with open(olds[0] + ".sig", "rb") as f, Signature(f) as loaded:
+                results = delta_many([(news[0], loaded, news[0] + ".delta2")] * 4, workers=4)
+            self.assertTrue(all(r.stats.lit_bytes == results[0].stats.lit_bytes for r in results))
+            results = patch_many([(o, n + ".delta", n + ".out") for o, n in zip(olds, news)], workers=3)
+            for path, result in zip(news, results):
+                self.assertIsNone(result.error)
+                with open(path, "rb") as f, open(result.output, "rb") as out:
+                    self.assertEqual(out.read(), f.read())
+
+
+    def test_signature_parallel(self):
+        from pyrsync.parallel import signature_parallel
+
+        data = os.urandom(300000)
+        magic, block_len, strong_len = get_signature_args(len(data))
+        for s in (b"", data[:100], data):
+            expected = signature_bytes(s)
+            for chunk_size in (1, 1000, 1 << 20):
+                out = BytesIO()
+                stats = signature_parallel(s, out, workers=3, chunk_size=chunk_size)
+                self.assertEqual(out.getvalue(), expected)
+                for key in ("in_bytes", "out_bytes", "sig_blocks"):
+                    self.assertEqual(getattr(stats, key), getattr(signature_bytes(s, stats=True)[1], key))
+                out = BytesIO()
+                signature_parallel(BytesIO(s), out, strong_len, magic, block_len, workers=3, chunk_size=chunk_size)
+                self.assertEqual(out.getvalue(), signature_bytes(s, strong_len, magic, block_len))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data")
+            with open(path, "wb") as f:
+                f.write(data)
+            out = BytesIO()
+            signature_parallel(path, out, workers=4, chunk_size=4096)
+            self.assertEqual(out.getvalue(), signature_bytes(data))
+            with open(path, "rb") as f:
+                out = BytesIO()
+                signature_parallel(f, out, workers=4, chunk_size=4096)
+                self.assertEqual(out.getvalue(), signature_bytes(data))
+            # from the current position of a file object or a descriptor, as signature
+            args = get_signature_args(len(data) - 1000)
+            with open(path, "rb") as f:
+                f.seek(1000)
+                expected = BytesIO()
+                signature(f, expected, args[2], args[0], args[1])
+                self.assertEqual(f.tell(), len(data))
+                f.seek(1000)
+                out = BytesIO()
+                signature_parallel(f, out, workers=4, chunk_size=4096)
+                self.assertEqual(out.getvalue(), expected.getvalue())
+                self.assertEqual(f.tell(), len(data))
+                os.lseek(f.fileno(), 1000, os.SEEK_SET)
+                out = BytesIO()
+                signature_parallel(f.fileno(), out, workers=2, chunk_size=4096)
+                self.assertEqual(out.getvalue(), expected.getvalue())
+                self.assertEqual(os.lseek(f.fileno(), 0, os.SEEK_CUR), len(data))
+
+
+    def test_stats_snapshot(self):
+        s = bytes(range(256)) * 100
+        d = s[:1000] + b"new" + s[1000:]
+        sig, stats = signature_bytes(s, stats=True)
+        self.assertEqual(stats.op, "signature")
+        self.assertEqual(stats.in_bytes, len(s))
+        self.assertEqual(stats.out_bytes, len(sig))
+        _delta, stats = delta_bytes(d, sig, stats=True)
+        self.assertEqual(stats.in_bytes, len(d))
+        self.assertEqual(stats.lit_bytes + stats.copy_bytes, len(d))
+        self.assertGreaterEqual(stats.elapsed, 0)
+        out, stats = patch_bytes(s, _delta, stats=True)
+        self.assertEqual(stats.out_bytes, len(d))
+        # the snapshot outlives its job
+        job = SignatureJob(8, get_signature_args(len(s))[0])
+        job.feed(s)
+        job.finish()
+        stats = job.statistics()
+        del job
+        self.assertEqual(stats.in_bytes, len(s))
+        self.assertGreater(stats.elapsed, 0)
+        data = stats.as_dict()
+        self.assertEqual(data["in_bytes"], len(s))
+        self.assertEqual(json.loads(stats.to_json()), data)
+        for copy in (pickle.loads(pickle.dumps(stats)), Stats.from_dict(data)):
+            self.assertIsInstance(copy, Stats)
+            self.assertEqual(copy.as_dict(), data)
+        with self.assertRaises(AttributeError):
+            stats.extra = 1
+
+
+    def test_observer(self):
+        from pyrsync.metrics import Counters, Observer
+
+        s = bytes(range(256)) * 400
+        d = s[:5000] + b"new" + s[5000:]
+        magic, block_len, strong_len = get_signature_args(len(s))
+        counters = Counters()
+        sig = BytesIO()
+        signature(BytesIO(s), sig, strong_len, magic, block_len, buffer_size=4096, observer=counters)
+        self.assertEqual(counters.jobs, 1)
+        self.assertEqual(counters.in_bytes, len(s))
+        self.assertEqual(counters.out_bytes, len(sig.getvalue()))
+        self.assertGreater(counters.chunks, 1)
+        _delta = BytesIO()
+        stats = delta(BytesIO(d), BytesIO(sig.getvalue()), _delta, observer=counters)
+        self.assertEqual(counters.jobs, 2)
+        counters.reset()
+        with tempfile.TemporaryFile() as f:
+            f.write(s)
+            for basis, use_mmap in ((s, True), (f, False)):
+                patch(basis, BytesIO(_delta.getvalue()), BytesIO(), use_mmap=use_mmap, observer=counters)
+        self.assertEqual(counters.copy_bytes, 2 * stats.copy_bytes)
+        self.assertGreater(counters.copy_calls, 1)
+        self.assertEqual(counters.as_dict()["jobs"], 2)
+
+        events = []
+
+        class Recorder(Observer):
+            def start(self, op):
+                events.append(op)
+
+            def error(self, exc):
+                events.append(exc)
+
+            def end(self, stats):
+                events.append(stats.op)
+
+        self.assertIsNone(get_observer())
+        set_observer(Recorder())
+        try:
+            patch(s, BytesIO(_delta.getvalue()), BytesIO())
+        finally:
+            set_observer(None)
+        self.assertEqual(events, ["patch", "patch"])
+
+        # a failing job reports its error and still ends
+        events.clear()
+        counters.reset()
+        with self.assertRaises(Exception) as cm:
+            patch(s, BytesIO(b"garbage!" * 4), BytesIO(), observer=Recorder())
+        self.assertEqual(events, ["patch", cm.exception, "patch"])
+        with self.assertRaises(Exception):
+            patch(s, BytesIO(b"garbage!" * 4), BytesIO(), observer=counters)
+        self.assertEqual((counters.jobs, counters.errors), (1, 1))
+
+    def test_trace_logging(self):
+        s = bytes(range(256)) * 40
+        # the first flush routes librsync's messages to logging
+        flush_trace()
+        with self.assertLogs("pyrsync.librsync", logging.ERROR) as cm:
+            with self.assertRaises(Exception):
+                Signature(b"garbage!" * 4)
+        self.assertTrue(all(r.levelno >= logging.ERROR for r in cm.records))
+        self.assertEqual(flush_trace(), 0)
+
+        set_trace_level(logging.DEBUG)
+        try:
+            with self.assertLogs("pyrsync.librsync", logging.DEBUG) as cm:
+                sig = signature_bytes(s)
+                stats = delta(BytesIO(s), BytesIO(sig), BytesIO())
+                stats.log()
+        finally:
+            set_trace_level(logging.INFO)
+        self.assertTrue(any(r.levelno == logging.INFO for r in cm.records))
+        if supports_trace():
+            self.assertTrue(any(r.levelno == logging.DEBUG for r in cm.records))
+
+    def test_signature_cache(self):
+        from pyrsync.cache import SignatureCache
+
+        s = bytes(range(256)) * 40
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(3):
+                paths.append(os.path.join(tmp, "f%d" % i))
+                with open(paths[-1], "wb") as f:
+                    f.write(s[i:])
+            cache = SignatureCache(directory=os.path.join(tmp, "sigs"))
+            sig = cache.signature(paths[0])
+            self.assertEqual(sig, signature_bytes(s))
+            self.assertIs(cache.signature(paths[0]), sig)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            # a change of the file is a miss, so is another magic
+            with open(paths[0], "ab") as f:
+                f.write(b"more")
+            self.assertEqual(cache.signature(paths[0]), signature_bytes(s + b"more"))
+            cache.signature(paths[0], sig_magic=RS_MD4_SIG_MAGIC)
+            self.assertEqual(cache.misses, 3)
+
+            # the directory outlives the memory
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.signature(paths[0]), signature_bytes(s + b"more"))
+            self.assertEqual(cache.disk_hits, 1)
+
+            # eviction by bytes, least recently used first
+            small = SignatureCache(max_bytes=2 * len(sig))
+            for path in paths:
+                small.signature(path)
+            self.assertEqual(len(small), 2)
+            self.assertEqual(small.evictions, 1)
+            self.assertLessEqual(small.size, small.max_bytes)
+            small.signature(paths[0])
+            self.assertEqual(small.as_dict()["misses"], 4)
+
+    def test_signature_table(self):
+        from pyrsync.signatures import SignatureTable
+
+        s = bytes(range(256)) * 40
+        sig = signature_bytes(s, block_size=512)
+        table = SignatureTable.from_bytes(sig)
+        self.assertEqual((len(table), table.block_len), (20, 512))
+        self.assertEqual(table.to_bytes(), sig)
+        weak = table.weak_sums
+        self.assertEqual((weak.itemsize, len(weak)), (4, 20))
+        self.assertEqual(int.from_bytes(sig[12:16], "big"), weak[0])
+        self.assertEqual(table.strong_sums.shape, (20, table.strong_len))
+        self.assertEqual(table[1][1], sig[12 + 4 + 4 + table.strong_len : 12 + 2 * (4 + table.strong_len)])
+        weak.release()
+        self.assertEqual(patch_bytes(s, delta_bytes(s, table.to_signature())), s)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "table")
+            table.dump(path)
+            with SignatureTable.load(path) as loaded:
+                self.assertEqual(loaded.to_bytes(), sig)
+                self.assertEqual(loaded.nbytes, 20 * (4 + table.strong_len))
+        self.assertEqual(SignatureTable.loads(table.dumps())[-1], table[19])
+        with self.assertRaises(ValueError):
+            SignatureTable.from_bytes(sig[:-1])
+
+    def test_diff_signatures(self):
+        from pyrsync.signatures import SignatureTable, diff_signatures
+
+        s = bytes(range(256)) * 40
+        sig = signature_bytes(s, block_size=256)
+        diff = diff_signatures(sig, sig)
+        self.assertEqual((diff.changed, diff.unchanged), ([], [(0, 40)]))
+        self.assertEqual(diff.estimated_bytes, 0)
+
+        d = bytearray(s)
+        d[1000] ^= 1  # block 3 changed
+        d[2560:2816] = bytes(range(255, -1, -1))  # block 10 changed
+        d += b"x" * 300  # two more blocks
+        diff = diff_signatures(
+            SignatureTable.from_bytes(sig), signature_bytes(bytes(d), block_size=256)
+        )
+        self.assertEqual(diff.changed, [(3, 4), (10, 11), (40, 42)])
+        self.assertEqual(diff.unchanged, [(0, 3), (4, 10), (11, 40)])
+        self.assertEqual((diff.moved, diff.literal_blocks), (0, 4))
+        self.assertEqual(diff.estimated_bytes, 4 * 256)
+
+        # a block moved in from elsewhere is copied, not sent
+        d = bytearray(s)
+        d[0:256] = bytes(range(255, -1, -1))
+        d[256:512] = bytes(range(255, -1, -1))
+        diff = diff_signatures(signature_bytes(bytes(d), block_size=256), sig)
+        self.assertEqual(diff.changed, [(0, 2)])
+        self.assertEqual((diff.moved, diff.literal_blocks), (2, 0))
+        with self.assertRaises(ValueError):
+            diff_signatures(sig, signature_bytes(s, block_size=512))
+
+    def test_inspect_delta(self):
+        from pyrsync.deltas import COPY, DeltaParser, inspect_delta, iter_delta
+
+        s = b"".join(i.to_bytes(2, "big") for i in range(5120))
+        d = s[:5000] + b"new" * 30 + s[5000:] + bytes(300)
+        _delta, stats = delta_bytes(d, signature_bytes(s, block_size=512), stats=True)
+        table = inspect_delta(_delta)
+        self.assertEqual(table.output_size, len(d))
+        self.assertEqual((table.literal_cmds, table.copy_cmds), (stats.lit_cmds, stats.copy_cmds))
+        self.assertEqual((table.literal_bytes, table.copy_bytes), (stats.lit_bytes, stats.copy_bytes))
+        out = b"".join(
+            s[c.position : c.position + c.length]
+            if c.kind == COPY
+            else _delta[c.position : c.position + c.length]
+            for c in table
+        )
+        self.assertEqual(out, d)
+        self.assertEqual(table.basis_ranges(), [(0, 4608), (5120, 10240)])
+        self.assertEqual(table.basis_ranges(gap=512), [(0, 10240)])
+        self.assertEqual(list(iter_delta(BytesIO(_delta), buffer_size=3)), list(table))
+
+        with self.assertRaises(ValueError):
+            inspect_delta(_delta, max_output_size=len(d) - 1)
+        with self.assertRaises(ValueError):
+            inspect_delta(_delta[:-1])
+        with self.assertRaises(ValueError):
+            DeltaParser().feed(b"garbage!")
+
+    def test_patch_readahead(self):
+        from pyrsync.metrics import Counters
+
+        class Unmapped:
+            # a basis read through seek and read only, counting the reads
+            def __init__(self, data):
+                self.file = BytesIO(data)
+                self.reads = 0
+
+            def seek(self, pos):
+                self.file.seek(pos)
+
+            def read(self, n=-1):
+                self.reads += 1
+                return self.file.read(n)
+
+        s = b"".join(i.to_bytes(2, "big") for i in range(32768))
+        d = bytearray(s)
+        for i in range(0, len(d), 1500):
+            d[i] ^= 1
+        d = bytes(d) + b"tail"
+        _delta = delta_bytes(d, signature_bytes(s, block_size=256))
+        plain = Unmapped(s)
+        out = BytesIO()
+        patch(plain, BytesIO(_delta), out, use_mmap=False)
+        self.assertEqual(out.getvalue(), d)
+
+        basis = Unmapped(s)
+        counters = Counters()
+        out = BytesIO()
+        patch(basis, BytesIO(_delta), out, use_mmap=False, observer=counters, readahead=16384)
+        self.assertEqual(out.getvalue(), d)
+        self.assertEqual(counters.readahead_misses, basis.reads)
+        self.assertLess(basis.reads, plain.reads)
+        self.assertEqual(counters.readahead_hits + counters.readahead_misses, counters.copy_calls)
+        self.assertGreaterEqual(counters.readahead_bytes, len(s))
+
+        job = PatchJob(Unmapped(s), False, 16384)
+        self.assertEqual(job.feed(_delta) + job.finish(), d)
+        stats = job.basis_stats()
+        self.assertEqual(stats["hits"], counters.readahead_hits)
+        self.assertEqual(stats["copy_bytes"], counters.copy_bytes)
+
+    def test_patch_parallel(self):
+        from pyrsync.parallel import patch_parallel
+
+        s = b"".join(i.to_bytes(2, "big") for i in range(32768))
+        d = s[:3000] + b"new" * 1000 + s[3000:50000] + s[:7000] + bytes(5000)
+        _delta = delta_bytes(d, signature_bytes(s, block_size=512))
+        with tempfile.TemporaryDirectory() as tmp:
+            basis = os.path.join(tmp, "basis")
+            delta_path = os.path.join(tmp, "delta")
+            out = os.path.join(tmp, "out")
+            with open(basis, "wb") as f:
+                f.write(s)
+            with open(delta_path, "wb") as f:
+                f.write(_delta)
+            stats = patch_parallel(basis, delta_path, out, workers=4, chunk_size=4096)
+            with open(out, "rb") as f:
+                self.assertEqual(f.read(), d)
+            self.assertEqual(stats.out_bytes, len(d))
+            self.assertEqual(stats.lit_bytes + stats.copy_bytes, len(d))
+
+            # bytes in, into a larger file object which gets truncated
+            with open(out, "w+b") as f:
+                f.write(bytes(2 * len(d)))
+                patch_parallel(s, _delta, f, workers=2, chunk_size=1000)
+                f.seek(0)
+                self.assertEqual(f.read(), patch_bytes(s, _delta))
+            with self.assertRaises(ValueError):
+                patch_parallel(s[:1000], _delta, out)
+
+    def test_patch_inplace(self):
+        from pyrsync.inplace import patch_inplace, plan_inplace
+
+        blocks = [i.to_bytes(2, "big") * 256 for i in range(64)]
+        s = b"".join(blocks)
+        # swapped blocks make a cycle, the shifted tail overlaps itself
+        moved = blocks[:4] + [blocks[5], blocks[4]] + blocks[6:40]
+        d = b"".join(moved) + b"new" * 100 + b"".join(blocks[40:60])
+        _delta = delta_bytes(d, signature_bytes(s, block_size=512))
+        with tempfile.TemporaryDirectory() as tmp:
+            basis = os.path.join(tmp, "basis")
+            for memory in (1 << 20, 0):
+                with open(basis, "wb") as f:
+                    f.write(s)
+                stats = patch_inplace(basis, _delta, memory=memory)
+                with open(basis, "rb") as f:
+                    self.assertEqual(f.read(), d)
+                # only the swapped blocks, the literal and the shifted tail are written
+                self.assertEqual(stats.out_bytes, 2 * 512 + 300 + 20 * 512)
+                self.assertEqual(stats.lit_bytes + stats.copy_bytes, len(d))
+
+            # a file object, growing
+            with open(basis, "w+b") as f:
+                f.write(s[:5000])
+                patch_inplace(f, delta_bytes(s, signature_bytes(s[:5000])))
+                f.seek(0)
+                self.assertEqual(f.read(), s)
+            with open(basis, "wb") as f:
+                f.write(s[:1000])
+            with self.assertRaises(ValueError):
+                patch_inplace(basis, _delta)
+            with open(basis, "rb") as f:
+                self.assertEqual(f.read(), s[:1000])
+
+            # many small moved blocks next to a large copy: every copy is planned after
+            # those reading where it writes, unless their source was read in advance
+            from pyrsync.deltas import COPY, DeltaTable
+
+            table = DeltaTable()
+            n = 300
+            for k in range(n):
+                table.kinds.append(COPY)
+                table.offsets.append(k * 16)
+                table.lengths.append(16)
+                table.positions.append((n - 1 - k) * 16)
+            table.kinds.append(COPY)
+            table.offsets.append(n * 16)
+            table.lengths.append(1 << 20)
+            table.positions.append(n * 16 - 8)
+            order, buffered = plan_inplace(table)
+            self.assertEqual(sorted(order), list(range(n + 1)))
+            done = set()
+            for j in order:
+                lo, hi = table.offsets[j], table.offsets[j] + table.lengths[j]
+                for i in range(n + 1):
+                    source = table.positions[i]
+                    if i != j and source < hi and source + table.lengths[i] > lo:
+                        self.assertTrue(i in done or i in buffered)
+                done.add(j)
+
+    def test_sparse(self):
+        from pyrsync.sparse import data_extents, patch_sparse, signature_sparse
+
+        data = b"".join(i.to_bytes(2, "big") for i in range(10000))
+        with tempfile.TemporaryDirectory() as tmp:
+            basis = os.path.join(tmp, "basis")
+            with open(basis, "wb") as f:
+                f.truncate(1 << 20)
+                f.seek(300000)
+                f.write(data)
+            with open(basis, "rb") as f:
+                s = f.read()
+                f.seek(5000)
+                extents = data_extents(f.fileno())
+                # the offset of the caller is kept
+                self.assertEqual(os.lseek(f.fileno(), 0, os.SEEK_CUR), 5000)
+                self.assertEqual(f.read(10), s[5000:5010])
+            self.assertTrue(extents)
+            for start, stop in extents:
+                self.assertTrue(start < stop <= len(s))
+            self.assertEqual(s[300000:320000], data)
+
+            for block_size in (0, 1000, 4096):
+                magic, block_len, strong_len = get_signature_args(
+                    len(s), 0, block_size, 0
+                )
+                expected = signature_bytes(s, strong_len, magic, block_len)
+                sig = BytesIO()
+                stats = signature_sparse(basis, sig, block_size=block_size)
+                self.assertEqual(sig.getvalue(), expected)
+                self.assertEqual(stats.out_bytes, len(expected))
+                self.assertLessEqual(stats.in_bytes, len(s))
+
+            # new data in a hole, and zeros over data
+            d = bytearray(s)
+            d[600000:610000] = data[:10000]
+            d[300000:310000] = bytes(10000)
+            d += bytes(100000)
+            d = bytes(d)
+            _delta = delta_bytes(d, expected)
+            out = os.path.join(tmp, "out")
+            stats = patch_sparse(basis, _delta, out)
+            with open(out, "rb") as f:
+                self.assertEqual(f.read(), d)
+            self.assertLess(stats.out_bytes, 30000)
+            self.assertEqual(stats.lit_bytes + stats.copy_bytes, len(d))
+
+            with open(out, "w+b") as f:
+                f.write(bytes(2 * len(d)))
+                patch_sparse(BytesIO(s), BytesIO(_delta), f)
+                f.seek(0)
+                self.assertEqual(f.read(), d)
+            with self.assertRaises(ValueError):
+                patch_sparse(BytesIO(s[:1000]), _delta, out)
+
+    def test_delta_precheck(self):
+        import time
+
+        from pyrsync.deltas import delta_precheck
+
+        s = b"".join(i.to_bytes(3, "big") for i in range(500000))
+        _signature = signature_bytes(s, block_size=2048)
+
+        # unchanged: a single COPY, the input is not searched
+        out = BytesIO()
+        stats = delta_precheck(s, _signature, out, workers=2)
+        self.assertEqual(patch_bytes(s, out.getvalue()), s)
+        self.assertEqual(len(out.getvalue()), stats.out_bytes)
+        self.assertLess(stats.out_bytes, 16)
+        self.assertEqual((stats.copy_cmds, stats.lit_cmds), (1, 0))
+
+        # appended, from a file object, and with a loaded signature
+        d = s + b"appended" * 1000
+        with Signature(_signature) as loaded:
+            for input in (d, BytesIO(d)):
+                out = BytesIO()
+                stats = delta_precheck(input, _signature, out, loaded=loaded)
+                self.assertEqual(patch_bytes(s, out.getvalue()), d)
+                self.assertEqual(stats.in_bytes, len(d))
+                self.assertEqual(stats.lit_bytes + stats.copy_bytes, len(d))
+
+        # changed in the middle, at the start, or shorter
+        for d in (
+            s[:700000] + b"new" + s[700000:],
+            b"new" + s,
+            s[:1000000],
+            b"",
+        ):
+            out = BytesIO()
+            stats = delta_precheck(d, _signature, out, workers=1)
+            self.assertEqual(patch_bytes(s, out.getvalue()), d)
+            self.assertEqual(len(out.getvalue()), stats.out_bytes)
+        self.assertEqual(out.getvalue(), delta_bytes(b"", _signature))
+
+        # a loaded signature which is not sig is refused
+        with Signature(signature_bytes(s, block_size=4096)) as loaded:
+            with self.assertRaises(ValueError):
+                delta_precheck(s, _signature, BytesIO(), loaded=loaded)
+        with Signature(signature_bytes(s[:100000], block_size=2048)) as loaded:
+            with self.assertRaises(ValueError):
+                delta_precheck(s, _signature, BytesIO(), loaded=loaded)
+
+        # without a matching prefix, elapsed still covers the pre-check
+        class Slow(BytesIO):
+            def read(self, size=-1):
+                if not self.tell():
+                    time.sleep(0.05)
+                return super().read(size)
+
+        stats = delta_precheck(Slow(b"new" + s), _signature, BytesIO(), workers=1)
+        self.assertGreater(stats.copy_cmds, 0)
+        self.assertGreaterEqual(stats.elapsed, 0.05)
+
+    def test_block_tuner(self):
+        from pyrsync.tune import BlockTuner, min_strong_len
+
+        s = b"".join(i.to_bytes(3, "big") for i in range(100000))
+        # scattered small edits favour small blocks
+        d = bytearray(s)
+        for i in range(0, len(d), 3000):
+            d[i] ^= 0xFF
+        d = bytes(d)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.json")
+            tuner = BlockTuner(path)
+            self.assertEqual(tuner.recommend(".img", len(s)), get_signature_args(len(s)))
+            magic, block_len, strong_len = tuner.trial(
+                s, d, ".img", block_lens=(256, 2048, 16384)
+            )
+            self.assertEqual(block_len, 256)
+            self.assertEqual(strong_len, min_strong_len(len(s), 256))
+            # no false matches with either weak sum, RabinKarp is preferred
+            self.assertEqual(magic, RS_RK_BLAKE2_SIG_MAGIC)
+            costs = tuner.costs(".img")
+            self.assertEqual(sorted(costs), [256, 2048, 16384])
+            self.assertLess(costs[256][1], costs[16384][1])
+
+            # real transfers are recorded from their Stats, and the history is kept
+            _signature, sig_stats = signature_bytes(s, 0, 0, 16384, stats=True)
+            _, delta_stats = delta_bytes(s, _signature, stats=True)
+            tuner.record(".log", sig_stats, delta_stats)
+            reloaded = BlockTuner(path)
+            self.assertEqual(reloaded.costs(".img"), costs)
+            self.assertEqual(reloaded.recommend(".log", len(s))[1], 16384)
+            reloaded.clear(".img")
+            self.assertEqual(BlockTuner(path).costs(".img"), {})
+
+        # false matches are collisions of the weak sum: the other weak sum is recommended,
+        # with strong sums no longer than before
+        tuner = BlockTuner()
+        tuner.add(".bin", len(s), 2048, 1000, 1000, 5, magic=RS_RK_BLAKE2_SIG_MAGIC)
+        tuner.add(".bin", len(s), 2048, 1000, 1000, 0, magic=RS_BLAKE2_SIG_MAGIC)
+        self.assertEqual(
+            tuner.recommend(".bin", len(s)),
+            (RS_BLAKE2_SIG_MAGIC, 2048, min_strong_len(len(s), 2048)),
+        )
+
+    def test_execute_output_view(self):
+        s = b"".join(i.to_bytes(2, "big") for i in range(20000))
+        d = s[:10000] + b"new" * 500 + s[10000:]
+        magic, block_len, strong_len = get_signature_args(len(s))
+        _signature = signature_bytes(s, strong_len, magic, block_len)
+        _delta = delta_bytes(d, _signature)
+
+        class Checking:
+            """Copies what it gets during the call, as writers must."""
+
+            def __init__(self):
+                self.chunks = []
+
+            def write(self, data):
+                self.chunks.append(bytes(data))
+                return len(data)
+
+        class Keeping(Checking):
+            """Holds on to the views without copying them."""
+
+            def write(self, data):
+                self.chunks.append(data)
+                return len(data)
+
+        jobs = (
+            (lambda out: signature(BytesIO(s), out, strong_len, magic, block_len, 256), _signature),
+            (lambda out: delta(BytesIO(d), BytesIO(_signature), out, 256), _delta),
+            (lambda out: patch(BytesIO(s), BytesIO(_delta), out, 256), d),
+        )
+        for run, expected in jobs:
+            out = Checking()
+            run(out)
+            self.assertGreater(len(out.chunks), 1)
+            self.assertTrue(all(out.chunks))
+            self.assertEqual(b"".join(out.chunks), expected)
+            # the buffer behind the views is reused from one write to the next
+            out = Keeping()
+            run(out)
+            self.assertTrue(all(isinstance(chunk, memoryview) for chunk in out.chunks))
+            self.assertNotEqual(b"".join(bytes(chunk) for chunk in out.chunks), expected)
+
+    def test_execute_readinto_and_read(self):
+        s = b"".join(i.to_bytes(2, "big") for i in range(20000))
+        d = s[:10000] + b"new" * 500 + s[10000:]
+        magic, block_len, strong_len = get_signature_args(len(s))
+        _signature = signature_bytes(s, strong_len, magic, block_len)
+        _delta = delta_bytes(d, _signature)
+
+        class ReadInto:
+            """Only readinto, in short reads."""
+
+            def __init__(self, data):
+                self.data = BytesIO(data)
+                self.calls = 0
+
+            def readinto(self, buffer):
+                self.calls += 1
+                view = memoryview(buffer)
+                return self.data.readinto(view[: min(len(view), 1000)])
+
+        class Read:
+            """Only read, in short reads."""
+
+            def __init__(self, data):
+                self.data = BytesIO(data)
+                self.calls = 0
+
+            def read(self, size):
+                self.calls += 1
+                return self.data.read(min(size, 1000))
+
+        for reader in (ReadInto, Read):
+            self.assertFalse(hasattr(reader(b""), "read" if reader is ReadInto else "readinto"))
+            for buffer_size in (100, 4096, RS_JOB_BLOCKSIZE):
+                input = reader(s)
+                out = BytesIO()
+                signature(input, out, strong_len, magic, block_len, buffer_size)
+                self.assertGreater(input.calls, 1)
+                self.assertEqual(out.getvalue(), _signature)
+                out = BytesIO()
+                delta(reader(d), reader(_signature), out, buffer_size)
+                self.assertEqual(out.getvalue(), _delta)
+                out = BytesIO()
+                patch(BytesIO(s), reader(_delta), out, buffer_size)
+                self.assertEqual(out.getvalue(), d)
+
+    def test_signature_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        s = b"".join(i.to_bytes(3, "big") for i in range(200000))
+        magic, block_len, strong_len = get_signature_args(len(s))
+        _signature = signature_bytes(s, strong_len, magic, block_len)
+        news = [s[i * 7919 :] + s[: i * 7919] + bytes([i]) * i for i in range(16)]
+        expected = [delta_bytes(d, _signature) for d in news]
+
+        def run(d):
+            out = BytesIO()
+            loaded.delta(BytesIO(d), out)
+            return out.getvalue()
+
+        # one loaded signature shared by concurrent deltas
+        with Signature(_signature) as loaded, ThreadPoolExecutor(8) as pool:
+            self.assertEqual(list(pool.map(run, news * 4)), expected * 4)
+
+
 if __name__ == "__main__":
     import unittest
 